@@ -1,21 +1,29 @@
-from typing import Annotated
+from datetime import date
+from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import decode_access_token  # your JWT decode helper
-from app.models.user import User                   # your SQLAlchemy/Pydantic user model
-from app.services.user_service import UserService         # your service layer
+from app.cache.principal_cache import get_principal_cache
+from app.core.security import SecurityUtils
+from app.database.session import get_async_db
+from app.models.user import User
+from app.repositories.user_repository import UserRepository
+from app.schemas.filters import DateRange
+from app.services.user_service import UserService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-async def get_user_service() -> UserService:
+async def get_user_service(
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> UserService:
     """
-    Dependency that returns a UserService instance.
-    Adjust constructor args (session, repositories) to your project.
+    Dependency that returns a UserService bound to the request's async session.
     """
-    return UserService()
+    return UserService(UserRepository(db), db)
 
 
 async def get_current_user(
@@ -26,7 +34,7 @@ async def get_current_user(
     Get the currently authenticated user from the JWT access token.
     """
     try:
-        token_data = decode_access_token(token)  # should raise if invalid/expired
+        payload = SecurityUtils.verify_token(token)  # raises if invalid/expired
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -34,7 +42,10 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = await user_service.get_by_id(token_data.sub)  # or token_data.user_id/email
+    email = payload["sub"]
+    user = await get_principal_cache().get_or_load(
+        email, lambda: user_service.get_user_by_email(email)
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -66,3 +77,19 @@ def require_role(*allowed_roles: str):
         return current_user
 
     return _role_checker
+
+
+def get_date_range(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> DateRange:
+    """
+    Half-open [start, end) period from the start/end query parameters.
+    """
+    try:
+        return DateRange(start=start, end=end)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False, include_input=False),
+        )
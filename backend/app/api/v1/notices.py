@@ -0,0 +1,147 @@
+# backend/app/api/v1/notices.py
+from typing import Annotated, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, Query, Response, status, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_current_user, require_role
+from app.database.session import get_async_db
+from app.services.notice_service import NoticeService
+from app.services.notice_feed_service import NoticeFeedService, strong_etag
+from app.repositories.notice_repository import NoticeRepository
+from app.schemas.notice import NoticeCreate, NoticeResponse, NoticeFeed
+from app.core.constants import UserRole
+from app.models.user import User
+
+router = APIRouter(
+    prefix="/notices",
+    tags=["notices"],
+)
+
+NoticeStaff = Annotated[
+    User,
+    Depends(
+        require_role(
+            UserRole.ASSOCIATION_STAFF,
+            UserRole.ADMIN,
+        )
+    ),
+]
+
+
+def get_notice_service(db: AsyncSession) -> NoticeService:
+    """Helper to build NoticeService from DB session."""
+    repository = NoticeRepository(db)
+    return NoticeService(repository, db)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 specifies)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+@router.get(
+    "/feed",
+    response_model=None,
+    responses={200: {"model": NoticeFeed}, 304: {"description": "Not modified"}},
+)
+async def get_feed(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    section: Annotated[Optional[str], Query(max_length=50)] = None,
+    since: Annotated[Optional[int], Query(ge=0)] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
+):
+    """
+    Notice board for a building section (general notices only if no
+    section). Served precomputed with a strong ETag; send If-None-Match
+    for a 304, or `since` (a feed version) for only what changed.
+    """
+    service = NoticeFeedService(db)
+    if since is None:
+        feed = await service.get(section, "etag", "body")
+        etag, body = feed["etag"], feed["body"]
+    else:
+        body = await service.delta(section, since)
+        etag = strong_etag(body)
+
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.post(
+    "/",
+    response_model=NoticeResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_notice(
+    notice_data: NoticeCreate,
+    current_user: NoticeStaff,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """
+    Create a draft notice. Staff/admin only.
+    """
+    service = get_notice_service(db)
+    return await service.create_notice(current_user.id, notice_data.model_dump())
+
+
+@router.get("/{notice_id}", response_model=NoticeResponse)
+async def get_notice(
+    notice_id: UUID,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """
+    Get a notice by id.
+    """
+    notice = await get_notice_service(db).read(notice_id)
+    if not notice:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Notice not found",
+        )
+    return notice
+
+
+@router.post("/{notice_id}/publish", response_model=NoticeResponse)
+async def publish_notice(
+    notice_id: UUID,
+    current_user: NoticeStaff,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """
+    Publish a draft notice. Staff/admin only.
+    """
+    notice = await get_notice_service(db).publish(notice_id)
+    if not notice:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Draft notice not found",
+        )
+    return notice
+
+
+@router.post("/{notice_id}/archive", response_model=NoticeResponse)
+async def archive_notice(
+    notice_id: UUID,
+    current_user: NoticeStaff,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """
+    Take a notice off the board. Staff/admin only.
+    """
+    notice = await get_notice_service(db).archive(notice_id)
+    if not notice:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Notice not found",
+        )
+    return notice
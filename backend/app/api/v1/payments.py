@@ -0,0 +1,234 @@
+# backend/app/api/v1/payments.py
+from typing import Annotated, Optional
+from datetime import date
+import asyncio
+import logging
+
+from fastapi import APIRouter, Depends, Header, Query, Request, status, HTTPException
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_current_user, get_date_range, require_role
+from app.database.session import get_async_db
+from app.repositories.ledger_repository import FlatBalanceRepository, LedgerEntryRepository
+from app.repositories.payment_repository import MonthlyFeeRepository, PaymentRepository
+from app.repositories.resident_repository import ResidentRepository
+from app.schemas.filters import DateRange
+from app.schemas.payment import (
+    FlatBalanceResponse,
+    LedgerEntryResponse,
+    MonthlyFeeResponse,
+    PaymentCallback,
+    PaymentResponse,
+)
+from app.schemas.pagination import Page
+from app.core.constants import PaymentStatus, UserRole
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.security import SecurityUtils
+from app.cache.callback_queue import get_callback_queue, DUPLICATE, QUEUED_SCHEDULE_DRAIN
+from app.tasks.payment_tasks import apply_payment_callbacks
+from app.models.resident import Resident
+from app.models.user import User
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/payments",
+    tags=["payments"],
+)
+
+
+async def get_own_resident(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> Resident:
+    """Resident profile of the current user (404 if there is none)."""
+    resident = await ResidentRepository(db).get_by_user(current_user.id)
+    if not resident:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resident profile not found",
+        )
+    return resident
+
+
+@router.get("/dues/me", response_model=FlatBalanceResponse)
+async def get_my_dues(
+    resident: Annotated[Resident, Depends(get_own_resident)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """
+    Outstanding balance for the current resident's flat.
+    """
+    balance = await FlatBalanceRepository(db).get_by_flat(resident.flat_id)
+    if not balance:
+        # Nothing posted yet for this flat
+        return FlatBalanceResponse(
+            flat_id=resident.flat_id, balance=0, total_billed=0, total_paid=0
+        )
+    return balance
+
+
+@router.get("/dues/me/ledger", response_model=Page[LedgerEntryResponse])
+async def get_my_ledger(
+    resident: Annotated[Resident, Depends(get_own_resident)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    """
+    Ledger postings for the current resident's flat, newest first.
+    """
+    return await LedgerEntryRepository(db).get_by_flat(resident.flat_id, cursor, limit)
+
+
+@router.get("/me", response_model=Page[PaymentResponse])
+async def get_my_payments(
+    resident: Annotated[Resident, Depends(get_own_resident)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    period: Annotated[DateRange, Depends(get_date_range)],
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    """
+    Payments made by the current resident with payment_date in [start, end).
+    """
+    return await PaymentRepository(db).get_by_resident(
+        resident.id, period.start, period.end, cursor, limit
+    )
+
+
+@router.get("/fees/me", response_model=Page[MonthlyFeeResponse])
+async def get_my_fees(
+    resident: Annotated[Resident, Depends(get_own_resident)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    period: Annotated[DateRange, Depends(get_date_range)],
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    """
+    Fees billed to the current resident's flat for months in [start, end).
+    """
+    return await MonthlyFeeRepository(db).get_by_flat(
+        resident.flat_id, period.start, period.end, cursor, limit
+    )
+
+
+@router.get("/fees/overdue", response_model=Page[MonthlyFeeResponse])
+async def list_overdue_fees(
+    current_user: Annotated[
+        User,
+        Depends(
+            require_role(
+                UserRole.ASSOCIATION_STAFF,
+                UserRole.ADMIN,
+            )
+        ),
+    ],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    as_of: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    """
+    Pending fees due before as_of (default today). Staff/admin only.
+    """
+    return await MonthlyFeeRepository(db).get_overdue(
+        as_of or date.today(), cursor, limit
+    )
+
+
+@router.get("/", response_model=Page[PaymentResponse])
+async def list_payments(
+    current_user: Annotated[
+        User,
+        Depends(
+            require_role(
+                UserRole.ASSOCIATION_STAFF,
+                UserRole.ADMIN,
+            )
+        ),
+    ],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    period: Annotated[DateRange, Depends(get_date_range)],
+    payment_status: Annotated[PaymentStatus, Query(alias="status")] = PaymentStatus.COMPLETED,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    """
+    Payments in a status with payment_date in [start, end). Staff/admin only.
+    """
+    return await PaymentRepository(db).get_by_status(
+        payment_status, period.start, period.end, cursor, limit
+    )
+
+
+@router.get("/defaulters", response_model=Page[FlatBalanceResponse])
+async def list_defaulters(
+    current_user: Annotated[
+        User,
+        Depends(
+            require_role(
+                UserRole.ASSOCIATION_STAFF,
+                UserRole.ADMIN,
+            )
+        ),
+    ],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    min_balance: Annotated[int, Query(ge=1)] = 1,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    """
+    Flats with an outstanding balance, largest first. Staff/admin only.
+    """
+    return await FlatBalanceRepository(db).get_defaulters(min_balance, cursor, limit)
+
+
+@router.post("/webhook", status_code=status.HTTP_202_ACCEPTED)
+async def payment_webhook(
+    request: Request,
+    x_signature: Annotated[Optional[str], Header()] = None,
+):
+    """
+    Gateway payment callback. Verified and queued here; a worker applies
+    queued callbacks in batches. Retries of a callback already seen are
+    acknowledged without touching the database.
+    """
+    body = await request.body()
+    if not SecurityUtils.verify_webhook_signature(
+        body,
+        x_signature,
+        settings.PAYMENT_WEBHOOK_SECRET,
+        settings.PAYMENT_WEBHOOK_TOLERANCE,
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid signature",
+        )
+    try:
+        callback = PaymentCallback.model_validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.errors(include_url=False, include_context=False),
+        )
+
+    try:
+        result = await get_callback_queue().enqueue(callback.model_dump(mode="json"))
+    except Exception as e:
+        # Not queued: make the gateway retry rather than lose the callback
+        logger.error(f"Payment callback {callback.transaction_id} not queued: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Temporarily unavailable, please retry",
+        )
+
+    if result == QUEUED_SCHEDULE_DRAIN:
+        # Celery's apply_async() does blocking broker I/O
+        await asyncio.to_thread(
+            apply_payment_callbacks.apply_async,
+            countdown=settings.PAYMENT_WEBHOOK_LINGER,
+        )
+    return {"status": "duplicate" if result == DUPLICATE else "accepted"}
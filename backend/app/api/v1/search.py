@@ -0,0 +1,50 @@
+# backend/app/api/v1/search.py
+from datetime import datetime
+from typing import Annotated, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import require_role
+from app.database.session import get_async_db
+from app.repositories.search_repository import SearchRepository
+from app.schemas.search import SearchHit
+from app.schemas.pagination import Page
+from app.core.constants import SearchType, UserRole
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.models.user import User
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"],
+)
+
+
+@router.get("/", response_model=Page[SearchHit])
+async def search(
+    current_user: Annotated[
+        User,
+        Depends(
+            require_role(
+                UserRole.ASSOCIATION_STAFF,
+                UserRole.ADMIN,
+                UserRole.SECURITY,
+            )
+        ),
+    ],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    q: Annotated[str, Query(min_length=2, max_length=100)],
+    types: Annotated[Optional[List[SearchType]], Query()] = None,
+    since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    """
+    Ranked search over tickets, notices and visitors (words, ticket
+    numbers, partial phone and vehicle numbers). Security staff only
+    search visitors.
+    """
+    types = set(types or SearchType)
+    if current_user.role == UserRole.SECURITY:
+        types &= {SearchType.VISITORS}
+    return await SearchRepository(db).search(q, types, since, cursor, limit)
@@ -1,12 +1,12 @@
 # backend/app/api/v1/tickets.py
-from typing import Annotated
+from typing import Annotated, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user, require_role
-from app.database.session import get_db
+from app.database.session import get_async_db
 from app.services.ticket_service import TicketService
 from app.repositories.ticket_repository import TicketRepository
 from app.schemas.ticket import (
@@ -15,7 +15,9 @@ from app.schemas.ticket import (
     TicketAssign,
     TicketUpdate,
 )
-from app.core.constants import UserRole
+from app.schemas.pagination import Page
+from app.core.constants import UserRole, TicketStatus
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.models.user import User
 from app.cache.decorators import cached, invalidate_cache
 from app.cache.cache_keys import CacheKeys
@@ -26,22 +28,53 @@ router = APIRouter(
 )
 
 
-def get_ticket_service(db: Session) -> TicketService:
+def get_ticket_service(db: AsyncSession) -> TicketService:
     """Helper to build TicketService from DB session."""
     repository = TicketRepository(db)
     return TicketService(repository, db)
 
 
+@cached(
+    CacheKeys.ticket_page(),
+    ttl=300,
+    response_model=Page[TicketResponse],
+    tag=CacheKeys.tickets_by_resident,
+)
+async def _resident_tickets(
+    resident_id: UUID,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
+    """A page of a resident's tickets (cached; invalidated by TicketService)."""
+    return await get_ticket_service(db).get_resident_tickets(resident_id, cursor, limit)
+
+
+@cached(
+    CacheKeys.ticket_page(),
+    ttl=300,
+    response_model=Page[TicketResponse],
+    tag=CacheKeys.tickets_by_status,
+)
+async def _status_tickets(
+    ticket_status: TicketStatus,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
+    """A page of tickets in a status (cached; invalidated by TicketService)."""
+    return await get_ticket_service(db).get_tickets_by_status(ticket_status, cursor, limit)
+
+
 @router.post(
     "/",
     response_model=TicketResponse,
     status_code=status.HTTP_201_CREATED,
 )
-@invalidate_cache(CacheKeys.open_tickets())
 async def create_ticket(
     ticket_data: TicketCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """
     Create maintenance ticket. Only residents can create.
@@ -55,7 +88,7 @@ async def create_ticket(
     from app.repositories.resident_repository import ResidentRepository
 
     resident_repo = ResidentRepository(db)
-    resident = resident_repo.get_by_user(current_user.id)
+    resident = await resident_repo.get_by_user(current_user.id)
 
     if not resident:
         raise HTTPException(
@@ -65,7 +98,7 @@ async def create_ticket(
 
     service = get_ticket_service(db)
 
-    ticket = service.create_ticket(
+    ticket = await service.create_ticket(
         resident_id=resident.id,
         flat_id=resident.flat_id,
         title=ticket_data.title,
@@ -77,22 +110,57 @@ async def create_ticket(
     return ticket
 
 
+@router.get(
+    "/",
+    response_model=Page[TicketResponse],
+)
+async def list_tickets(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    ticket_status: Annotated[Optional[TicketStatus], Query(alias="status")] = None,
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    """
+    List tickets, newest first. Residents see their own tickets; staff see
+    tickets by status (open by default). Pass `next_cursor` back as `cursor`.
+    """
+    if current_user.role == UserRole.RESIDENT:
+        from app.repositories.resident_repository import ResidentRepository
+
+        resident = await ResidentRepository(db).get_by_user(current_user.id)
+        if not resident:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Resident profile not found",
+            )
+        return await _resident_tickets(resident.id, db, cursor, limit)
+
+    return await _status_tickets(ticket_status or TicketStatus.OPEN, db, cursor, limit)
+
+
 @router.get(
     "/{ticket_id}",
     response_model=TicketResponse,
 )
-@cached(CacheKeys.ticket_by_id, ttl=1800)
+@cached(
+    CacheKeys.ticket_by_id,
+    ttl=1800,
+    response_model=TicketResponse,
+    grace=60,
+    lock=True,
+)
 async def get_ticket(
     ticket_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """
     Get ticket details by ID.
     """
     service = get_ticket_service(db)
 
-    ticket = service.read(ticket_id)
+    ticket = await service.read(ticket_id)
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -106,7 +174,7 @@ async def get_ticket(
     "/{ticket_id}/assign",
     response_model=TicketResponse,
 )
-@invalidate_cache(CacheKeys.open_tickets())
+@invalidate_cache(CacheKeys.ticket_by_id)
 async def assign_ticket(
     ticket_id: UUID,
     assign_data: TicketAssign,
@@ -119,14 +187,14 @@ async def assign_ticket(
             )
         ),
     ],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """
     Assign ticket to staff. Only association staff or admins can assign.
     """
     service = get_ticket_service(db)
 
-    ticket = service.assign_ticket(
+    ticket = await service.assign_ticket(
         ticket_id=ticket_id,
         assigned_to_id=assign_data.assigned_to_id,
         estimated_cost=assign_data.estimated_cost,
@@ -150,14 +218,14 @@ async def update_ticket(
     ticket_id: UUID,
     ticket_update: TicketUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """
     Update ticket details (e.g., status, description).
     """
     service = get_ticket_service(db)
 
-    ticket = service.update(
+    ticket = await service.update(
         ticket_id,
         ticket_update.dict(exclude_unset=True),
     )
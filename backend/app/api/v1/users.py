@@ -1,12 +1,12 @@
 # backend/app/api/v1/users.py
 from datetime import timedelta
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, status, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user
-from app.database.session import get_db
+from app.api.dependencies import get_current_user, require_role
+from app.database.session import get_async_db
 from app.services.user_service import UserService
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import (
@@ -16,6 +16,9 @@ from app.schemas.user import (
     TokenResponse,
     UserUpdate,  # make sure this schema exists
 )
+from app.schemas.pagination import Page
+from app.core.constants import UserRole
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 from app.core.security import SecurityUtils
 from app.core.exceptions import InvalidCredentials
 from app.models.user import User
@@ -27,7 +30,7 @@ router = APIRouter(
 )
 
 
-def get_user_service(db: Session) -> UserService:
+def get_user_service(db: AsyncSession) -> UserService:
     """Helper to build UserService from DB session."""
     repository = UserRepository(db)
     return UserService(repository, db)
@@ -40,14 +43,14 @@ def get_user_service(db: Session) -> UserService:
 )
 async def register_user(
     user_data: UserRegister,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """
     Register a new user.
     """
     service = get_user_service(db)
 
-    user = service.register_user(
+    user = await service.register_user(
         email=user_data.email,
         username=user_data.username,
         full_name=user_data.full_name,
@@ -62,7 +65,7 @@ async def register_user(
 @router.post("/login", response_model=TokenResponse)
 async def login(
     credentials: UserLogin,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """
     Login user and return access token.
@@ -70,7 +73,7 @@ async def login(
     service = get_user_service(db)
 
     try:
-        user = service.authenticate_user(
+        user = await service.authenticate_user(
             credentials.email,
             credentials.password,
         )
@@ -110,16 +113,31 @@ async def get_current_user_info(
 async def update_user(
     user_update: UserUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
     """
     Update the current authenticated user.
     """
     service = get_user_service(db)
 
-    updated_user = service.update(
+    updated_user = await service.update(
         current_user.id,
         user_update.dict(exclude_unset=True),
     )
 
     return updated_user
+
+
+@router.get("/", response_model=Page[UserResponse])
+async def list_active_users(
+    current_user: Annotated[User, Depends(require_role(UserRole.ADMIN))],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    cursor: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+):
+    """
+    List active users, newest first. Admin only.
+    """
+    service = get_user_service(db)
+
+    return await service.get_active_users(cursor, limit)
@@ -0,0 +1,165 @@
+# backend/app/api/v1/visitors.py
+from typing import Annotated, Optional
+from uuid import UUID
+import json
+
+from fastapi import APIRouter, Depends, Request, status, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import require_role
+from app.database.session import get_async_db
+from app.services.visitor_service import VisitorService
+from app.repositories.visitor_repository import VisitorLogRepository
+from app.schemas.visitor import (
+    VisitorLogCreate,
+    VisitorLogResponse,
+    VisitorCheckOut,
+    VisitorSyncRequest,
+    VisitorSyncResponse,
+    VisitorCount,
+    VisitorsInsideResponse,
+)
+from app.cache.visitor_presence import get_visitor_presence
+from app.core.constants import UserRole
+from app.models.user import User
+from app.config import settings
+
+router = APIRouter(
+    prefix="/visitors",
+    tags=["visitors"],
+)
+
+GateStaff = Annotated[
+    User,
+    Depends(
+        require_role(
+            UserRole.SECURITY,
+            UserRole.ADMIN,
+        )
+    ),
+]
+
+
+def get_visitor_service(db: AsyncSession) -> VisitorService:
+    """Helper to build VisitorService from DB session."""
+    repository = VisitorLogRepository(db)
+    return VisitorService(repository, db)
+
+
+@router.post(
+    "/check-in",
+    response_model=VisitorLogResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def check_in(
+    visitor_data: VisitorLogCreate,
+    current_user: GateStaff,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """
+    Log a visitor's entry and issue the pass code used at exit.
+    """
+    service = get_visitor_service(db)
+    return await service.check_in(current_user.id, visitor_data.model_dump())
+
+
+@router.post("/check-out", response_model=VisitorLogResponse)
+async def check_out(
+    exit_data: VisitorCheckOut,
+    current_user: GateStaff,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """
+    Close the visit for a pass code.
+    """
+    service = get_visitor_service(db)
+    visit = await service.check_out(exit_data.pass_code, exit_data.notes)
+    if not visit:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No open visit for this pass code",
+        )
+    return visit
+
+
+@router.post("/sync", response_model=VisitorSyncResponse)
+async def sync_offline(
+    batch: VisitorSyncRequest,
+    current_user: GateStaff,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    """
+    Upload entries and exits a gate device recorded while offline.
+    Safe to retry: entries already synced are counted as duplicates.
+    """
+    service = get_visitor_service(db)
+    return await service.sync(
+        current_user.id,
+        [entry.model_dump() for entry in batch.entries],
+        [exit.model_dump() for exit in batch.exits],
+    )
+
+
+@router.get("/inside", response_model=VisitorsInsideResponse)
+async def list_inside(
+    current_user: GateStaff,
+    flat_id: Optional[UUID] = None,
+):
+    """
+    Visitors currently on the premises (or at one flat), from the
+    presence index.
+    """
+    visitors = await get_visitor_presence().visitors(flat_id)
+    return {"inside": len(visitors), "flat_id": flat_id, "visitors": visitors}
+
+
+@router.get("/inside/count", response_model=VisitorCount)
+async def count_inside(
+    current_user: GateStaff,
+    flat_id: Optional[UUID] = None,
+):
+    """
+    Headcount of visitors on the premises (or at one flat).
+    """
+    return {"inside": await get_visitor_presence().count(flat_id), "flat_id": flat_id}
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.get("/inside/stream")
+async def stream_inside(
+    request: Request,
+    current_user: GateStaff,
+):
+    """
+    Server-sent events for the security dashboard: a snapshot of everyone
+    inside, then check_in / check_out / rebuild events carrying the new
+    headcount.
+    """
+    presence = get_visitor_presence()
+
+    async def events():
+        updates = presence.events(settings.VISITOR_PRESENCE_HEARTBEAT)
+        try:
+            # Subscribed first, so nothing between snapshot and stream is lost
+            await anext(updates)
+            visitors = await presence.visitors()
+            yield _sse("snapshot", {"inside": len(visitors), "visitors": visitors})
+            async for update in updates:
+                if await request.is_disconnected():
+                    break
+                if update is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield _sse(update["event"], update)
+        finally:
+            await updates.aclose()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
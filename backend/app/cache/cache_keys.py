@@ -2,7 +2,34 @@
 from uuid import UUID
 
 class CacheKeys:
-    """Cache key constants"""
+    """Cache key constants.
+
+    Plural keys (``tickets:status:{status}``, ``tickets:resident:{id}``, ...) name key
+    families (tags). Members of a family live under a generation number, so
+    invalidating the whole family is a single INCR of its generation key.
+    """
+    
+    @staticmethod
+    def family(key: str) -> str:
+        """Key family used for per-family cache statistics"""
+        return key.split(":", 1)[0]
+    
+    @staticmethod
+    def invalidation_channel() -> str:
+        return "cache:invalidate"
+    
+    @staticmethod
+    def lock(key: str) -> str:
+        return f"lock:{key}"
+    
+    # Tag generations
+    @staticmethod
+    def generation(tag: str) -> str:
+        return f"gen:{tag}"
+    
+    @staticmethod
+    def versioned(tag: str, generation: int, suffix: str) -> str:
+        return f"{tag}:g{generation}:{suffix}"
     
     # User cache
     @staticmethod
@@ -13,9 +40,13 @@ class CacheKeys:
     def user_by_email(email: str) -> str:
         return f"user:email:{email}"
     
+    @staticmethod
+    def principal(subject: str) -> str:
+        return f"principal:{subject}"
+    
     @staticmethod
     def active_users() -> str:
-        return "users:active:*"
+        return "users:active"
     
     # Resident cache
     @staticmethod
@@ -28,7 +59,7 @@ class CacheKeys:
     
     @staticmethod
     def pending_approvals() -> str:
-        return "residents:pending:*"
+        return "residents:pending"
     
     # Ticket cache
     @staticmethod
@@ -37,11 +68,15 @@ class CacheKeys:
     
     @staticmethod
     def tickets_by_resident(resident_id: UUID) -> str:
-        return f"tickets:resident:{resident_id}:*"
+        return f"tickets:resident:{resident_id}"
+    
+    @staticmethod
+    def tickets_by_status(ticket_status) -> str:
+        return f"tickets:status:{getattr(ticket_status, 'value', ticket_status)}"
     
     @staticmethod
-    def open_tickets() -> str:
-        return "tickets:open:*"
+    def ticket_page() -> str:
+        return "tickets:page"
     
     # Notice cache
     @staticmethod
@@ -50,7 +85,15 @@ class CacheKeys:
     
     @staticmethod
     def published_notices() -> str:
-        return "notices:published:*"
+        return "notices:published"
+    
+    @staticmethod
+    def notice_feed(section: str) -> str:
+        return f"notices:published:section:{section or '-'}"
+    
+    @staticmethod
+    def notice_feed_sections() -> str:
+        return "notices:published:sections"
     
     # Payment cache
     @staticmethod
@@ -59,4 +102,56 @@ class CacheKeys:
     
     @staticmethod
     def resident_fees(resident_id: UUID) -> str:
-        return f"fees:resident:{resident_id}:*"
+        return f"fees:resident:{resident_id}"
+    
+    # Payment gateway webhooks
+    @staticmethod
+    def payment_callback_seen(transaction_id: str, status: str) -> str:
+        return f"payment:webhook:seen:{transaction_id}:{status}"
+    
+    @staticmethod
+    def payment_callback_queue() -> str:
+        return "payment:webhook:queue"
+    
+    @staticmethod
+    def payment_callback_drain() -> str:
+        return "payment:webhook:drain"
+    
+    @staticmethod
+    def payment_callback_failures() -> str:
+        return "payment:webhook:failures"
+    
+    @staticmethod
+    def payment_callback_dead() -> str:
+        return "payment:webhook:dead"
+    
+    # Visitors on the premises
+    @staticmethod
+    def visitors_inside() -> str:
+        return "visitors:inside"
+    
+    @staticmethod
+    def visitors_inside_flat(flat_id) -> str:
+        return f"visitors:inside:flat:{flat_id}"
+    
+    @staticmethod
+    def visitors_inside_changes() -> str:
+        return "visitors:inside:changes"
+    
+    @staticmethod
+    def visitor_presence_channel() -> str:
+        return "visitors:presence"
+    
+    # Event consumers
+    @staticmethod
+    def event_processed(queue: str, event_id: str) -> str:
+        return f"event:processed:{queue}:{event_id}"
+    
+    @staticmethod
+    def event_failures(queue: str, event_id: str) -> str:
+        return f"event:failures:{queue}:{event_id}"
+    
+    # Background job progress
+    @staticmethod
+    def task_progress(run_id: str) -> str:
+        return f"task:progress:{run_id}"
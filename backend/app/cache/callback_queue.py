@@ -0,0 +1,101 @@
+# backend/app/cache/callback_queue.py
+from typing import List, Optional, Tuple
+from app.cache.redis_cache import get_cache
+from app.cache.cache_keys import CacheKeys
+from app.config import settings
+import json
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+# Dedup and enqueue atomically: a callback is either queued and marked seen,
+# or neither. Returns 0 for a duplicate, 1 if queued, 2 if queued and no
+# drain is pending yet (the caller should schedule one).
+_ENQUEUE_SCRIPT = """
+if not redis.call("set", KEYS[1], "1", "NX", "EX", ARGV[1]) then
+    return 0
+end
+redis.call("rpush", KEYS[2], ARGV[2])
+if redis.call("set", KEYS[3], "1", "NX", "EX", ARGV[3]) then
+    return 2
+end
+return 1
+"""
+
+DUPLICATE, QUEUED, QUEUED_SCHEDULE_DRAIN = 0, 1, 2
+
+class PaymentCallbackQueue:
+    """Redis list buffering verified gateway callbacks for batch apply.
+
+    The API only does one Redis round-trip per callback: a SET NX on
+    (transaction_id, status) drops gateway retries before they reach the
+    database. A single drainer reads from the head, applies a batch, and
+    trims it only after the batch committed, so a crash mid-batch means
+    re-applying (idempotent), never losing callbacks. Callbacks that can't
+    be applied at all are moved to a dead-letter list for inspection.
+    """
+
+    async def enqueue(self, callback: dict) -> int:
+        """Queue a callback unless already seen; raises if Redis is down"""
+        drain_ttl = max(1, math.ceil(settings.PAYMENT_WEBHOOK_LINGER)) + 1
+        return int(await get_cache().async_client.eval(
+            _ENQUEUE_SCRIPT,
+            3,
+            CacheKeys.payment_callback_seen(callback["transaction_id"], callback["status"]),
+            CacheKeys.payment_callback_queue(),
+            CacheKeys.payment_callback_drain(),
+            settings.PAYMENT_WEBHOOK_DEDUP_TTL,
+            json.dumps(callback),
+            drain_ttl
+        ))
+
+    def drain_started(self) -> None:
+        """Clear the pending-drain flag so new callbacks schedule another"""
+        get_cache().redis_client.delete(CacheKeys.payment_callback_drain())
+
+    def peek(self, count: int) -> Tuple[List[dict], int]:
+        """Oldest callbacks (up to count) and how many entries to ack()"""
+        raw = get_cache().redis_client.lrange(CacheKeys.payment_callback_queue(), 0, count - 1)
+        callbacks = []
+        for item in raw:
+            try:
+                callbacks.append(json.loads(item))
+            except ValueError:
+                logger.error(f"Dropping malformed payment callback: {item!r}")
+        return callbacks, len(raw)
+
+    def ack(self, count: int) -> None:
+        """Remove the count oldest callbacks (after they were applied)"""
+        get_cache().redis_client.ltrim(CacheKeys.payment_callback_queue(), count, -1)
+
+    def record_failure(self) -> int:
+        """Count a failed apply of the head batch; returns the count so far"""
+        key = CacheKeys.payment_callback_failures()
+        pipe = get_cache().redis_client.pipeline()
+        pipe.incr(key)
+        pipe.expire(key, 24 * 3600)
+        return int(pipe.execute()[0])
+
+    def clear_failures(self) -> None:
+        get_cache().redis_client.delete(CacheKeys.payment_callback_failures())
+
+    def dead_letter(self, callbacks: List[dict]) -> None:
+        """Park callbacks that failed on their own (kept until handled)"""
+        if callbacks:
+            get_cache().redis_client.rpush(
+                CacheKeys.payment_callback_dead(), *(json.dumps(cb) for cb in callbacks)
+            )
+
+    def depth(self) -> int:
+        return get_cache().redis_client.llen(CacheKeys.payment_callback_queue())
+
+# Global queue instance
+callback_queue: Optional[PaymentCallbackQueue] = None
+
+def get_callback_queue() -> PaymentCallbackQueue:
+    """Get payment callback queue instance"""
+    global callback_queue
+    if callback_queue is None:
+        callback_queue = PaymentCallbackQueue()
+    return callback_queue
@@ -1,52 +1,315 @@
 # backend/app/cache/decorators.py
 from functools import wraps
+from typing import Annotated, Any, Optional, get_args, get_origin
+from fastapi import params
+from pydantic import TypeAdapter
 from app.cache.redis_cache import get_cache
 from app.cache.cache_keys import CacheKeys
+from app.cache.stampede import CacheEnvelope, single_flight
+import asyncio
+import hashlib
+import inspect
 import logging
 import json
+import time
 
 logger = logging.getLogger(__name__)
 
-def cached(key_func, ttl: int = 3600):
-    """Decorator for caching function results"""
+# Returned by a non-blocking refresh that lost the cross-process lock
+_SKIPPED = object()
+_LOCK_POLL_INTERVAL = 0.05
+
+def _is_dependency(param: inspect.Parameter) -> bool:
+    """True for parameters FastAPI injects (Depends / Annotated[..., Depends])"""
+    if isinstance(param.default, params.Depends):
+        return True
+    if get_origin(param.annotation) is Annotated:
+        return any(
+            isinstance(meta, params.Depends)
+            for meta in get_args(param.annotation)[1:]
+        )
+    return False
+
+class _KeyBuilder:
+    """Builds cache keys from a function's bound, non-dependency arguments"""
+
+    def __init__(self, func, key_func, literal: bool = False):
+        self.signature = inspect.signature(func)
+        self.key_func = key_func
+        # Literal keys (tag names) are used verbatim, without an argument digest
+        self.literal = literal
+        self.key_params = [
+            name for name, param in self.signature.parameters.items()
+            if not _is_dependency(param)
+        ]
+        if callable(key_func):
+            self.key_func_params = list(inspect.signature(key_func).parameters)
+            # Matched by name only: a positional fallback would silently key
+            # on the wrong argument if either signature were reordered
+            missing = [name for name in self.key_func_params if name not in self.key_params]
+            if missing:
+                raise TypeError(
+                    f"{key_func.__qualname__} needs {', '.join(missing)}, which "
+                    f"{func.__qualname__} doesn't take (dependencies are left out)"
+                )
+
+    def arguments(self, args, kwargs) -> dict:
+        bound = self.signature.bind_partial(*args, **kwargs)
+        bound.apply_defaults()
+        return {
+            name: bound.arguments[name]
+            for name in self.key_params
+            if name in bound.arguments
+        }
+
+    def build(self, args, kwargs) -> str:
+        arguments = self.arguments(args, kwargs)
+
+        if callable(self.key_func):
+            return self.key_func(
+                **{name: arguments[name] for name in self.key_func_params}
+            )
+
+        if self.literal or not arguments:
+            return self.key_func
+        digest = hashlib.sha1(
+            json.dumps(arguments, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        return f"{self.key_func}:{digest}"
+
+class _Serializer:
+    """Round-trips results through the response schema (handles ORM objects)"""
+
+    def __init__(self, response_model):
+        self.adapter = TypeAdapter(response_model) if response_model else None
+
+    def dump(self, value: Any) -> Any:
+        if self.adapter is None:
+            return value
+        validated = self.adapter.validate_python(value, from_attributes=True)
+        return self.adapter.dump_python(validated, mode="json")
+
+    def load(self, value: Any) -> Any:
+        if self.adapter is None:
+            return value
+        return self.adapter.validate_python(value)
+
+def cached(
+    key_func,
+    ttl: int = 3600,
+    response_model: Optional[Any] = None,
+    tag=None,
+    grace: int = 0,
+    early_refresh_beta: float = 1.0,
+    lock: bool = False,
+    lock_ttl: int = 10
+):
+    """Decorator for caching function results.
+
+    Works on sync and async functions. The key is built from the bound
+    arguments, leaving out FastAPI dependencies (current user, DB session).
+    Pass ``response_model`` (e.g. ``TicketResponse``) to cache ORM results,
+    and ``tag`` (a CacheKeys family) to make the entry invalidatable through
+    ``invalidate_tags``.
+
+    Stampede protection (async functions): concurrent misses in a process
+    share one computation; ``lock=True`` adds a Redis lock so only one
+    process recomputes; entries are refreshed early with probability
+    governed by ``early_refresh_beta`` (0 disables); and for ``grace``
+    seconds after expiry the stale value is served to everyone except the
+    single caller that refreshes it.
+    """
     def decorator(func):
+        keys = _KeyBuilder(func, key_func)
+        tags = _KeyBuilder(func, tag, literal=True) if tag is not None else None
+        serializer = _Serializer(response_model)
+
+        if inspect.iscoroutinefunction(func):
+            async def resolve_key(cache, args, kwargs) -> str:
+                cache_key = keys.build(args, kwargs)
+                if tags is not None:
+                    family = tags.build(args, kwargs)
+                    generation = await cache.aget_generation(family)
+                    cache_key = CacheKeys.versioned(family, generation, cache_key)
+                return cache_key
+
+            async def wait_for_fill(cache, cache_key):
+                # Another process holds the lock; give it a chance to fill
+                deadline = time.monotonic() + lock_ttl
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(_LOCK_POLL_INTERVAL)
+                    envelope = CacheEnvelope.unwrap(await cache.aget(cache_key))
+                    if envelope is not None:
+                        return envelope["value"]
+                return None
+
+            async def refresh(cache, cache_key, args, kwargs, blocking: bool):
+                async def compute():
+                    token = None
+                    if lock:
+                        token = await cache.aacquire_lock(cache_key, lock_ttl * 1000)
+                        if token is None:
+                            if not blocking:
+                                return _SKIPPED
+                            value = await wait_for_fill(cache, cache_key)
+                            if value is not None:
+                                return value
+                    try:
+                        started = time.perf_counter()
+                        result = await func(*args, **kwargs)
+                        delta = time.perf_counter() - started
+                        if result is None:
+                            return None
+                        value = serializer.dump(result)
+                        await cache.aset(
+                            cache_key,
+                            CacheEnvelope.wrap(value, ttl, delta),
+                            ttl + grace
+                        )
+                        logger.debug(f"Cache SET: {cache_key}")
+                        return value
+                    finally:
+                        if token is not None:
+                            await cache.arelease_lock(cache_key, token)
+
+                return await single_flight.run(cache_key, compute)
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache = get_cache()
+                cache_key = await resolve_key(cache, args, kwargs)
+
+                envelope = CacheEnvelope.unwrap(await cache.aget(cache_key))
+                if envelope is not None:
+                    stale = CacheEnvelope.is_stale(envelope)
+                    if (
+                        (stale or CacheEnvelope.should_refresh_early(envelope, early_refresh_beta))
+                        and not single_flight.in_flight(cache_key)
+                    ):
+                        value = await refresh(cache, cache_key, args, kwargs, blocking=False)
+                        if value is not _SKIPPED:
+                            return serializer.load(value) if value is not None else None
+                    logger.debug(f"Cache {'STALE' if stale else 'HIT'}: {cache_key}")
+                    return serializer.load(envelope["value"])
+
+                # Miss: join an in-flight computation or lead one
+                if single_flight.in_flight(cache_key):
+                    value = await single_flight.wait(cache_key)
+                    if value is not _SKIPPED:
+                        return serializer.load(value) if value is not None else None
+                value = await refresh(cache, cache_key, args, kwargs, blocking=True)
+                return serializer.load(value) if value is not None else None
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             cache = get_cache()
-            
-            # Generate cache key
-            if callable(key_func):
-                cache_key = key_func(*args, **kwargs)
-            else:
-                cache_key = key_func
-            
-            # Try to get from cache
-            cached_value = cache.get(cache_key)
-            if cached_value is not None:
+            cache_key = keys.build(args, kwargs)
+            if tags is not None:
+                family = tags.build(args, kwargs)
+                generation = cache.get_generation(family)
+                cache_key = CacheKeys.versioned(family, generation, cache_key)
+
+            # Try to get from cache (no coalescing for sync callers)
+            envelope = CacheEnvelope.unwrap(cache.get(cache_key))
+            if envelope is not None and not (
+                CacheEnvelope.is_stale(envelope)
+                or CacheEnvelope.should_refresh_early(envelope, early_refresh_beta)
+            ):
                 logger.debug(f"Cache HIT: {cache_key}")
-                return cached_value
-            
+                return serializer.load(envelope["value"])
+
             # Cache miss, execute function
+            started = time.perf_counter()
             result = func(*args, **kwargs)
-            
+            delta = time.perf_counter() - started
+
             # Store in cache
-            cache.set(cache_key, result, ttl)
-            logger.debug(f"Cache SET: {cache_key}")
-            
+            if result is not None:
+                cache.set(
+                    cache_key,
+                    CacheEnvelope.wrap(serializer.dump(result), ttl, delta),
+                    ttl + grace
+                )
+                logger.debug(f"Cache SET: {cache_key}")
+
+            return result
+
+        return wrapper
+    return decorator
+
+def invalidate_cache(pattern):
+    """Decorator to invalidate cache after function execution.
+
+    ``pattern`` is either a CacheKeys function that is called with the bound
+    arguments to name the exact key to drop, or a glob pattern string
+    (SCAN-based, so avoid it on hot paths; use ``invalidate_tags``).
+    """
+    def decorator(func):
+        keys = _KeyBuilder(func, pattern) if callable(pattern) else None
+
+        def _invalidate(cache, args, kwargs):
+            if keys is not None:
+                cache_key = keys.build(args, kwargs)
+                cache.delete(cache_key)
+            else:
+                cache_key = pattern
+                cache.delete_pattern(pattern)
+            logger.debug(f"Cache INVALIDATED: {cache_key}")
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                result = await func(*args, **kwargs)
+                cache = get_cache()
+                if keys is not None:
+                    cache_key = keys.build(args, kwargs)
+                    await cache.adelete(cache_key)
+                else:
+                    cache_key = pattern
+                    await cache.adelete_pattern(pattern)
+                logger.debug(f"Cache INVALIDATED: {cache_key}")
+                return result
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            _invalidate(get_cache(), args, kwargs)
             return result
-        
         return wrapper
     return decorator
 
-def invalidate_cache(pattern: str):
-    """Decorator to invalidate cache after function execution"""
+def invalidate_tags(*tag_funcs):
+    """Decorator to invalidate whole key families after function execution.
+
+    Each tag is a CacheKeys family (string or function called with the bound
+    arguments). Invalidation is one INCR per tag, independent of keyspace size.
+    """
     def decorator(func):
+        builders = [_KeyBuilder(func, tag, literal=True) for tag in tag_funcs]
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                result = await func(*args, **kwargs)
+                cache = get_cache()
+                for builder in builders:
+                    family = builder.build(args, kwargs)
+                    await cache.ainvalidate_tag(family)
+                    logger.debug(f"Cache TAG INVALIDATED: {family}")
+                return result
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
             cache = get_cache()
-            cache.delete_pattern(pattern)
-            logger.debug(f"Cache INVALIDATED: {pattern}")
+            for builder in builders:
+                family = builder.build(args, kwargs)
+                cache.invalidate_tag(family)
+                logger.debug(f"Cache TAG INVALIDATED: {family}")
             return result
         return wrapper
     return decorator
@@ -0,0 +1,97 @@
+# backend/app/cache/invalidation.py
+from typing import Optional
+from app.cache.redis_cache import get_cache, apply_invalidation
+from app.cache.local_cache import LocalCache, register_local_cache
+from app.cache.cache_keys import CacheKeys
+from app.config import settings
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+class CacheInvalidationListener:
+    """Subscribes to cache invalidations and applies them to this worker's L1s.
+
+    While the subscription is down, messages may be missed, so every L1 is
+    cleared and the shared cache's L1 is detached until we resubscribe.
+    """
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self.local = register_local_cache(LocalCache(
+            name="shared",
+            max_entries=settings.CACHE_L1_MAX_ENTRIES,
+            max_bytes=settings.CACHE_L1_MAX_BYTES,
+            default_ttl=settings.CACHE_L1_TTL
+        ))
+
+    async def start(self) -> None:
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        get_cache().disable_local_cache()
+
+    async def _run(self) -> None:
+        cache = get_cache()
+        backoff = 1
+        while True:
+            pubsub = cache.async_client.pubsub()
+            try:
+                await pubsub.subscribe(CacheKeys.invalidation_channel())
+                cache.enable_local_cache(self.local)
+                logger.info("Cache invalidation listener subscribed")
+                backoff = 1
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    self._handle(cache, message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache invalidation listener error: {e}")
+            finally:
+                # Missed messages would leave stale L1 entries behind
+                cache.disable_local_cache()
+                apply_invalidation("clear", "*")
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+    @staticmethod
+    def _handle(cache, data: str) -> None:
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            logger.warning(f"Malformed cache invalidation: {data!r}")
+            return
+        if payload.get("origin") == cache.origin:
+            return  # already applied locally
+        apply_invalidation(payload.get("op", "key"), payload.get("target", ""))
+
+# Global listener instance
+invalidation_listener: Optional[CacheInvalidationListener] = None
+
+async def start_invalidation_listener() -> None:
+    """Start the pub/sub listener (enables L1 when configured)"""
+    global invalidation_listener
+    if not settings.CACHE_L1_ENABLED:
+        return
+    if invalidation_listener is None:
+        invalidation_listener = CacheInvalidationListener()
+        await invalidation_listener.start()
+
+async def stop_invalidation_listener() -> None:
+    global invalidation_listener
+    if invalidation_listener is not None:
+        await invalidation_listener.stop()
+        invalidation_listener = None
@@ -0,0 +1,105 @@
+# backend/app/cache/local_cache.py
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from app.cache.cache_keys import CacheKeys
+import fnmatch
+import threading
+import time
+
+class LocalCache:
+    """Bounded in-process LRU/TTL cache (L1) with size accounting.
+
+    Bounded by entry count and by approximate payload bytes (the size of the
+    JSON the value was stored as). Hit/miss/eviction counters are kept per
+    CacheKeys family.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        max_bytes: int,
+        default_ttl: int
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value, or None on miss/expiry"""
+        family = CacheKeys.family(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats[family]["misses"] += 1
+                return None
+            expires_at, size, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self._stats[family]["expirations"] += 1
+                self._stats[family]["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats[family]["hits"] += 1
+            return value
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[int] = None) -> None:
+        """Store value; size is the byte size of its serialized form"""
+        if size > self.max_bytes:
+            return
+        ttl = self.default_ttl if ttl is None else min(ttl, self.default_ttl)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                evicted, _ = next(iter(self._entries.items()))
+                self._remove(evicted)
+                self._stats[CacheKeys.family(evicted)]["evictions"] += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def delete_matching(self, pattern: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "families": {k: dict(v) for k, v in self._stats.items()},
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+# Every L1 in this process; the pub/sub listener applies invalidations to all
+_local_caches: List[LocalCache] = []
+
+def register_local_cache(cache: LocalCache) -> LocalCache:
+    """Register an L1 so cross-worker invalidations reach it"""
+    _local_caches.append(cache)
+    return cache
+
+def get_local_caches() -> List[LocalCache]:
+    return list(_local_caches)
@@ -0,0 +1,63 @@
+# backend/app/cache/notice_feed.py
+from typing import List, Optional
+from app.cache.redis_cache import get_cache
+from app.cache.cache_keys import CacheKeys
+
+# Store a built feed unless a newer version is already there, so a slow
+# rebuild can't overwrite a faster one that saw a later change
+_STORE_SCRIPT = """
+local current = redis.call("hget", KEYS[1], "version")
+if current and tonumber(current) > tonumber(ARGV[1]) then
+    return 0
+end
+redis.call("hset", KEYS[1], "version", ARGV[1], "etag", ARGV[2], "body", ARGV[3],
+    "removed", ARGV[4], "complete_since", ARGV[5])
+redis.call("expire", KEYS[1], ARGV[6])
+redis.call("sadd", KEYS[2], ARGV[7])
+return 1
+"""
+
+FEED_FIELDS = ("version", "etag", "body", "removed", "complete_since")
+
+class NoticeFeedStore:
+    """Precomputed notice feeds in Redis, one hash per building section.
+
+    Each hash holds the serialized feed body and its ETag, so a full read
+    is one HMGET with nothing to serialize. The set of sections with a
+    feed lets a notice for every section refresh them all.
+    """
+
+    def __init__(self):
+        self._store = get_cache().async_client.register_script(_STORE_SCRIPT)
+
+    async def put(self, section: Optional[str], feed: dict, ttl: int) -> bool:
+        """Store a feed; False if a newer version was already stored"""
+        return bool(await self._store(
+            keys=[CacheKeys.notice_feed(section), CacheKeys.notice_feed_sections()],
+            args=[
+                feed["version"], feed["etag"], feed["body"], feed["removed"],
+                feed["complete_since"], ttl, section or "",
+            ]
+        ))
+
+    async def get(self, section: Optional[str], *fields: str) -> Optional[dict]:
+        """The requested fields of a section's feed; None if not built"""
+        fields = fields or FEED_FIELDS
+        values = await get_cache().async_client.hmget(CacheKeys.notice_feed(section), fields)
+        if values[0] is None:
+            return None
+        return dict(zip(fields, values))
+
+    async def sections(self) -> List[Optional[str]]:
+        members = await get_cache().async_client.smembers(CacheKeys.notice_feed_sections())
+        return [member or None for member in members]
+
+# Global feed store instance
+notice_feed_store: Optional[NoticeFeedStore] = None
+
+def get_notice_feed_store() -> NoticeFeedStore:
+    """Get notice feed store instance"""
+    global notice_feed_store
+    if notice_feed_store is None:
+        notice_feed_store = NoticeFeedStore()
+    return notice_feed_store
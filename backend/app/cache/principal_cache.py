@@ -0,0 +1,84 @@
+# backend/app/cache/principal_cache.py
+from typing import Awaitable, Callable, Optional
+from app.cache.redis_cache import get_cache
+from app.cache.local_cache import LocalCache, register_local_cache
+from app.cache.cache_keys import CacheKeys
+from app.config import settings
+from app.models.user import User
+from app.schemas.user import UserResponse
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+class PrincipalCache:
+    """Authenticated-principal cache keyed by JWT subject.
+
+    An in-process LRU with a short TTL sits in front of Redis. Invalidation
+    deletes the Redis entry and is broadcast to every worker's L1 over the
+    cache invalidation channel; ``local_ttl`` bounds staleness if a broadcast
+    is missed.
+    """
+
+    def __init__(self, max_size: int, local_ttl: int, redis_ttl: int):
+        self.redis_ttl = redis_ttl
+        self.local = register_local_cache(LocalCache(
+            name="principals",
+            max_entries=max_size,
+            max_bytes=max_size * 1024,
+            default_ttl=local_ttl
+        ))
+
+    async def get_or_load(
+        self,
+        subject: str,
+        loader: Callable[[], Awaitable[Optional[User]]]
+    ) -> Optional[User]:
+        """Return the principal for subject, loading it from the DB on miss"""
+        key = CacheKeys.principal(subject)
+        data = self.local.get(key)
+        if data is None:
+            data = await get_cache().aget(key)
+            if data is not None:
+                self._set_local(key, data)
+
+        if data is not None:
+            return self._to_user(data)
+
+        user = await loader()
+        if user is not None:
+            await self.set(subject, user)
+        return user
+
+    async def set(self, subject: str, user: User) -> None:
+        # Only the public profile is cached, never the password hash
+        key = CacheKeys.principal(subject)
+        data = UserResponse.model_validate(user).model_dump(mode="json")
+        await get_cache().aset(key, data, self.redis_ttl)
+        self._set_local(key, data)
+
+    async def invalidate(self, subject: str) -> None:
+        await get_cache().adelete(CacheKeys.principal(subject))
+        logger.debug(f"Principal cache INVALIDATED: {subject}")
+
+    def _set_local(self, key: str, data: dict) -> None:
+        self.local.set(key, data, size=len(json.dumps(data)))
+
+    @staticmethod
+    def _to_user(data: dict) -> User:
+        # Detached User carrying the cached profile fields
+        return User(**UserResponse.model_validate(data).model_dump())
+
+# Global principal cache instance
+principal_cache: Optional[PrincipalCache] = None
+
+def get_principal_cache() -> PrincipalCache:
+    """Get principal cache instance"""
+    global principal_cache
+    if principal_cache is None:
+        principal_cache = PrincipalCache(
+            max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+            local_ttl=settings.PRINCIPAL_CACHE_LOCAL_TTL,
+            redis_ttl=settings.PRINCIPAL_CACHE_TTL
+        )
+    return principal_cache
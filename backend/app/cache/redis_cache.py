@@ -1,24 +1,101 @@
 # backend/app/cache/redis_cache.py
 import redis
+import redis.asyncio as aioredis
 from app.config import settings
+from app.cache.cache_keys import CacheKeys
+from app.cache.local_cache import LocalCache, get_local_caches
 from typing import Optional, Any, List
 import json
 import logging
+import uuid
 
 logger = logging.getLogger(__name__)
 
+# Compare-and-delete so a lock that expired and was re-taken is left alone
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
 class RedisCache:
-    """Redis caching service"""
+    """Redis caching service (L2) with an optional in-process L1.
+
+    The L1 is only switched on by the pub/sub invalidation listener, so a
+    process never serves L1 entries it cannot be told to drop. Deletes and
+    tag bumps always broadcast invalidations when CACHE_L1_ENABLED is set,
+    including from Celery workers that have no L1 of their own; cache fills
+    don't, so a miss on one process doesn't evict the key everywhere else.
+    Generations are never kept in L1: a read racing an INCR could re-cache
+    the old one after its invalidation was applied.
+    """
     
     def __init__(self):
         self.redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self.async_client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        self.local: Optional[LocalCache] = None
+        self.origin = uuid.uuid4().hex
+        self.broadcast = settings.CACHE_L1_ENABLED
+
+    def enable_local_cache(self, local: LocalCache) -> None:
+        """Attach an L1 layer (called once the invalidation listener runs)"""
+        self.local = local
+
+    def disable_local_cache(self) -> None:
+        if self.local is not None:
+            self.local.clear()
+        self.local = None
+
+    def stats(self) -> dict:
+        """L1 statistics per CacheKeys family"""
+        return self.local.stats() if self.local is not None else {"enabled": False}
+
+    # L1 helpers
+
+    def _local_get(self, key: str) -> Optional[Any]:
+        return self.local.get(key) if self.local is not None else None
+
+    def _local_set(self, key: str, value: Any, raw: str, ttl: int) -> None:
+        if self.local is not None:
+            self.local.set(key, value, size=len(raw), ttl=ttl)
+
+    def _invalidation_message(self, op: str, target: str) -> str:
+        return json.dumps({"origin": self.origin, "op": op, "target": target})
+
+    def _publish(self, op: str, target: str) -> None:
+        apply_invalidation(op, target)
+        if self.broadcast:
+            try:
+                self.redis_client.publish(
+                    CacheKeys.invalidation_channel(),
+                    self._invalidation_message(op, target)
+                )
+            except Exception as e:
+                logger.error(f"Cache PUBLISH error: {e}")
+
+    async def _apublish(self, op: str, target: str) -> None:
+        apply_invalidation(op, target)
+        if self.broadcast:
+            try:
+                await self.async_client.publish(
+                    CacheKeys.invalidation_channel(),
+                    self._invalidation_message(op, target)
+                )
+            except Exception as e:
+                logger.error(f"Cache PUBLISH error: {e}")
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
+        value = self._local_get(key)
+        if value is not None:
+            return value
         try:
-            value = self.redis_client.get(key)
-            if value:
-                return json.loads(value)
+            raw = self.redis_client.get(key)
+            if raw:
+                value = json.loads(raw)
+                self._local_set(key, value, raw, settings.CACHE_L1_TTL)
+                return value
             return None
         except Exception as e:
             logger.error(f"Cache GET error: {e}")
@@ -27,7 +104,9 @@ class RedisCache:
     def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """Set value in cache"""
         try:
-            self.redis_client.setex(key, ttl, json.dumps(value))
+            raw = json.dumps(value)
+            self.redis_client.setex(key, ttl, raw)
+            self._local_set(key, value, raw, ttl)
             return True
         except Exception as e:
             logger.error(f"Cache SET error: {e}")
@@ -37,21 +116,55 @@ class RedisCache:
         """Delete key from cache"""
         try:
             self.redis_client.delete(key)
+            self._publish("key", key)
             return True
         except Exception as e:
             logger.error(f"Cache DELETE error: {e}")
             return False
     
-    def delete_pattern(self, pattern: str) -> int:
-        """Delete all keys matching pattern"""
+    def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Delete all keys matching pattern.
+
+        Uses incremental SCAN + UNLINK so Redis is never blocked; still
+        O(keyspace) overall, so prefer tag invalidation on hot paths.
+        """
         try:
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                return self.redis_client.delete(*keys)
-            return 0
+            deleted = 0
+            batch = []
+            for key in self.redis_client.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis_client.unlink(*batch)
+            self._publish("pattern", pattern)
+            return deleted
         except Exception as e:
             logger.error(f"Cache DELETE_PATTERN error: {e}")
             return 0
+
+    def get_generation(self, tag: str) -> int:
+        """Current generation of a key family (always read from Redis)"""
+        try:
+            return int(self.redis_client.get(CacheKeys.generation(tag)) or 0)
+        except Exception as e:
+            logger.error(f"Cache GENERATION error: {e}")
+            return 0
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Invalidate every key in a family in O(1) by bumping its generation.
+
+        Entries under the old generation are never read again and age out
+        through their own TTL.
+        """
+        try:
+            generation = self.redis_client.incr(CacheKeys.generation(tag))
+            self._publish("key", CacheKeys.generation(tag))
+            return generation
+        except Exception as e:
+            logger.error(f"Cache INVALIDATE_TAG error: {e}")
+            return 0
     
     def exists(self, key: str) -> bool:
         """Check if key exists"""
@@ -77,6 +190,128 @@ class RedisCache:
             logger.error(f"Cache TTL error: {e}")
             return -1
 
+    # Async variants for use inside request handlers
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """Get value from cache (async)"""
+        value = self._local_get(key)
+        if value is not None:
+            return value
+        try:
+            raw = await self.async_client.get(key)
+            if raw:
+                value = json.loads(raw)
+                self._local_set(key, value, raw, settings.CACHE_L1_TTL)
+                return value
+            return None
+        except Exception as e:
+            logger.error(f"Cache GET error: {e}")
+            return None
+
+    async def aset(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """Set value in cache (async)"""
+        try:
+            raw = json.dumps(value)
+            await self.async_client.setex(key, ttl, raw)
+            self._local_set(key, value, raw, ttl)
+            return True
+        except Exception as e:
+            logger.error(f"Cache SET error: {e}")
+            return False
+
+    async def aget_generation(self, tag: str) -> int:
+        """Current generation of a key family (async; always read from Redis)"""
+        try:
+            return int(await self.async_client.get(CacheKeys.generation(tag)) or 0)
+        except Exception as e:
+            logger.error(f"Cache GENERATION error: {e}")
+            return 0
+
+    async def ainvalidate_tag(self, tag: str) -> int:
+        """Bump a family's generation (async)"""
+        try:
+            generation = await self.async_client.incr(CacheKeys.generation(tag))
+            await self._apublish("key", CacheKeys.generation(tag))
+            return generation
+        except Exception as e:
+            logger.error(f"Cache INVALIDATE_TAG error: {e}")
+            return 0
+
+    async def adelete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Delete all keys matching pattern via SCAN + UNLINK (async)"""
+        try:
+            deleted = 0
+            batch = []
+            async for key in self.async_client.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self.async_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.async_client.unlink(*batch)
+            await self._apublish("pattern", pattern)
+            return deleted
+        except Exception as e:
+            logger.error(f"Cache DELETE_PATTERN error: {e}")
+            return 0
+
+    def acquire_lock(self, key: str, ttl_ms: int) -> Optional[str]:
+        """Sync variant of aacquire_lock (Celery workers)"""
+        token = uuid.uuid4().hex
+        try:
+            if self.redis_client.set(CacheKeys.lock(key), token, nx=True, px=ttl_ms):
+                return token
+            return None
+        except Exception as e:
+            logger.error(f"Cache LOCK error: {e}")
+            return None
+
+    def release_lock(self, key: str, token: str) -> None:
+        try:
+            self.redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, CacheKeys.lock(key), token)
+        except Exception as e:
+            logger.error(f"Cache UNLOCK error: {e}")
+
+    async def aacquire_lock(self, key: str, ttl_ms: int) -> Optional[str]:
+        """Try to take a short-lived cross-process lock; returns its token"""
+        token = uuid.uuid4().hex
+        try:
+            if await self.async_client.set(CacheKeys.lock(key), token, nx=True, px=ttl_ms):
+                return token
+            return None
+        except Exception as e:
+            logger.error(f"Cache LOCK error: {e}")
+            return None
+
+    async def arelease_lock(self, key: str, token: str) -> None:
+        """Release a lock only if we still own it"""
+        try:
+            await self.async_client.eval(
+                _RELEASE_LOCK_SCRIPT, 1, CacheKeys.lock(key), token
+            )
+        except Exception as e:
+            logger.error(f"Cache UNLOCK error: {e}")
+
+    async def adelete(self, key: str) -> bool:
+        """Delete key from cache (async)"""
+        try:
+            await self.async_client.delete(key)
+            await self._apublish("key", key)
+            return True
+        except Exception as e:
+            logger.error(f"Cache DELETE error: {e}")
+            return False
+
+def apply_invalidation(op: str, target: str) -> None:
+    """Drop a key (or glob pattern) from every L1 in this process"""
+    for local in get_local_caches():
+        if op == "pattern":
+            local.delete_matching(target)
+        elif op == "clear":
+            local.clear()
+        else:
+            local.delete(target)
+
 # Global cache instance
 cache_service: Optional[RedisCache] = None
 
@@ -0,0 +1,74 @@
+# backend/app/cache/stampede.py
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import math
+import random
+import time
+
+class CacheEnvelope:
+    """Cached value plus the metadata needed for early/stale refresh.
+
+    ``expires_at`` is the soft expiry; the Redis TTL is ``ttl + grace`` so a
+    stale copy stays around to be served while one caller recomputes.
+    ``delta`` is how long the last recompute took (seconds).
+    """
+
+    @staticmethod
+    def wrap(value: Any, ttl: int, delta: float) -> dict:
+        return {"value": value, "expires_at": time.time() + ttl, "delta": delta}
+
+    @staticmethod
+    def unwrap(cached: Any) -> Optional[dict]:
+        if isinstance(cached, dict) and {"value", "expires_at", "delta"} <= cached.keys():
+            return cached
+        return None
+
+    @staticmethod
+    def is_stale(envelope: dict) -> bool:
+        return time.time() >= envelope["expires_at"]
+
+    @staticmethod
+    def should_refresh_early(envelope: dict, beta: float) -> bool:
+        """Probabilistic early expiration (XFetch).
+
+        Refreshes become likelier as expiry nears and when the value is slow
+        to compute, so one caller refreshes before the herd arrives.
+        """
+        if beta <= 0:
+            return False
+        jitter = -envelope["delta"] * beta * math.log(1.0 - random.random())
+        return time.time() + jitter >= envelope["expires_at"]
+
+class SingleFlight:
+    """Coalesces concurrent computations of the same key within a process"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def wait(self, key: str) -> Any:
+        return await asyncio.shield(self._inflight[key])
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn as the leader for key; followers can ``wait`` on the result"""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Avoid "exception was never retrieved" when nobody waited
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+# Process-wide single-flight registry for @cached
+single_flight = SingleFlight()
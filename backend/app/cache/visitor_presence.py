@@ -0,0 +1,229 @@
+# backend/app/cache/visitor_presence.py
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
+from uuid import UUID
+from app.cache.redis_cache import get_cache
+from app.cache.cache_keys import CacheKeys
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Each script updates the global hash and the flat's set together and
+# publishes the change with the new totals, so subscribers never see a
+# count that disagrees with the index. Nothing is published for no-ops.
+# Every call, no-op or not, stamps the visit id with the Redis time in a
+# sorted set, which the rebuild uses to leave newer changes alone.
+_NOW_MS = """
+local function now_ms()
+    local t = redis.call("time")
+    return t[1] * 1000 + math.floor(t[2] / 1000)
+end
+"""
+
+_CHECK_IN_SCRIPT = _NOW_MS + """
+redis.call("zadd", KEYS[4], now_ms(), ARGV[1])
+if redis.call("hset", KEYS[1], ARGV[1], ARGV[2]) == 0 then
+    return redis.call("hlen", KEYS[1])
+end
+redis.call("sadd", KEYS[2], ARGV[1])
+local inside = redis.call("hlen", KEYS[1])
+redis.call("publish", KEYS[3], cjson.encode({
+    event = "check_in", visit = cjson.decode(ARGV[2]),
+    inside = inside, at_flat = redis.call("scard", KEYS[2])
+}))
+return inside
+"""
+
+_CHECK_OUT_SCRIPT = _NOW_MS + """
+redis.call("zadd", KEYS[4], now_ms(), ARGV[1])
+if redis.call("hdel", KEYS[1], ARGV[1]) == 0 then
+    return redis.call("hlen", KEYS[1])
+end
+redis.call("srem", KEYS[2], ARGV[1])
+local inside = redis.call("hlen", KEYS[1])
+redis.call("publish", KEYS[3], cjson.encode({
+    event = "check_out", id = ARGV[1], flat_id = ARGV[2],
+    inside = inside, at_flat = redis.call("scard", KEYS[2])
+}))
+return inside
+"""
+
+# Repair the index against a database snapshot (ARGV[3], a JSON array of
+# open visits) read after the Redis time ARGV[2]. Visits missing from the
+# index are added and entries missing from the snapshot removed, except
+# for ids checked in or out since the snapshot began: the snapshot may
+# predate those changes, so the index is already newer. Change stamps
+# older than ARGV[4] are trimmed.
+_REBUILD_SCRIPT = """
+local snapshot = tonumber(ARGV[2])
+local function changed_since_snapshot(id)
+    local stamp = redis.call("zscore", KEYS[3], id)
+    return stamp and tonumber(stamp) >= snapshot
+end
+local open, added, removed = {}, 0, 0
+for _, visit in ipairs(cjson.decode(ARGV[3])) do
+    open[visit.id] = true
+    if not changed_since_snapshot(visit.id)
+        and redis.call("hsetnx", KEYS[1], visit.id, cjson.encode(visit)) == 1 then
+        redis.call("sadd", ARGV[1] .. visit.flat_id, visit.id)
+        added = added + 1
+    end
+end
+local entries = redis.call("hgetall", KEYS[1])
+for i = 1, #entries, 2 do
+    local id = entries[i]
+    if not open[id] and not changed_since_snapshot(id) then
+        redis.call("hdel", KEYS[1], id)
+        redis.call("srem", ARGV[1] .. cjson.decode(entries[i + 1]).flat_id, id)
+        removed = removed + 1
+    end
+end
+redis.call("zremrangebyscore", KEYS[3], "-inf", "(" .. ARGV[4])
+local inside = redis.call("hlen", KEYS[1])
+if added + removed > 0 then
+    redis.call("publish", KEYS[2], cjson.encode({event = "rebuild", inside = inside}))
+end
+return {inside, added, removed}
+"""
+
+# Change stamps are kept this long, so a rebuild that started earlier
+# than another one's trim still sees every change after its snapshot
+CHANGE_STAMP_RETENTION_MS = 3600 * 1000
+
+def presence_entry(visit) -> dict:
+    """What the index keeps per visitor inside (a VisitorLog or row)"""
+    return {
+        "id": str(visit.id),
+        "flat_id": str(visit.flat_id),
+        "visitor_name": visit.visitor_name,
+        "purpose": visit.purpose,
+        "vehicle_number": visit.vehicle_number,
+        "pass_code": visit.pass_code,
+        "entry_time": visit.entry_time.isoformat(),
+    }
+
+class VisitorPresence:
+    """Redis index of visitors currently on the premises.
+
+    A hash of visit id -> visitor for the whole premises plus a set of
+    visit ids per flat, so headcounts are HLEN/SCARD (O(1)) instead of
+    scanning visitor_logs for open visits. The database stays the source
+    of truth: the API updates the index after each commit, and a periodic
+    rebuild (also queued when a worker starts) repairs any update that was
+    lost without undoing changes made while it ran.
+    """
+
+    def __init__(self):
+        cache = get_cache()
+        self._check_in = cache.async_client.register_script(_CHECK_IN_SCRIPT)
+        self._check_out = cache.async_client.register_script(_CHECK_OUT_SCRIPT)
+        self._rebuild = cache.redis_client.register_script(_REBUILD_SCRIPT)
+
+    @staticmethod
+    def _keys(flat_id) -> List[str]:
+        return [
+            CacheKeys.visitors_inside(),
+            CacheKeys.visitors_inside_flat(flat_id),
+            CacheKeys.visitor_presence_channel(),
+            CacheKeys.visitors_inside_changes(),
+        ]
+
+    async def checked_in(self, visits: Iterable) -> None:
+        """Add visits to the index; failures are logged, not raised"""
+        try:
+            async with get_cache().async_client.pipeline(transaction=False) as pipe:
+                for visit in visits:
+                    entry = presence_entry(visit)
+                    await self._check_in(
+                        keys=self._keys(entry["flat_id"]),
+                        args=[entry["id"], json.dumps(entry)],
+                        client=pipe
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Visitor presence check-in update failed: {e}")
+
+    async def checked_out(self, visits: Iterable) -> None:
+        """Remove visits from the index; failures are logged, not raised"""
+        try:
+            async with get_cache().async_client.pipeline(transaction=False) as pipe:
+                for visit in visits:
+                    await self._check_out(
+                        keys=self._keys(visit.flat_id),
+                        args=[str(visit.id), str(visit.flat_id)],
+                        client=pipe
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Visitor presence check-out update failed: {e}")
+
+    def snapshot_time(self) -> int:
+        """Redis time in ms; take it before reading the open visits"""
+        seconds, micros = get_cache().redis_client.time()
+        return seconds * 1000 + micros // 1000
+
+    def rebuild(self, visits: Iterable, snapshot_ms: int) -> Tuple[int, int, int]:
+        """Repair the index from open visits read after snapshot_ms (sync; Celery).
+
+        Returns (inside, added, removed).
+        """
+        entries = [presence_entry(visit) for visit in visits]
+        inside, added, removed = self._rebuild(
+            keys=[
+                CacheKeys.visitors_inside(),
+                CacheKeys.visitor_presence_channel(),
+                CacheKeys.visitors_inside_changes(),
+            ],
+            args=[
+                CacheKeys.visitors_inside_flat(""),
+                snapshot_ms,
+                json.dumps(entries),
+                snapshot_ms - CHANGE_STAMP_RETENTION_MS,
+            ]
+        )
+        return int(inside), int(added), int(removed)
+
+    async def count(self, flat_id: Optional[UUID] = None) -> int:
+        client = get_cache().async_client
+        if flat_id is not None:
+            return await client.scard(CacheKeys.visitors_inside_flat(flat_id))
+        return await client.hlen(CacheKeys.visitors_inside())
+
+    async def visitors(self, flat_id: Optional[UUID] = None) -> List[dict]:
+        """Visitors inside (at one flat if given), oldest entry first"""
+        client = get_cache().async_client
+        if flat_id is not None:
+            ids = await client.smembers(CacheKeys.visitors_inside_flat(flat_id))
+            raw = await client.hmget(CacheKeys.visitors_inside(), list(ids)) if ids else []
+        else:
+            raw = await client.hvals(CacheKeys.visitors_inside())
+        visitors = [json.loads(item) for item in raw if item]
+        return sorted(visitors, key=lambda v: v["entry_time"])
+
+    async def events(self, heartbeat: float) -> AsyncIterator[Optional[dict]]:
+        """Index changes as they are published; None every idle heartbeat.
+
+        The first item is a None yielded once subscribed, so a snapshot
+        taken after it misses no change.
+        """
+        pubsub = get_cache().async_client.pubsub()
+        try:
+            await pubsub.subscribe(CacheKeys.visitor_presence_channel())
+            yield None
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=heartbeat
+                )
+                yield json.loads(message["data"]) if message else None
+        finally:
+            await pubsub.aclose()
+
+# Global presence index instance
+visitor_presence: Optional[VisitorPresence] = None
+
+def get_visitor_presence() -> VisitorPresence:
+    """Get visitor presence index instance"""
+    global visitor_presence
+    if visitor_presence is None:
+        visitor_presence = VisitorPresence()
+    return visitor_presence
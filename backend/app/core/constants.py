@@ -42,3 +42,24 @@ class NoticeStatus(str, Enum):
     DRAFT = "draft"
     PUBLISHED = "published"
     ARCHIVED = "archived"
+
+class LedgerEntryType(str, Enum):
+    """What a ledger posting records"""
+    FEE = "fee"
+    PENALTY = "penalty"
+    PAYMENT = "payment"
+    ADJUSTMENT = "adjustment"
+
+class LedgerAccount(str, Enum):
+    """Accounts on either side of a ledger posting"""
+    RECEIVABLE = "receivable"
+    FEE_INCOME = "fee_income"
+    PENALTY_INCOME = "penalty_income"
+    CASH = "cash"
+    ADJUSTMENTS = "adjustments"
+
+class SearchType(str, Enum):
+    """Record types covered by /search"""
+    TICKETS = "tickets"
+    NOTICES = "notices"
+    VISITORS = "visitors"
@@ -37,3 +37,10 @@ class UnauthorizedAccess(AppException):
 class InvalidData(AppException):
     def __init__(self, detail: str = "Invalid data"):
         super().__init__(detail=detail, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+class PasswordHasherBusy(AppException):
+    def __init__(self):
+        super().__init__(
+            detail="Authentication service is busy, please retry",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
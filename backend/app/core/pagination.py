@@ -0,0 +1,63 @@
+# backend/app/core/pagination.py
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+from uuid import UUID
+from app.core.exceptions import InvalidData
+import base64
+import json
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+@dataclass
+class PageResult(Generic[T]):
+    """One page of a keyset-paginated query"""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+def _encode(values: list) -> str:
+    raw = json.dumps(values)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def _decode(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+def encode_cursor(created_at: datetime, id: Any) -> str:
+    """Opaque cursor for the (created_at, id) position of the last row"""
+    return _encode([created_at.isoformat(), str(id)])
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        created_at, id = _decode(cursor)
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (ValueError, TypeError):
+        raise InvalidData("Invalid pagination cursor")
+
+def encode_amount_cursor(amount: int, id: Any) -> str:
+    """Opaque cursor for an (amount, id) position, e.g. balance ordering"""
+    return _encode([amount, str(id)])
+
+def decode_amount_cursor(cursor: str) -> Tuple[int, UUID]:
+    """Decode a cursor produced by encode_amount_cursor"""
+    try:
+        amount, id = _decode(cursor)
+        return int(amount), UUID(id)
+    except (ValueError, TypeError):
+        raise InvalidData("Invalid pagination cursor")
+
+def encode_rank_cursor(rank: float, id: Any) -> str:
+    """Opaque cursor for a (rank, id) position in ranked search results"""
+    return _encode([rank, str(id)])
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, UUID]:
+    """Decode a cursor produced by encode_rank_cursor"""
+    try:
+        rank, id = _decode(cursor)
+        return float(rank), UUID(id)
+    except (ValueError, TypeError):
+        raise InvalidData("Invalid pagination cursor")
@@ -0,0 +1,128 @@
+# backend/app/core/password_hasher.py
+from concurrent.futures import ThreadPoolExecutor
+from passlib.context import CryptContext
+from typing import Optional, Tuple
+from app.config import settings
+from app.core.exceptions import PasswordHasherBusy
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Password hashing. min/max rounds are pinned to the configured cost so that
+# verify_and_update() reports hashes made with an older cost factor.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+class PasswordHasher:
+    """Runs bcrypt hashing/verification on a bounded worker pool.
+
+    bcrypt releases the GIL, so a small thread pool keeps the event loop
+    free. Requests beyond ``max_pending`` are rejected instead of queueing
+    unboundedly behind a login storm.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="bcrypt"
+        )
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._metrics = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "rehashed": 0,
+            "queue_wait_seconds": 0.0,
+            "run_seconds": 0.0,
+        }
+
+    async def hash(self, password: str) -> str:
+        """Hash password on the worker pool"""
+        return await self._submit(pwd_context.hash, password)
+
+    async def verify_and_update(
+        self,
+        password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify password; return a new hash if the stored one is outdated"""
+        valid, new_hash = await self._submit(
+            pwd_context.verify_and_update, password, hashed_password
+        )
+        if new_hash:
+            self._incr("rehashed")
+        return valid, new_hash
+
+    async def _submit(self, fn, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._metrics["rejected"] += 1
+                logger.warning("Password hasher queue full, rejecting request")
+                raise PasswordHasherBusy()
+            self._pending += 1
+            self._metrics["submitted"] += 1
+
+        enqueued_at = time.perf_counter()
+
+        def run():
+            started_at = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                finished_at = time.perf_counter()
+                with self._lock:
+                    self._metrics["queue_wait_seconds"] += started_at - enqueued_at
+                    self._metrics["run_seconds"] += finished_at - started_at
+
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self.executor, run)
+            self._incr("completed")
+            return result
+        except Exception:
+            self._incr("failed")
+            raise
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _incr(self, name: str) -> None:
+        with self._lock:
+            self._metrics[name] += 1
+
+    def stats(self) -> dict:
+        """Snapshot of pool metrics"""
+        with self._lock:
+            return {
+                **self._metrics,
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "workers": self.executor._max_workers,
+            }
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+# Global hasher instance
+password_hasher: Optional[PasswordHasher] = None
+
+def get_password_hasher() -> PasswordHasher:
+    """Get password hasher instance"""
+    global password_hasher
+    if password_hasher is None:
+        password_hasher = PasswordHasher(
+            workers=settings.PASSWORD_HASH_WORKERS,
+            max_pending=settings.PASSWORD_HASH_MAX_PENDING
+        )
+    return password_hasher
@@ -1,21 +1,23 @@
 # backend/app/core/security.py
-from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthenticationCredentials
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.config import settings
-from app.database.session import get_db
-from sqlalchemy.orm import Session
+from app.database.session import get_async_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
+from app.core.password_hasher import pwd_context, get_password_hasher
+from app.cache.principal_cache import get_principal_cache
+import hashlib
+import hmac
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # JWT Bearer scheme
 security = HTTPBearer()
 
@@ -32,6 +34,21 @@ class SecurityUtils:
         """Verify password against hash"""
         return pwd_context.verify(plain_password, hashed_password)
 
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """Hash password on the bcrypt worker pool"""
+        return await get_password_hasher().hash(password)
+
+    @staticmethod
+    async def verify_and_update_password(
+        plain_password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify password on the worker pool, returning a rehash if needed"""
+        return await get_password_hasher().verify_and_update(
+            plain_password, hashed_password
+        )
+
     @staticmethod
     def create_access_token(
         data: dict,
@@ -79,10 +96,38 @@ class SecurityUtils:
                 detail="Invalid token"
             )
 
+    @staticmethod
+    def verify_webhook_signature(
+        body: bytes,
+        header: Optional[str],
+        secret: str,
+        tolerance: int
+    ) -> bool:
+        """Verify a ``t=<unix ts>,v1=<hex>`` HMAC-SHA256 signature header.
+
+        The MAC covers ``"<ts>.<raw body>"``; stale timestamps are rejected
+        so a captured request can't be replayed later.
+        """
+        if not header or not secret:
+            return False
+        try:
+            parts = dict(item.split("=", 1) for item in header.split(","))
+            timestamp = int(parts["t"])
+            signature = parts["v1"]
+        except (KeyError, ValueError):
+            return False
+        if abs(time.time() - timestamp) > tolerance:
+            return False
+        expected = hmac.new(
+            secret.encode(), f"{timestamp}.".encode() + body, hashlib.sha256
+        ).hexdigest()
+        # Bytes: compare_digest rejects non-ASCII str with a TypeError
+        return hmac.compare_digest(expected.encode(), signature.encode("latin-1", "ignore"))
+
 # Dependency for getting current user
 async def get_current_user(
-    credentials: HTTPAuthenticationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     """Get current authenticated user from JWT token"""
     token = credentials.credentials
@@ -96,7 +141,11 @@ async def get_current_user(
             detail="Invalid credentials"
         )
     
-    user = db.query(User).filter(User.email == email).first()
+    async def load_user():
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+
+    user = await get_principal_cache().get_or_load(email, load_user)
     
     if not user:
         raise HTTPException(
@@ -11,6 +11,9 @@ class BaseModel(Base):
     """Base model with common columns."""
     __abstract__ = True
     __allow_unmapped__ = True  # allow legacy style without Mapped[]
+    # Fetch server-generated columns (created_at, updated_at) via RETURNING
+    # on INSERT/UPDATE, so flushed objects never need a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     @declared_attr
     def created_at(cls):
@@ -40,3 +43,5 @@ from app.models.ticket import Ticket  # noqa
 from app.models.visitor import VisitorLog  # noqa
 from app.models.payment import MonthlyFee, Payment  # noqa
 from app.models.notice import Notice  # noqa
+from app.models.outbox import OutboxEvent  # noqa
+from app.models.ledger import LedgerEntry, FlatBalance  # noqa
@@ -0,0 +1,138 @@
+# backend/app/database/partitions.py
+from datetime import date
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+import gzip
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month `months` after month's (negative goes back)"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+class PartitionArchiver:
+    """Dumps a table to gzipped CSV on local disk, optionally moved to S3"""
+
+    def __init__(self, archive_dir: str, bucket: Optional[str] = None, prefix: str = ""):
+        self.archive_dir = archive_dir
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+
+    def archive(self, engine: Engine, table: str) -> str:
+        """Write table to <archive_dir>/<table>.csv.gz; returns where it went"""
+        os.makedirs(self.archive_dir, exist_ok=True)
+        path = os.path.join(self.archive_dir, f"{table}.csv.gz")
+        partial = path + ".partial"
+        with engine.connect() as conn:
+            cursor = conn.connection.dbapi_connection.cursor()
+            try:
+                # Streams rows through COPY; nothing is held in memory
+                with gzip.open(partial, "wb") as out:
+                    cursor.copy_expert(
+                        f'COPY "{table}" TO STDOUT WITH (FORMAT csv, HEADER)', out
+                    )
+            finally:
+                cursor.close()
+        os.replace(partial, path)
+
+        if not self.bucket:
+            return path
+        import boto3
+
+        key = "/".join(filter(None, [self.prefix, os.path.basename(path)]))
+        boto3.client("s3").upload_file(path, self.bucket, key)
+        os.remove(path)
+        return f"s3://{self.bucket}/{key}"
+
+class MonthlyPartitions:
+    """Monthly range partitions of one table, named <table>_yYYYYmMM.
+
+    ``ensure`` creates partitions ahead of time so inserts never miss one;
+    ``expire`` detaches partitions past retention, archives and drops them.
+    Detaching uses DETACH ... CONCURRENTLY, so gate inserts and reads on
+    the parent aren't blocked while it runs.
+    """
+
+    def __init__(self, engine: Engine, table: str):
+        self.engine = engine
+        self.table = table
+        self._name_pattern = re.compile(rf"^{re.escape(table)}_y(\d{{4}})m(\d{{2}})$")
+
+    def partition_name(self, month: date) -> str:
+        return f"{self.table}_y{month:%Y}m{month:%m}"
+
+    def month_of(self, name: str) -> Optional[date]:
+        match = self._name_pattern.match(name)
+        return date(int(match[1]), int(match[2]), 1) if match else None
+
+    def attached(self) -> List[str]:
+        """Partitions currently attached to the parent, oldest first"""
+        with self.engine.connect() as conn:
+            names = conn.execute(text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:parent AS regclass)"
+            ), {"parent": self.table}).scalars().all()
+        return sorted(n for n in names if self.month_of(n))
+
+    def orphaned(self) -> List[str]:
+        """Partition-named tables no longer attached (an interrupted expire)"""
+        with self.engine.connect() as conn:
+            names = conn.execute(text(
+                "SELECT c.relname FROM pg_class c "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relkind = 'r' AND n.nspname = current_schema() "
+                "AND NOT c.relispartition AND c.relname LIKE :prefix"
+            ), {"prefix": f"{self.table}\\_y%"}).scalars().all()
+        return sorted(n for n in names if self.month_of(n))
+
+    def ensure(self, start: date, months_ahead: int) -> List[str]:
+        """Create missing partitions from start's month through months_ahead"""
+        created = []
+        first = start.replace(day=1)
+        existing = set(self.attached())
+        with self.engine.begin() as conn:
+            for offset in range(months_ahead + 1):
+                month = add_months(first, offset)
+                name = self.partition_name(month)
+                if name in existing:
+                    continue
+                conn.execute(text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{self.table}" '
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+                ))
+                created.append(name)
+        if created:
+            logger.info(f"Created partitions: {', '.join(created)}")
+        return created
+
+    def expire(self, before: date, archiver: PartitionArchiver) -> List[str]:
+        """Detach, archive and drop partitions whose month is before `before`"""
+        expired = [n for n in self.attached() if self.month_of(n) < before]
+        # DETACH CONCURRENTLY can't run inside a transaction block
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for name in expired:
+                pending = conn.execute(text(
+                    "SELECT inhdetachpending FROM pg_inherits "
+                    "WHERE inhrelid = CAST(:name AS regclass)"
+                ), {"name": name}).scalar()
+                action = "FINALIZE" if pending else "CONCURRENTLY"
+                conn.execute(text(f'ALTER TABLE "{self.table}" DETACH PARTITION "{name}" {action}'))
+                logger.info(f"Detached partition {name}")
+
+        archived = []
+        for name in self.orphaned():
+            if self.month_of(name) >= before:
+                logger.warning(f"Leaving detached partition {name} inside retention")
+                continue
+            location = archiver.archive(self.engine, name)
+            with self.engine.begin() as conn:
+                conn.execute(text(f'DROP TABLE "{name}"'))
+            logger.info(f"Archived partition {name} to {location}")
+            archived.append(name)
+        return archived
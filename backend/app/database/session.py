@@ -2,11 +2,17 @@
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
+from sqlalchemy.ext.asyncio import (
+    create_async_engine,
+    async_sessionmaker,
+    AsyncSession,
+)
 from app.config import settings
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import contextmanager, asynccontextmanager
+from typing import Generator, AsyncGenerator
 
 # Create engine with connection pooling
+# (sync engine is kept for Celery workers, Alembic and scripts)
 engine = create_engine(
     settings.DATABASE_URL,
     poolclass=QueuePool,
@@ -23,6 +29,22 @@ SessionLocal = sessionmaker(
     expire_on_commit=False
 )
 
+# Async engine (asyncpg) used by the API so DB I/O never blocks the event loop
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    echo=settings.DEBUG
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 def get_db() -> Generator[Session, None, None]:
     """Dependency for getting DB session"""
     db = SessionLocal()
@@ -39,3 +61,14 @@ def get_db_context() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting async DB session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+@asynccontextmanager
+async def get_async_db_context() -> AsyncGenerator[AsyncSession, None]:
+    """Async context manager for DB session"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,55 @@
+# backend/app/database/unit_of_work.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic_core import to_jsonable_python
+from app.events.event_bus import BaseEvent
+from app.models.outbox import OutboxEvent
+
+class UnitOfWork:
+    """Transaction scope for a service operation.
+
+    Repositories only flush; the outermost ``async with`` commits once (or
+    rolls back on error). Nested scopes on the same session join the outer
+    one, so a service calling another service still commits once.
+
+    Domain events go through ``add_event``: they are written to the outbox
+    table in the same transaction and published later by the outbox relay,
+    so an event exists if and only if its change was committed.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._depth = 0
+
+    @classmethod
+    def for_session(cls, session: AsyncSession) -> "UnitOfWork":
+        """Return the unit of work bound to this session, creating it once"""
+        uow = session.info.get("unit_of_work")
+        if uow is None:
+            uow = session.info["unit_of_work"] = cls(session)
+        return uow
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        self._depth -= 1
+        if self._depth > 0:
+            return False
+        if exc_type is None:
+            await self.session.commit()
+        else:
+            await self.session.rollback()
+        return False
+
+    def add_event(self, event: BaseEvent) -> OutboxEvent:
+        """Record a domain event in the outbox as part of this transaction"""
+        if self._depth == 0:
+            raise RuntimeError("add_event() called outside a unit of work")
+        row = OutboxEvent(
+            id=event.event_id,
+            event_type=event.event_type.value,
+            payload=to_jsonable_python(event.to_dict())
+        )
+        self.session.add(row)
+        return row
@@ -0,0 +1,224 @@
+# backend/app/events/consumer.py
+from typing import Awaitable, Callable, Dict, Optional
+from app.config import settings
+from app.cache.redis_cache import get_cache
+from app.cache.cache_keys import CacheKeys
+from app.events.event_bus import EVENTS_EXCHANGE
+from app.events.serialization import decode
+import aio_pika
+from aio_pika.abc import AbstractIncomingMessage
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEAD_LETTER_EXCHANGE = f"{EVENTS_EXCHANGE}.dlx"
+
+# Handlers receive the decoded event envelope ({"event_type", "data", ...})
+EventHandler = Callable[[dict], Awaitable[None]]
+
+class EventConsumer:
+    """Consumes one durable queue bound to the apartment_events exchange.
+
+    ``prefetch`` bounds unacked deliveries from the broker and
+    ``concurrency`` bounds handlers running at once. Bodies are decoded by
+    ``content_type`` (msgpack or JSON). Messages are deduplicated on the
+    event id (``message_id``) with a Redis claim, so a
+    redelivered event runs its handler once per queue; a delivery whose id
+    is claimed but not yet done is requeued until the claim is marked done
+    or expires, so a consumer dying mid-handler doesn't lose the event.
+    Handler failures are counted per event id in Redis, since the broker's
+    ``redelivered`` flag is also set by deferrals and crashes: failures
+    are requeued until MAX_HANDLER_ATTEMPTS, then the message is
+    dead-lettered to ``apartment_events.dlx`` (queue ``<queue>.dead``).
+    """
+
+    # How long an in-progress claim lives if the consumer dies mid-handler
+    PROCESSING_TTL = 300
+    # Handler runs per event before it is dead-lettered
+    MAX_HANDLER_ATTEMPTS = 2
+    # Pause before requeueing a delivery whose event is still claimed
+    CLAIMED_RETRY_DELAY = 1.0
+
+    def __init__(
+        self,
+        queue_name: str = settings.EVENT_QUEUE,
+        prefetch: int = settings.EVENT_PREFETCH,
+        concurrency: int = settings.EVENT_CONCURRENCY,
+        dedup_ttl: int = settings.EVENT_DEDUP_TTL
+    ):
+        self.queue_name = queue_name
+        self.prefetch = prefetch
+        self.dedup_ttl = dedup_ttl
+        self.handlers: Dict[str, EventHandler] = {}
+        self.connection = None
+        self.channel = None
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._metrics = {"handled": 0, "duplicates": 0, "deferred": 0, "requeued": 0, "dead_lettered": 0}
+
+    def register(self, routing_key: str, handler: EventHandler) -> None:
+        """Route events with this routing key to handler"""
+        self.handlers[routing_key] = handler
+
+    def on(self, routing_key: str) -> Callable[[EventHandler], EventHandler]:
+        """Decorator form of register()"""
+        def decorator(handler: EventHandler) -> EventHandler:
+            self.register(routing_key, handler)
+            return handler
+        return decorator
+
+    async def start(self) -> None:
+        """Declare the topology and start consuming"""
+        self.connection = await aio_pika.connect_robust(settings.RABBITMQ_URL)
+        self.channel = await self.connection.channel()
+        await self.channel.set_qos(prefetch_count=self.prefetch)
+
+        exchange = await self.channel.declare_exchange(
+            EVENTS_EXCHANGE, aio_pika.ExchangeType.TOPIC, durable=True
+        )
+        dlx = await self.channel.declare_exchange(
+            DEAD_LETTER_EXCHANGE, aio_pika.ExchangeType.TOPIC, durable=True
+        )
+        dead = await self.channel.declare_queue(f"{self.queue_name}.dead", durable=True)
+        await dead.bind(dlx, routing_key="#")
+
+        queue = await self.channel.declare_queue(
+            self.queue_name,
+            durable=True,
+            arguments={"x-dead-letter-exchange": DEAD_LETTER_EXCHANGE}
+        )
+        for routing_key in self.handlers:
+            await queue.bind(exchange, routing_key=routing_key)
+        await queue.consume(self._on_message)
+        logger.info(
+            f"Consuming {self.queue_name} ({', '.join(self.handlers)}) "
+            f"prefetch={self.prefetch}"
+        )
+
+    async def stop(self) -> None:
+        if self.connection:
+            await self.connection.close()
+
+    def stats(self) -> dict:
+        return dict(self._metrics)
+
+    async def _on_message(self, message: AbstractIncomingMessage) -> None:
+        async with self._semaphore:
+            await self._handle(message)
+
+    async def _handle(self, message: AbstractIncomingMessage) -> None:
+        handler = self.handlers.get(message.routing_key or "")
+        if handler is None:
+            logger.warning(f"No handler for {message.routing_key}, discarding")
+            await message.ack()
+            return
+
+        try:
+            event = decode(message.body, message.content_type)
+        except Exception as e:
+            logger.error(f"Undecodable event {message.message_id}: {e}")
+            await message.reject(requeue=False)
+            self._metrics["dead_lettered"] += 1
+            return
+
+        event_id = message.message_id or event.get("event_id")
+        dedup_key = CacheKeys.event_processed(self.queue_name, event_id or "")
+        if event_id and not await self._claim(dedup_key):
+            if await self._state(dedup_key) == "done":
+                self._metrics["duplicates"] += 1
+                await message.ack()
+                return
+            # Still "processing": running elsewhere, or its consumer died
+            # mid-handler. Only a "done" claim makes this a duplicate.
+            self._metrics["deferred"] += 1
+            await asyncio.sleep(self.CLAIMED_RETRY_DELAY)
+            await message.nack(requeue=True)
+            return
+
+        try:
+            await handler(event)
+        except Exception as e:
+            if event_id:
+                await self._release(dedup_key)
+                failures = await self._count_failure(event_id)
+            else:
+                failures = None
+            if failures is None:
+                # No event id or Redis down: the broker flag is all we have
+                failures = self.MAX_HANDLER_ATTEMPTS if message.redelivered else 1
+            if failures >= self.MAX_HANDLER_ATTEMPTS:
+                logger.error(
+                    f"Handler failed {failures} times for {message.routing_key}, "
+                    f"dead-lettering: {e}"
+                )
+                await message.reject(requeue=False)
+                self._metrics["dead_lettered"] += 1
+            else:
+                logger.warning(f"Handler failed for {message.routing_key}, requeueing: {e}")
+                await message.nack(requeue=True)
+                self._metrics["requeued"] += 1
+            return
+
+        if event_id:
+            await self._mark_done(dedup_key)
+        await message.ack()
+        self._metrics["handled"] += 1
+
+    async def _claim(self, key: str) -> bool:
+        """Claim an event id; False if it was already (being) processed"""
+        try:
+            return bool(await get_cache().async_client.set(
+                key, "processing", nx=True, ex=self.PROCESSING_TTL
+            ))
+        except Exception as e:
+            # Fail open: a duplicate notification beats a lost one
+            logger.error(f"Event dedup claim failed: {e}")
+            return True
+
+    async def _count_failure(self, event_id: str) -> Optional[int]:
+        """Count a handler failure for the event; None if Redis is down"""
+        key = CacheKeys.event_failures(self.queue_name, event_id)
+        try:
+            async with get_cache().async_client.pipeline(transaction=True) as pipe:
+                pipe.incr(key)
+                pipe.expire(key, self.dedup_ttl)
+                failures, _ = await pipe.execute()
+            return int(failures)
+        except Exception as e:
+            logger.error(f"Event failure count failed: {e}")
+            return None
+
+    async def _state(self, key: str) -> Optional[str]:
+        """Current claim value ("processing" or "done"), None if gone"""
+        try:
+            return await get_cache().async_client.get(key)
+        except Exception as e:
+            logger.error(f"Event dedup lookup failed: {e}")
+            return None
+
+    async def _mark_done(self, key: str) -> None:
+        try:
+            await get_cache().async_client.set(key, "done", ex=self.dedup_ttl)
+        except Exception as e:
+            logger.error(f"Event dedup mark failed: {e}")
+
+    async def _release(self, key: str) -> None:
+        try:
+            await get_cache().async_client.delete(key)
+        except Exception as e:
+            logger.error(f"Event dedup release failed: {e}")
+
+async def main() -> None:
+    from app.events.handlers import register_handlers
+
+    consumer = EventConsumer()
+    register_handlers(consumer)
+    await consumer.start()
+    try:
+        await asyncio.Future()
+    finally:
+        await consumer.stop()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -1,10 +1,16 @@
 # backend/app/events/event_bus.py
 from abc import ABC, abstractmethod
-from typing import Callable, List, Any
+from typing import Callable, Dict, List, Any, Optional, NamedTuple, Type
 from enum import Enum
-import json
+from uuid import UUID
+import asyncio
+import itertools
 import logging
+import threading
+import time
+import uuid
 from app.config import settings
+from app.events.serialization import CONTENT_TYPE_JSON, encode
 import aio_pika
 
 logger = logging.getLogger(__name__)
@@ -18,28 +24,75 @@ class EventType(str, Enum):
     TICKET_ASSIGNED = "ticket.assigned"
     TICKET_RESOLVED = "ticket.resolved"
     NOTICE_PUBLISHED = "notice.published"
+    NOTICE_ARCHIVED = "notice.archived"
     PAYMENT_COMPLETED = "payment.completed"
     PAYMENT_FAILED = "payment.failed"
+    FEE_GENERATED = "fee.generated"
+
+_last_timestamp_ns = 0
+_timestamp_lock = threading.Lock()
+
+def _next_timestamp_ns() -> int:
+    """Epoch nanoseconds, strictly increasing within this process"""
+    global _last_timestamp_ns
+    with _timestamp_lock:
+        _last_timestamp_ns = max(time.time_ns(), _last_timestamp_ns + 1)
+        return _last_timestamp_ns
 
 class BaseEvent(ABC):
-    """Base event class"""
+    """Base event class.
+
+    The envelope carries a unique ``event_id`` (sent as the AMQP message_id
+    for consumer dedup), an epoch-nanosecond ``timestamp`` that never goes
+    backwards within a process, and the ``schema_version`` of ``data``.
+    Bump ``schema_version`` on a subclass when its data shape changes, so
+    consumers can handle old and new payloads side by side.
+    """
     
     event_type: EventType
+    schema_version: int = 1
+    _registry: Dict[str, Type["BaseEvent"]] = {}
     
-    def __init__(self, data: dict):
-        self.data = data
-        self.timestamp = self._get_timestamp()
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "event_type" in cls.__dict__:
+            BaseEvent._registry[cls.event_type.value] = cls
     
-    def _get_timestamp(self):
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+    def __init__(
+        self,
+        data: dict,
+        event_id: Optional[UUID] = None,
+        timestamp: Optional[int] = None,
+        schema_version: Optional[int] = None
+    ):
+        self.event_id = event_id or uuid.uuid4()
+        self.data = data
+        self.timestamp = timestamp if timestamp is not None else _next_timestamp_ns()
+        if schema_version is not None:
+            self.schema_version = schema_version
     
     def to_dict(self) -> dict:
         return {
+            "event_id": str(self.event_id),
             "event_type": self.event_type.value,
-            "data": self.data,
-            "timestamp": self.timestamp
+            "schema_version": self.schema_version,
+            "timestamp": self.timestamp,
+            "data": self.data
         }
+    
+    @staticmethod
+    def from_dict(payload: dict) -> "BaseEvent":
+        """Rebuild the concrete event from a decoded envelope"""
+        event_cls = BaseEvent._registry[payload["event_type"]]
+        event_id = payload.get("event_id")
+        return event_cls(
+            data=payload["data"],
+            event_id=UUID(event_id) if event_id else None,
+            timestamp=payload.get("timestamp"),
+            schema_version=payload.get("schema_version", 1)
+        )
+
+EVENTS_EXCHANGE = "apartment_events"
 
 class IEventPublisher(ABC):
     """Event publisher interface"""
@@ -60,54 +113,143 @@ class RabbitMQEventPublisher(IEventPublisher):
         """Connect to RabbitMQ"""
         try:
             self.connection = await aio_pika.connect_robust(settings.RABBITMQ_URL)
-            self.channel = await self.connection.channel()
-            self.exchange = await self.channel.declare_exchange(
-                "apartment_events",
-                aio_pika.ExchangeType.TOPIC,
-                durable=True
-            )
+            self.channel, self.exchange = await self._open_channel()
             logger.info("Connected to RabbitMQ")
         except Exception as e:
             logger.error(f"RabbitMQ connection failed: {e}")
             raise
     
+    async def _open_channel(self):
+        # Confirms: exchange.publish() returns only once the broker acks
+        channel = await self.connection.channel(publisher_confirms=True)
+        exchange = await channel.declare_exchange(
+            EVENTS_EXCHANGE,
+            aio_pika.ExchangeType.TOPIC,
+            durable=True
+        )
+        return channel, exchange
+
     async def publish(self, event: BaseEvent) -> None:
         """Publish event to RabbitMQ"""
         try:
-            if not self.channel:
-                await self.connect()
-            
-            message = aio_pika.Message(
-                body=json.dumps(event.to_dict()).encode(),
-                content_type="application/json"
+            await self.publish_raw(
+                routing_key=event.event_type.value,
+                body=encode(event.to_dict(), settings.EVENT_CONTENT_TYPE),
+                message_id=str(event.event_id),
+                content_type=settings.EVENT_CONTENT_TYPE
             )
-            
-            await self.exchange.publish(
-                message,
-                routing_key=event.event_type.value
-            )
-            
             logger.info(f"Event published: {event.event_type.value}")
         except Exception as e:
             logger.error(f"Failed to publish event: {e}")
             raise
+
+    async def publish_raw(
+        self,
+        routing_key: str,
+        body: bytes,
+        message_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        content_type: str = CONTENT_TYPE_JSON
+    ) -> None:
+        """Publish a serialized event and wait for the broker confirm"""
+        if not self.channel:
+            await self.connect()
+        await self._publish_on(
+            self.exchange, routing_key, body, message_id, timeout, content_type
+        )
+
+    @staticmethod
+    async def _publish_on(
+        exchange, routing_key, body, message_id, timeout, content_type
+    ) -> None:
+        message = aio_pika.Message(
+            body=body,
+            content_type=content_type,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            message_id=message_id,
+            type=routing_key
+        )
+        # Not mandatory: an event nobody has bound a queue for is not an error
+        await exchange.publish(
+            message,
+            routing_key=routing_key,
+            mandatory=False,
+            timeout=timeout
+        )
     
     async def disconnect(self):
         """Disconnect from RabbitMQ"""
         if self.connection:
             await self.connection.close()
 
-# Global event publisher instance
-event_publisher: RabbitMQEventPublisher = None
+class PendingMessage(NamedTuple):
+    """A serialized event ready to publish"""
+    routing_key: str
+    body: bytes
+    message_id: Optional[str] = None
+    content_type: str = CONTENT_TYPE_JSON
+
+class PooledEventPublisher(RabbitMQEventPublisher):
+    """RabbitMQ publisher with a confirm-mode channel pool.
+
+    ``publish_batch`` publishes a whole batch concurrently, round-robin over
+    the channel pool, so many publisher confirms are in flight at once
+    instead of one round-trip per event. Callers bound the batch size
+    themselves (the outbox relay claims at most OUTBOX_BATCH_SIZE rows).
+    """
+
+    def __init__(
+        self,
+        channel_pool_size: int = settings.EVENT_CHANNEL_POOL_SIZE,
+        publish_timeout: float = settings.OUTBOX_PUBLISH_TIMEOUT
+    ):
+        super().__init__()
+        self.channel_pool_size = channel_pool_size
+        self.publish_timeout = publish_timeout
+        self.exchanges: list = []
+        self._round_robin = None
+
+    async def connect(self):
+        """Connect and open the confirm-mode channel pool"""
+        try:
+            self.connection = await aio_pika.connect_robust(settings.RABBITMQ_URL)
+            self.exchanges = [
+                await self._open_channel() for _ in range(self.channel_pool_size)
+            ]
+            self.channel, self.exchange = self.exchanges[0]
+            self._round_robin = itertools.cycle(self.exchanges)
+            logger.info(f"Connected to RabbitMQ ({self.channel_pool_size} channels)")
+        except Exception as e:
+            logger.error(f"RabbitMQ connection failed: {e}")
+            raise
 
-async def init_event_publisher():
-    """Initialize event publisher"""
-    global event_publisher
-    event_publisher = RabbitMQEventPublisher()
-    await event_publisher.connect()
+    async def publish_raw(
+        self,
+        routing_key: str,
+        body: bytes,
+        message_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        content_type: str = CONTENT_TYPE_JSON
+    ) -> None:
+        """Publish now on the next pooled channel and wait for the confirm"""
+        if not self.exchanges:
+            await self.connect()
+        _, exchange = next(self._round_robin)
+        await self._publish_on(
+            exchange, routing_key, body, message_id, timeout, content_type
+        )
 
-async def get_event_publisher() -> IEventPublisher:
-    """Get event publisher instance"""
-    if event_publisher is None:
-        await init_event_publisher()
-    return event_publisher
+    async def publish_batch(self, messages: List[PendingMessage]) -> List[Optional[BaseException]]:
+        """Publish messages concurrently; returns the error (or None) for each"""
+        if not self.exchanges:
+            await self.connect()
+        results = await asyncio.gather(
+            *(
+                self.publish_raw(
+                    m.routing_key, m.body, m.message_id, self.publish_timeout, m.content_type
+                )
+                for m in messages
+            ),
+            return_exceptions=True
+        )
+        return [r if isinstance(r, BaseException) else None for r in results]
@@ -24,8 +24,14 @@ class TicketResolvedEvent(BaseEvent):
 class NoticePublishedEvent(BaseEvent):
     event_type = EventType.NOTICE_PUBLISHED
 
+class NoticeArchivedEvent(BaseEvent):
+    event_type = EventType.NOTICE_ARCHIVED
+
 class PaymentCompletedEvent(BaseEvent):
     event_type = EventType.PAYMENT_COMPLETED
 
 class PaymentFailedEvent(BaseEvent):
     event_type = EventType.PAYMENT_FAILED
+
+class FeeGeneratedEvent(BaseEvent):
+    event_type = EventType.FEE_GENERATED
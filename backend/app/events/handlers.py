@@ -0,0 +1,58 @@
+# backend/app/events/handlers.py
+from app.events.consumer import EventConsumer
+from app.events.event_bus import EventType
+from app.database.session import AsyncSessionLocal
+from app.repositories.user_repository import UserRepository
+from app.services.notice_feed_service import NoticeFeedService
+from app.tasks.email_tasks import (
+    send_user_registration_email,
+    send_resident_approval_email,
+    send_ticket_assignment_email,
+)
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+async def _load_user(user_id):
+    async with AsyncSessionLocal() as db:
+        return await UserRepository(db).read(user_id)
+
+async def _enqueue(task, *args) -> None:
+    # Celery's delay() does blocking broker I/O; keep it off the event loop
+    await asyncio.to_thread(task.delay, *args)
+
+async def on_user_registered(event: dict) -> None:
+    """Welcome email for a new account"""
+    data = event["data"]
+    await _enqueue(send_user_registration_email, data["email"], data["full_name"])
+
+async def on_resident_approved(event: dict) -> None:
+    """Approval email to the resident's user account"""
+    user = await _load_user(event["data"]["user_id"])
+    if user is None:
+        logger.warning(f"Resident approved for unknown user {event['data']['user_id']}")
+        return
+    await _enqueue(send_resident_approval_email, user.email, user.full_name)
+
+async def on_ticket_assigned(event: dict) -> None:
+    """Assignment email to the staff member"""
+    data = event["data"]
+    staff = await _load_user(data["assigned_to_id"])
+    if staff is None:
+        logger.warning(f"Ticket {data['ticket_number']} assigned to unknown user")
+        return
+    await _enqueue(send_ticket_assignment_email, staff.email, data["ticket_number"])
+
+async def on_notice_changed(event: dict) -> None:
+    """Rebuild the notice feeds a published/archived notice appears in"""
+    async with AsyncSessionLocal() as db:
+        await NoticeFeedService(db).refresh_affected(event["data"].get("building_section"))
+
+def register_handlers(consumer: EventConsumer) -> None:
+    """Register notification handlers per routing key"""
+    consumer.register(EventType.USER_REGISTERED.value, on_user_registered)
+    consumer.register(EventType.RESIDENT_APPROVED.value, on_resident_approved)
+    consumer.register(EventType.TICKET_ASSIGNED.value, on_ticket_assigned)
+    consumer.register(EventType.NOTICE_PUBLISHED.value, on_notice_changed)
+    consumer.register(EventType.NOTICE_ARCHIVED.value, on_notice_changed)
@@ -0,0 +1,155 @@
+# backend/app/events/outbox_relay.py
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.database.session import AsyncSessionLocal, async_engine
+# Imported via base so every mapper is registered before the relay runs
+from app.database.base import OutboxEvent
+from app.events.event_bus import PooledEventPublisher, PendingMessage
+from app.events.serialization import encode
+from datetime import timedelta
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class OutboxRelay:
+    """Drains the outbox table to the apartment_events exchange.
+
+    Each batch is claimed with FOR UPDATE SKIP LOCKED, so several relays can
+    run side by side without publishing the same row concurrently. The whole
+    batch is published across the publisher's channel pool with every
+    confirm in flight together, and only rows the broker acked are marked
+    published. Delivery is at-least-once:
+    the outbox id (the event id) is sent as ``message_id`` so consumers can
+    deduplicate. Bodies are encoded as EVENT_CONTENT_TYPE. A row that fails
+    OUTBOX_MAX_ATTEMPTS times is marked failed and no longer retried.
+    """
+
+    PURGE_EVERY_SECONDS = 600
+
+    def __init__(
+        self,
+        publisher: PooledEventPublisher,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        poll_interval: float = settings.OUTBOX_POLL_INTERVAL
+    ):
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._last_purge = 0.0
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        """Relay until stop() is called"""
+        logger.info("Outbox relay started")
+        backoff = 1
+        while not self._stopping.is_set():
+            try:
+                relayed = await self.relay_batch()
+                await self._maybe_purge()
+                backoff = 1
+            except Exception as e:
+                logger.error(f"Outbox relay error: {e}")
+                await self._sleep(backoff)
+                backoff = min(backoff * 2, 30)
+                continue
+            # A full batch means there is probably more waiting
+            if relayed < self.batch_size:
+                await self._sleep(self.poll_interval)
+        logger.info("Outbox relay stopped")
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def relay_batch(self) -> int:
+        """Publish one batch of pending events; returns how many were claimed"""
+        async with AsyncSessionLocal() as db:
+            async with db.begin():
+                rows = (await db.scalars(
+                    select(OutboxEvent)
+                    .where(
+                        OutboxEvent.published_at.is_(None),
+                        OutboxEvent.failed_at.is_(None)
+                    )
+                    .order_by(OutboxEvent.created_at, OutboxEvent.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )).all()
+                if not rows:
+                    return 0
+
+                errors = await self.publisher.publish_batch([
+                    PendingMessage(
+                        routing_key=row.event_type,
+                        body=encode(row.payload, settings.EVENT_CONTENT_TYPE),
+                        message_id=str(row.id),
+                        content_type=settings.EVENT_CONTENT_TYPE
+                    )
+                    for row in rows
+                ])
+                published = [row.id for row, err in zip(rows, errors) if err is None]
+                await self._mark_published(db, published)
+                for row, err in zip(rows, errors):
+                    if err is not None:
+                        row.attempts += 1
+                        row.last_error = repr(err)[:1000]
+                        if row.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+                            row.failed_at = func.now()
+                            logger.error(
+                                f"Outbox event {row.id} ({row.event_type}) failed "
+                                f"{row.attempts} times, giving up: {row.last_error}"
+                            )
+
+        failed = len(rows) - len(published)
+        if failed:
+            logger.warning(f"Outbox relay: {failed}/{len(rows)} events not confirmed")
+        logger.debug(f"Outbox relay: published {len(published)} events")
+        return len(rows)
+
+    @staticmethod
+    async def _mark_published(db: AsyncSession, ids: list) -> None:
+        if ids:
+            await db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(ids))
+                .values(published_at=func.now())
+                .execution_options(synchronize_session=False)
+            )
+
+    async def _maybe_purge(self) -> None:
+        """Delete published rows past retention (kept for replay/debugging)"""
+        now = time.monotonic()
+        if now - self._last_purge < self.PURGE_EVERY_SECONDS:
+            return
+        self._last_purge = now
+        async with AsyncSessionLocal() as db:
+            async with db.begin():
+                result = await db.execute(
+                    delete(OutboxEvent).where(
+                        OutboxEvent.published_at
+                        < func.now() - timedelta(hours=settings.OUTBOX_RETENTION_HOURS)
+                    )
+                )
+        if result.rowcount:
+            logger.info(f"Outbox relay: purged {result.rowcount} published events")
+
+    async def _sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+async def main() -> None:
+    publisher = PooledEventPublisher()
+    relay = OutboxRelay(publisher)
+    try:
+        await relay.run()
+    finally:
+        await publisher.disconnect()
+        await async_engine.dispose()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,29 @@
+# backend/app/events/serialization.py
+from typing import Optional
+from pydantic_core import to_jsonable_python
+import json
+import msgpack
+
+CONTENT_TYPE_JSON = "application/json"
+CONTENT_TYPE_MSGPACK = "application/msgpack"
+
+SUPPORTED_CONTENT_TYPES = (CONTENT_TYPE_MSGPACK, CONTENT_TYPE_JSON)
+
+class UnsupportedContentType(ValueError):
+    """Raised for an event body in a content type we cannot decode"""
+
+def encode(payload: dict, content_type: str = CONTENT_TYPE_JSON) -> bytes:
+    """Serialize an event envelope; UUIDs/datetimes/enums become strings"""
+    if content_type == CONTENT_TYPE_MSGPACK:
+        return msgpack.packb(payload, default=to_jsonable_python, use_bin_type=True)
+    if content_type == CONTENT_TYPE_JSON:
+        return json.dumps(payload, default=to_jsonable_python, separators=(",", ":")).encode()
+    raise UnsupportedContentType(content_type)
+
+def decode(body: bytes, content_type: Optional[str]) -> dict:
+    """Deserialize by content type; a missing content type is taken as JSON"""
+    if content_type == CONTENT_TYPE_MSGPACK:
+        return msgpack.unpackb(body, raw=False)
+    if content_type in (None, "", CONTENT_TYPE_JSON):
+        return json.loads(body)
+    raise UnsupportedContentType(content_type)
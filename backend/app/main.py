@@ -4,8 +4,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from app.config import settings
-from app.events.event_bus import init_event_publisher
-from app.api.v1 import users, residents, tickets, visitors, notices, payments
+from app.database.session import async_engine
+from app.core.password_hasher import get_password_hasher
+from app.cache.redis_cache import get_cache
+from app.cache.invalidation import (
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
+from app.api.v1 import users, residents, tickets, visitors, notices, payments, search
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -16,15 +22,15 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup/shutdown events"""
     # Startup
     logger.info("Starting up application...")
-    try:
-        await init_event_publisher()
-    except Exception as e:
-        logger.error(f"Failed to initialize event publisher: {e}")
+    await start_invalidation_listener()
     
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
+    await stop_invalidation_listener()
+    await async_engine.dispose()
+    get_password_hasher().shutdown()
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -44,7 +50,12 @@ app.add_middleware(
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "app": settings.APP_NAME}
+    return {
+        "status": "healthy",
+        "app": settings.APP_NAME,
+        "password_hasher": get_password_hasher().stats(),
+        "cache": get_cache().stats(),
+    }
 
 # Include routers
 app.include_router(users.router, prefix="/api/v1/users", tags=["Users"])
@@ -53,6 +64,7 @@ app.include_router(tickets.router, prefix="/api/v1/tickets", tags=["Tickets"])
 app.include_router(visitors.router, prefix="/api/v1/visitors", tags=["Visitors"])
 app.include_router(notices.router, prefix="/api/v1/notices", tags=["Notices"])
 app.include_router(payments.router, prefix="/api/v1/payments", tags=["Payments"])
+app.include_router(search.router, prefix="/api/v1/search", tags=["Search"])
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,59 @@
+# backend/app/models/ledger.py
+from sqlalchemy import Column, Integer, Enum, ForeignKey, Index, DateTime, CheckConstraint, text
+from sqlalchemy.dialects.postgresql import UUID
+from app.database.base import BaseModel
+from app.core.constants import LedgerEntryType, LedgerAccount
+import uuid
+
+class LedgerEntry(BaseModel):
+    """Double-entry posting: amount moves from credit_account to debit_account"""
+    __tablename__ = "ledger_entries"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    flat_id = Column(UUID(as_uuid=True), ForeignKey("flats.id"), nullable=False)
+    entry_type = Column(Enum(LedgerEntryType), nullable=False)
+    debit_account = Column(Enum(LedgerAccount, name="ledgeraccount"), nullable=False)
+    credit_account = Column(Enum(LedgerAccount, name="ledgeraccount"), nullable=False)
+    amount = Column(Integer, nullable=False)
+    fee_id = Column(UUID(as_uuid=True), ForeignKey("monthly_fees.id"), nullable=True)
+    payment_id = Column(UUID(as_uuid=True), ForeignKey("payments.id"), nullable=True)
+
+    __table_args__ = (
+        CheckConstraint("amount > 0", name="ck_ledger_amount_positive"),
+        CheckConstraint("debit_account <> credit_account", name="ck_ledger_distinct_accounts"),
+        Index("idx_ledger_flat_created", "flat_id", "created_at"),
+        Index("idx_ledger_fee", "fee_id"),
+        # A fee or payment is posted at most once; makes posting idempotent
+        Index(
+            "uq_ledger_fee_posting",
+            "fee_id",
+            unique=True,
+            postgresql_where=text("entry_type = 'FEE'"),
+        ),
+        Index(
+            "uq_ledger_payment_posting",
+            "payment_id",
+            unique=True,
+            postgresql_where=text("entry_type = 'PAYMENT'"),
+        ),
+    )
+
+class FlatBalance(BaseModel):
+    """Running receivable balance per flat, maintained by ledger postings"""
+    __tablename__ = "flat_balances"
+
+    flat_id = Column(UUID(as_uuid=True), ForeignKey("flats.id"), primary_key=True)
+    balance = Column(Integer, nullable=False, default=0, server_default="0")
+    total_billed = Column(Integer, nullable=False, default=0, server_default="0")
+    total_paid = Column(Integer, nullable=False, default=0, server_default="0")
+    last_posted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Defaulters report: flats that owe, largest balance first
+        Index(
+            "idx_flat_balance_outstanding",
+            "balance",
+            "flat_id",
+            postgresql_where=text("balance > 0"),
+        ),
+    )
@@ -1,10 +1,16 @@
 # backend/app/models/notice.py
-from sqlalchemy import Column, String, Enum, ForeignKey, Text, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Enum, ForeignKey, Text, Index, DateTime, Computed, BigInteger, Sequence
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from app.database.base import BaseModel
 from app.core.constants import NoticeStatus
 import uuid
 
+# Feed versions: every change to what the notice board shows takes the next one
+notice_feed_version_seq = Sequence("notice_feed_version_seq", metadata=BaseModel.metadata)
+# pg_advisory_xact_lock key held from taking a feed version until commit,
+# so versions become visible in the order they were handed out
+NOTICE_FEED_LOCK_KEY = 0x6E6F7469
+
 class Notice(BaseModel):
     """Notice board model"""
     __tablename__ = "notices"
@@ -14,12 +20,25 @@ class Notice(BaseModel):
     content = Column(Text, nullable=False)
     published_by_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     status = Column(Enum(NoticeStatus), default=NoticeStatus.DRAFT, index=True)
-    published_date = Column(String(50), nullable=True)
-    expiry_date = Column(String(50), nullable=True)
+    published_date = Column(DateTime(timezone=True), nullable=True)
+    expiry_date = Column(DateTime(timezone=True), nullable=True)
     category = Column(String(50), nullable=False)  # Maintenance, Event, Announcement, etc.
     attachment_url = Column(String(255), nullable=True)
+    building_section = Column(String(50), nullable=True)  # None: every section
+    feed_version = Column(BigInteger, nullable=True)  # set on publish/archive
+    # Full-text search; title words rank above content words
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(content, '')), 'B')",
+        persisted=True
+    ))
 
     __table_args__ = (
         Index("idx_notice_status", "status"),
         Index("idx_notice_published_by", "published_by_id"),
+        # Notice board: published, not yet expired, newest first
+        Index("idx_notice_status_published", "status", "published_date"),
+        Index("idx_notice_status_expiry", "status", "expiry_date"),
+        Index("idx_notice_search", "search_vector", postgresql_using="gin"),
+        Index("idx_notice_feed_version", "feed_version"),
     )
@@ -0,0 +1,34 @@
+# backend/app/models/outbox.py
+from sqlalchemy import Column, String, Text, Integer, Index, DateTime, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from app.database.base import BaseModel
+import uuid
+
+class OutboxEvent(BaseModel):
+    """Domain event written in the same transaction as the change (outbox)"""
+    __tablename__ = "outbox_events"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    event_type = Column(String(100), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    last_error = Column(Text, nullable=True)
+    # Set once attempts reaches OUTBOX_MAX_ATTEMPTS; the relay skips the row
+    failed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Relay scans only the unpublished tail, oldest first
+        Index(
+            "idx_outbox_pending",
+            "created_at",
+            "id",
+            postgresql_where=text("published_at IS NULL AND failed_at IS NULL"),
+        ),
+        Index("idx_outbox_published_at", "published_at"),
+        Index(
+            "idx_outbox_failed_at",
+            "failed_at",
+            postgresql_where=text("failed_at IS NOT NULL"),
+        ),
+    )
@@ -1,5 +1,5 @@
 # backend/app/models/payment.py
-from sqlalchemy import Column, String, Integer, Enum, ForeignKey, Text, Numeric, Index
+from sqlalchemy import Column, String, Integer, Enum, ForeignKey, Text, Numeric, Index, UniqueConstraint, Date, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from app.database.base import BaseModel
 from app.core.constants import PaymentStatus
@@ -11,15 +11,22 @@ class MonthlyFee(BaseModel):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     flat_id = Column(UUID(as_uuid=True), ForeignKey("flats.id"), nullable=False, index=True)
-    month_year = Column(String(10), nullable=False)  # MM-YYYY format
+    month_year = Column(Date, nullable=False)  # first day of the billing month
     base_amount = Column(Integer, nullable=False)
     maintenance_charge = Column(Integer, default=0)
     water_charge = Column(Integer, default=0)
     other_charges = Column(Integer, default=0)
     penalty_amount = Column(Integer, default=0)
-    due_date = Column(String(50), nullable=False)
+    due_date = Column(Date, nullable=False)
     status = Column(Enum(PaymentStatus), default=PaymentStatus.PENDING, index=True)
 
+    __table_args__ = (
+        # One fee per flat per month; makes billing runs idempotent
+        UniqueConstraint("flat_id", "month_year", name="uq_fee_flat_month"),
+        # Overdue/reminder range scans: status = PENDING AND due_date < x
+        Index("idx_fee_status_due", "status", "due_date"),
+    )
+
 class Payment(BaseModel):
     """Payment transaction model"""
     __tablename__ = "payments"
@@ -31,7 +38,7 @@ class Payment(BaseModel):
     payment_method = Column(String(50), nullable=False)  # Card, UPI, Bank Transfer, etc.
     transaction_id = Column(String(255), unique=True, nullable=False)
     status = Column(Enum(PaymentStatus), default=PaymentStatus.PENDING, index=True)
-    payment_date = Column(String(50), nullable=False)
+    payment_date = Column(DateTime(timezone=True), nullable=False)
     receipt_url = Column(String(255), nullable=True)
     notes = Column(Text, nullable=True)
 
@@ -39,4 +46,6 @@ class Payment(BaseModel):
         Index("idx_payment_resident", "resident_id"),
         Index("idx_payment_status", "status"),
         Index("idx_payment_transaction", "transaction_id"),
+        Index("idx_payment_resident_date", "resident_id", "payment_date"),
+        Index("idx_payment_status_date", "status", "payment_date"),
     )
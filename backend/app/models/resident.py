@@ -1,5 +1,5 @@
 # backend/app/models/resident.py
-from sqlalchemy import Column, String, Enum, ForeignKey, Integer, Boolean, Index, Text
+from sqlalchemy import Column, String, Enum, ForeignKey, Integer, Boolean, Index, Text, Date
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database.base import BaseModel
@@ -25,7 +25,7 @@ class Resident(BaseModel):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     flat_id = Column(UUID(as_uuid=True), ForeignKey("flats.id"), nullable=False, index=True)
     status = Column(Enum(ResidentStatus), default=ResidentStatus.PENDING, index=True)
-    move_in_date = Column(String(50), nullable=True)
+    move_in_date = Column(Date, nullable=True)
     id_proof_url = Column(String(255), nullable=True)
     ownership_proof_url = Column(String(255), nullable=True)
     family_members = Column(Integer, default=1)
@@ -36,4 +36,5 @@ class Resident(BaseModel):
     __table_args__ = (
         Index("idx_resident_status", "status"),
         Index("idx_resident_user_flat", "user_id", "flat_id"),
+        Index("idx_resident_status_created", "status", "created_at", "id"),
     )
@@ -1,6 +1,6 @@
 # backend/app/models/ticket.py
-from sqlalchemy import Column, String, Enum, ForeignKey, Text, Integer, Index, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Enum, ForeignKey, Text, Integer, Index, DateTime, Computed
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from app.database.base import BaseModel
 from app.core.constants import TicketStatus, TicketPriority
 from datetime import datetime
@@ -25,10 +25,20 @@ class Ticket(BaseModel):
     resolution_notes = Column(Text, nullable=True)
     estimated_cost = Column(Integer, nullable=True)
     actual_cost = Column(Integer, nullable=True)
+    # Full-text search; title words rank above description words
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+        persisted=True
+    ))
 
     __table_args__ = (
         Index("idx_ticket_status", "status"),
         Index("idx_ticket_resident", "resident_id"),
         Index("idx_ticket_flat", "flat_id"),
         Index("idx_ticket_assigned", "assigned_to_id"),
+        # Keyset pagination: (filter, created_at, id)
+        Index("idx_ticket_resident_created", "resident_id", "created_at", "id"),
+        Index("idx_ticket_status_created", "status", "created_at", "id"),
+        Index("idx_ticket_search", "search_vector", postgresql_using="gin"),
     )
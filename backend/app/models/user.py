@@ -25,4 +25,5 @@ class User(BaseModel):
     __table_args__ = (
         Index("idx_user_email_active", "email", "is_active"),
         Index("idx_user_role", "role"),
+        Index("idx_user_active_created", "is_active", "created_at", "id"),
     )
@@ -1,26 +1,59 @@
 # backend/app/models/visitor.py
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Index, Computed, text
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from app.database.base import BaseModel
 import uuid
 
 class VisitorLog(BaseModel):
-    """Visitor entry/exit log"""
+    """Visitor entry/exit log.
+
+    Range-partitioned by month on entry_time (see app/database/partitions.py),
+    so the primary key includes entry_time and queries should bound it to
+    get partition pruning.
+    """
     __tablename__ = "visitor_logs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    flat_id = Column(UUID(as_uuid=True), ForeignKey("flats.id"), nullable=False, index=True)
+    flat_id = Column(UUID(as_uuid=True), ForeignKey("flats.id"), nullable=False)
     security_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     visitor_name = Column(String(255), nullable=False)
     visitor_phone = Column(String(20), nullable=False)
     visitor_id_proof = Column(String(50), nullable=True)
     purpose = Column(String(255), nullable=False)
-    entry_time = Column(DateTime, nullable=False, index=True)
+    entry_time = Column(DateTime, primary_key=True, nullable=False)
     exit_time = Column(DateTime, nullable=True)
     vehicle_number = Column(String(20), nullable=True)
     notes = Column(Text, nullable=True)
+    pass_code = Column(String(8), nullable=True)  # shown to the visitor, used at exit
+    # Names aren't English words: 'simple' config, no stemming
+    search_vector = Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('simple', coalesce(visitor_name, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(purpose, '')), 'B')",
+        persisted=True
+    ))
 
     __table_args__ = (
-        Index("idx_visitor_flat", "flat_id"),
         Index("idx_visitor_entry_exit", "entry_time", "exit_time"),
+        Index("idx_visitor_flat_created", "flat_id", "created_at", "id"),
+        # Exit lookup: only visits still inside are indexed, so it stays tiny
+        Index(
+            "idx_visitor_open_pass",
+            "pass_code",
+            postgresql_where=text("exit_time IS NULL"),
+        ),
+        Index("idx_visitor_search", "search_vector", postgresql_using="gin"),
+        # Partial and fuzzy phone / vehicle number matches (pg_trgm)
+        Index(
+            "idx_visitor_phone_trgm",
+            "visitor_phone",
+            postgresql_using="gin",
+            postgresql_ops={"visitor_phone": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_visitor_vehicle_trgm",
+            "vehicle_number",
+            postgresql_using="gin",
+            postgresql_ops={"vehicle_number": "gin_trgm_ops"},
+        ),
+        {"postgresql_partition_by": "RANGE (entry_time)"},
     )
@@ -1,12 +1,52 @@
 # backend/app/repositories/base_repository.py
-from typing import Generic, TypeVar, List, Optional, Any
+from typing import Generic, TypeVar, List, Optional, Any, Iterator, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, select, func, tuple_, insert, update, delete, inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.database.base import BaseModel
+from app.core.pagination import PageResult, encode_cursor, decode_cursor
 
 T = TypeVar('T', bound=BaseModel)
 
-class BaseRepository(Generic[T]):
+BULK_BATCH_SIZE = 1000
+
+class BulkStatementsMixin:
+    """Statement builders shared by the sync and async bulk APIs.
+
+    Inserts go through SQLAlchemy's ORM bulk INSERT ... RETURNING, which
+    batches rows into multi-row VALUES statements (insertmanyvalues), so a
+    batch costs one round-trip instead of INSERT + COMMIT + SELECT per row.
+    """
+
+    model: type
+
+    @staticmethod
+    def _batches(rows: Sequence[dict], batch_size: int) -> Iterator[Sequence[dict]]:
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+    def _bulk_insert_stmt(self):
+        return insert(self.model).returning(self.model)
+
+    def _bulk_upsert_stmt(
+        self,
+        rows: Sequence[dict],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = None
+    ):
+        stmt = pg_insert(self.model)
+        if update_columns is None:
+            skip = set(conflict_columns) | {"id", "created_at", "updated_at"}
+            update_columns = [c for c in rows[0] if c not in skip]
+        set_ = {c: stmt.excluded[c] for c in update_columns}
+        set_["updated_at"] = func.now()
+        return stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_=set_
+        ).returning(self.model).execution_options(populate_existing=True)
+
+class BaseRepository(BulkStatementsMixin, Generic[T]):
     """Generic repository for CRUD operations"""
 
     def __init__(self, model: type[T], db: Session):
@@ -27,7 +67,9 @@ class BaseRepository(Generic[T]):
 
     def read_all(self, skip: int = 0, limit: int = 100) -> List[T]:
         """Get all records with pagination"""
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+        return self.db.query(self.model).order_by(
+            self.model.created_at, self.model.id
+        ).offset(skip).limit(limit).all()
 
     def update(self, id: Any, obj_in: dict) -> Optional[T]:
         """Update record"""
@@ -52,6 +94,38 @@ class BaseRepository(Generic[T]):
         """Count total records"""
         return self.db.query(self.model).count()
 
+    def bulk_create(self, rows: Sequence[dict], batch_size: int = BULK_BATCH_SIZE) -> List[T]:
+        """Insert many records with one commit; rows come back via RETURNING"""
+        created = []
+        for batch in self._batches(rows, batch_size):
+            created.extend(self.db.scalars(self._bulk_insert_stmt(), batch).all())
+        self.db.commit()
+        return created
+
+    def bulk_upsert(
+        self,
+        rows: Sequence[dict],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = None,
+        batch_size: int = BULK_BATCH_SIZE
+    ) -> List[T]:
+        """INSERT ... ON CONFLICT DO UPDATE for many records, one commit"""
+        if not rows:
+            return []
+        stmt = self._bulk_upsert_stmt(rows, conflict_columns, update_columns)
+        upserted = []
+        for batch in self._batches(rows, batch_size):
+            upserted.extend(self.db.scalars(stmt, batch).all())
+        self.db.commit()
+        return upserted
+
+    def bulk_update(self, rows: Sequence[dict], batch_size: int = BULK_BATCH_SIZE) -> int:
+        """Update many records by primary key (each row must include "id")"""
+        for batch in self._batches(rows, batch_size):
+            self.db.execute(update(self.model), batch)
+        self.db.commit()
+        return len(rows)
+
     def exists(self, **filters) -> bool:
         """Check if record exists"""
         return self.db.query(self.model).filter_by(**filters).first() is not None
@@ -63,3 +137,162 @@ class BaseRepository(Generic[T]):
     def filter_one(self, **filters) -> Optional[T]:
         """Get one record by filter"""
         return self.db.query(self.model).filter_by(**filters).first()
+
+
+class AsyncBaseRepository(BulkStatementsMixin, Generic[T]):
+    """Generic async repository for CRUD operations (AsyncSession).
+
+    Writes only flush; the service layer's UnitOfWork commits once per
+    operation.
+    """
+
+    def __init__(self, model: type[T], db: AsyncSession):
+        self.model = model
+        self.db = db
+
+    async def create(self, obj_in: dict) -> T:
+        """Create new record"""
+        db_obj = self.model(**obj_in)
+        self.db.add(db_obj)
+        # Server defaults come back via INSERT ... RETURNING (eager_defaults)
+        await self.db.flush()
+        return db_obj
+
+    async def read(self, id: Any) -> Optional[T]:
+        """Get record by ID"""
+        return await self.db.get(self.model, id)
+
+    async def read_all(self, cursor: Optional[str] = None, limit: int = 100) -> PageResult[T]:
+        """Get all records, newest first, with keyset pagination"""
+        return await self.read_page(cursor=cursor, limit=limit)
+
+    async def read_page(
+        self,
+        *criteria,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> PageResult[T]:
+        """Keyset page over (created_at, id) descending.
+
+        Each page is a single index range scan continuing after the cursor,
+        so deep pages cost the same as the first and rows never shift.
+        """
+        stmt = select(self.model).where(*criteria)
+        if cursor:
+            created_at, last_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(self.model.created_at, self.model.id)
+                < tuple_(created_at, last_id)
+            )
+        stmt = stmt.order_by(
+            self.model.created_at.desc(), self.model.id.desc()
+        ).limit(limit + 1)
+
+        result = await self.db.execute(stmt)
+        items = list(result.scalars().all())
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return PageResult(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def in_range(column, start: Optional[Any] = None, end: Optional[Any] = None) -> list:
+        """Half-open [start, end) criteria on a date/datetime column.
+
+        Plain comparisons on the typed column, so a composite index ending
+        in that column serves the range as one index scan.
+        """
+        criteria = []
+        if start is not None:
+            criteria.append(column >= start)
+        if end is not None:
+            criteria.append(column < end)
+        return criteria
+
+    async def update(self, id: Any, obj_in: dict) -> Optional[T]:
+        """Update record with a single UPDATE ... RETURNING (no pre-read)"""
+        return await self.update_where(self.model.id == id, values=obj_in)
+
+    async def update_where(self, *criteria, values: dict) -> Optional[T]:
+        """UPDATE ... WHERE criteria RETURNING the row; None if nothing matched.
+
+        Keys that aren't mapped columns are dropped; with nothing left to
+        set this is a plain read of the matching row.
+        """
+        columns = inspect(self.model).columns.keys()
+        values = {key: value for key, value in values.items() if key in columns}
+        if not values:
+            result = await self.db.execute(select(self.model).where(*criteria).limit(1))
+            return result.scalars().first()
+        stmt = (
+            update(self.model)
+            .where(*criteria)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True, synchronize_session="fetch")
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().first()
+
+    async def delete(self, id: Any) -> bool:
+        """Delete record with a single DELETE ... RETURNING"""
+        result = await self.db.execute(
+            delete(self.model).where(self.model.id == id).returning(self.model.id)
+        )
+        return result.first() is not None
+
+    async def count(self) -> int:
+        """Count total records"""
+        result = await self.db.execute(
+            select(func.count()).select_from(self.model)
+        )
+        return result.scalar_one()
+
+    async def bulk_create(self, rows: Sequence[dict], batch_size: int = BULK_BATCH_SIZE) -> List[T]:
+        """Insert many records; rows come back via RETURNING"""
+        created = []
+        for batch in self._batches(rows, batch_size):
+            result = await self.db.scalars(self._bulk_insert_stmt(), batch)
+            created.extend(result.all())
+        return created
+
+    async def bulk_upsert(
+        self,
+        rows: Sequence[dict],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = None,
+        batch_size: int = BULK_BATCH_SIZE
+    ) -> List[T]:
+        """INSERT ... ON CONFLICT DO UPDATE for many records"""
+        if not rows:
+            return []
+        stmt = self._bulk_upsert_stmt(rows, conflict_columns, update_columns)
+        upserted = []
+        for batch in self._batches(rows, batch_size):
+            result = await self.db.scalars(stmt, batch)
+            upserted.extend(result.all())
+        return upserted
+
+    async def bulk_update(self, rows: Sequence[dict], batch_size: int = BULK_BATCH_SIZE) -> int:
+        """Update many records by primary key (each row must include "id")"""
+        for batch in self._batches(rows, batch_size):
+            await self.db.execute(update(self.model), batch)
+        return len(rows)
+
+    async def exists(self, **filters) -> bool:
+        """Check if record exists"""
+        return await self.filter_one(**filters) is not None
+
+    async def filter(self, **filters) -> List[T]:
+        """Filter records"""
+        result = await self.db.execute(select(self.model).filter_by(**filters))
+        return list(result.scalars().all())
+
+    async def filter_one(self, **filters) -> Optional[T]:
+        """Get one record by filter"""
+        result = await self.db.execute(
+            select(self.model).filter_by(**filters).limit(1)
+        )
+        return result.scalars().first()
@@ -0,0 +1,65 @@
+# backend/app/repositories/ledger_repository.py
+from app.repositories.base_repository import AsyncBaseRepository
+from app.models.ledger import FlatBalance, LedgerEntry
+from app.core.pagination import PageResult, encode_amount_cursor, decode_amount_cursor
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+class FlatBalanceRepository(AsyncBaseRepository[FlatBalance]):
+    """Materialized flat balances (written only by LedgerService)"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(FlatBalance, db)
+
+    async def get_by_flat(self, flat_id) -> Optional[FlatBalance]:
+        """Primary-key lookup of a flat's balance"""
+        return await self.db.get(self.model, flat_id)
+
+    async def get_defaulters(
+        self,
+        min_balance: int = 1,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> PageResult[FlatBalance]:
+        """Flats owing at least min_balance, largest balance first.
+
+        Keyset over (balance, flat_id) descending, served by the partial
+        idx_flat_balance_outstanding index.
+        """
+        stmt = select(self.model).where(
+            self.model.balance > 0,
+            self.model.balance >= min_balance
+        )
+        if cursor:
+            balance, flat_id = decode_amount_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(self.model.balance, self.model.flat_id)
+                < tuple_(balance, flat_id)
+            )
+        stmt = stmt.order_by(
+            self.model.balance.desc(), self.model.flat_id.desc()
+        ).limit(limit + 1)
+
+        result = await self.db.execute(stmt)
+        items = list(result.scalars().all())
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_amount_cursor(items[-1].balance, items[-1].flat_id)
+        return PageResult(items=items, next_cursor=next_cursor)
+
+class LedgerEntryRepository(AsyncBaseRepository[LedgerEntry]):
+    """Ledger postings (append-only)"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(LedgerEntry, db)
+
+    async def get_by_flat(
+        self, flat_id, cursor: Optional[str] = None, limit: int = 50
+    ) -> PageResult[LedgerEntry]:
+        """A flat's postings, newest first (served by idx_ledger_flat_created)"""
+        return await self.read_page(
+            self.model.flat_id == flat_id, cursor=cursor, limit=limit
+        )
@@ -0,0 +1,101 @@
+# backend/app/repositories/notice_repository.py
+from app.repositories.base_repository import AsyncBaseRepository
+from app.models.notice import Notice, NOTICE_FEED_LOCK_KEY
+from app.core.constants import NoticeStatus
+from app.core.pagination import PageResult
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, not_, or_, select
+from typing import List, Optional
+from datetime import datetime
+
+class NoticeRepository(AsyncBaseRepository[Notice]):
+    """Notice repository"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(Notice, db)
+
+    async def get_active(
+        self, now: datetime, cursor: Optional[str] = None, limit: int = 50
+    ) -> PageResult[Notice]:
+        """Published notices that are live at `now` (not yet expired)"""
+        return await self.read_page(
+            self.model.status == NoticeStatus.PUBLISHED,
+            *self.in_range(self.model.published_date, end=now),
+            or_(self.model.expiry_date.is_(None), self.model.expiry_date > now),
+            cursor=cursor,
+            limit=limit
+        )
+
+    async def get_published_between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> PageResult[Notice]:
+        """Published notices with published_date in [start, end)"""
+        return await self.read_page(
+            self.model.status == NoticeStatus.PUBLISHED,
+            *self.in_range(self.model.published_date, start, end),
+            cursor=cursor,
+            limit=limit
+        )
+
+    def _for_section(self, section: Optional[str]):
+        """Meant for a section's board (section None: general notices only)"""
+        if not section:
+            return self.model.building_section.is_(None)
+        return or_(
+            self.model.building_section.is_(None),
+            self.model.building_section == section
+        )
+
+    def _live(self, now: datetime):
+        return and_(
+            self.model.status == NoticeStatus.PUBLISHED,
+            self.model.published_date <= now,
+            or_(self.model.expiry_date.is_(None), self.model.expiry_date > now)
+        )
+
+    async def get_feed(self, section: Optional[str], now: datetime) -> List[Notice]:
+        """Everything on a section's board, newest first"""
+        result = await self.db.execute(
+            select(self.model)
+            .where(self._for_section(section), self._live(now))
+            .order_by(self.model.published_date.desc(), self.model.id.desc())
+        )
+        return list(result.scalars().all())
+
+    async def get_removed(self, section: Optional[str], now: datetime, limit: int) -> List:
+        """(id, feed_version) of the section's latest versioned notices that
+        are off the board (archived or expired), newest version first"""
+        result = await self.db.execute(
+            select(self.model.id, self.model.feed_version)
+            .where(
+                self.model.feed_version.isnot(None),
+                self.model.published_date.isnot(None),
+                self._for_section(section),
+                not_(self._live(now))
+            )
+            .order_by(self.model.feed_version.desc())
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def lock_feed_versions(self) -> None:
+        """Serialize feed version changes until this transaction ends.
+
+        Without it a version taken earlier could commit after a later one,
+        and a feed built in between would claim a version whose changes
+        it doesn't hold yet.
+        """
+        await self.db.execute(select(func.pg_advisory_xact_lock(NOTICE_FEED_LOCK_KEY)))
+
+    async def get_feed_version(self) -> int:
+        """Latest committed feed version (0 before the first publish).
+
+        Versions commit in order (see lock_feed_versions), so every change
+        up to this version is visible.
+        """
+        result = await self.db.execute(select(func.max(self.model.feed_version)))
+        return result.scalar() or 0
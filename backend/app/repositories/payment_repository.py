@@ -0,0 +1,79 @@
+# backend/app/repositories/payment_repository.py
+from app.repositories.base_repository import AsyncBaseRepository
+from app.models.payment import MonthlyFee, Payment
+from app.core.constants import PaymentStatus
+from app.core.pagination import PageResult
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from datetime import date
+
+class MonthlyFeeRepository(AsyncBaseRepository[MonthlyFee]):
+    """Monthly fee repository"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(MonthlyFee, db)
+
+    async def get_by_flat(
+        self,
+        flat_id,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> PageResult[MonthlyFee]:
+        """Fees for a flat with month_year in [start, end)"""
+        return await self.read_page(
+            self.model.flat_id == flat_id,
+            *self.in_range(self.model.month_year, start, end),
+            cursor=cursor,
+            limit=limit
+        )
+
+    async def get_overdue(
+        self, as_of: date, cursor: Optional[str] = None, limit: int = 50
+    ) -> PageResult[MonthlyFee]:
+        """Pending fees due before as_of (served by idx_fee_status_due)"""
+        return await self.read_page(
+            self.model.status == PaymentStatus.PENDING,
+            *self.in_range(self.model.due_date, end=as_of),
+            cursor=cursor,
+            limit=limit
+        )
+
+class PaymentRepository(AsyncBaseRepository[Payment]):
+    """Payment repository"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(Payment, db)
+
+    async def get_by_resident(
+        self,
+        resident_id,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> PageResult[Payment]:
+        """Payments by a resident with payment_date in [start, end)"""
+        return await self.read_page(
+            self.model.resident_id == resident_id,
+            *self.in_range(self.model.payment_date, start, end),
+            cursor=cursor,
+            limit=limit
+        )
+
+    async def get_by_status(
+        self,
+        status: PaymentStatus,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> PageResult[Payment]:
+        """Payments in a status with payment_date in [start, end)"""
+        return await self.read_page(
+            self.model.status == status,
+            *self.in_range(self.model.payment_date, start, end),
+            cursor=cursor,
+            limit=limit
+        )
@@ -1,40 +1,43 @@
 # backend/app/repositories/resident_repository.py
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import AsyncBaseRepository
 from app.models.resident import Resident, Flat
 from app.core.constants import ResidentStatus
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from app.core.pagination import PageResult
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 
-class FlatRepository(BaseRepository[Flat]):
-    def __init__(self, db: Session):
+class FlatRepository(AsyncBaseRepository[Flat]):
+    def __init__(self, db: AsyncSession):
         super().__init__(Flat, db)
 
-    def get_by_flat_number(self, flat_number: str) -> Optional[Flat]:
-        return self.filter_one(flat_number=flat_number)
+    async def get_by_flat_number(self, flat_number: str) -> Optional[Flat]:
+        return await self.filter_one(flat_number=flat_number)
 
-class ResidentRepository(BaseRepository[Resident]):
+class ResidentRepository(AsyncBaseRepository[Resident]):
     """Resident-specific repository"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         super().__init__(Resident, db)
 
-    def get_by_user(self, user_id) -> Optional[Resident]:
+    async def get_by_user(self, user_id) -> Optional[Resident]:
         """Get resident by user ID"""
-        return self.filter_one(user_id=user_id)
+        return await self.filter_one(user_id=user_id)
 
-    def get_pending_approvals(self, skip: int = 0, limit: int = 50) -> List[Resident]:
+    async def get_pending_approvals(
+        self, cursor: Optional[str] = None, limit: int = 50
+    ) -> PageResult[Resident]:
         """Get pending resident approvals"""
-        return self.db.query(self.model).filter(
-            self.model.status == ResidentStatus.PENDING
-        ).offset(skip).limit(limit).all()
+        return await self.read_page(
+            self.model.status == ResidentStatus.PENDING, cursor=cursor, limit=limit
+        )
 
-    def approve_resident(self, resident_id) -> Optional[Resident]:
+    async def approve_resident(self, resident_id) -> Optional[Resident]:
         """Approve resident"""
-        return self.update(resident_id, {"status": ResidentStatus.APPROVED})
+        return await self.update(resident_id, {"status": ResidentStatus.APPROVED})
 
-    def reject_resident(self, resident_id, notes: str) -> Optional[Resident]:
+    async def reject_resident(self, resident_id, notes: str) -> Optional[Resident]:
         """Reject resident"""
-        return self.update(resident_id, {
+        return await self.update(resident_id, {
             "status": ResidentStatus.REJECTED,
             "approval_notes": notes
         })
@@ -0,0 +1,157 @@
+# backend/app/repositories/search_repository.py
+from app.models.ticket import Ticket
+from app.models.notice import Notice
+from app.models.visitor import VisitorLog
+from app.core.constants import SearchType
+from app.core.pagination import PageResult, encode_rank_cursor, decode_rank_cursor
+from sqlalchemy import Float, String, case, cast, func, literal, or_, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Collection, Optional
+import re
+
+# ts_rank_cd normalization 32 maps ranks into [0, 1), the same range as
+# pg_trgm similarity, so hits of different types sort sensibly together
+RANK_NORMALIZATION = 32
+
+# Trigram matching needs at least this many characters to use the index
+MIN_TRIGRAM_LENGTH = 3
+
+def prefix_tsquery(config: str, text: str):
+    """tsquery matching every word of text as a prefix (search-as-you-type).
+
+    Only word characters are kept, so user input can't inject tsquery
+    syntax. Returns None if nothing searchable is left.
+    """
+    words = re.findall(r"\w+", text.lower())
+    if not words:
+        return None
+    return func.to_tsquery(config, " & ".join(f"{word}:*" for word in words))
+
+def _rank(vector, query):
+    return func.ts_rank_cd(vector, query, RANK_NORMALIZATION)
+
+def _best(*ranks):
+    """Best of several ranks, as double precision in every branch so the
+    union column (and the cursor) has one exact type"""
+    return cast(func.greatest(*ranks) if len(ranks) > 1 else ranks[0], Float).label("rank")
+
+class SearchRepository:
+    """Ranked full-text search across tickets, notices and visitor logs.
+
+    Words go through the GIN-indexed search_vector columns; phone and
+    vehicle numbers through pg_trgm indexes, so nothing is an ILIKE scan.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _tickets(self, text: str, since: Optional[datetime]):
+        query = prefix_tsquery("english", text)
+        if query is None:
+            return None
+        # A quoted ticket number is the best possible hit
+        number = text.strip().upper()
+        stmt = select(
+            cast(literal(SearchType.TICKETS.value), String).label("type"),
+            Ticket.id.label("id"),
+            Ticket.title.label("title"),
+            Ticket.ticket_number.label("detail"),
+            _best(
+                _rank(Ticket.search_vector, query),
+                case((Ticket.ticket_number == number, 1.0), else_=0.0)
+            ),
+            Ticket.created_at.label("created_at"),
+        ).where(or_(
+            Ticket.search_vector.op("@@")(query),
+            Ticket.ticket_number == number
+        ))
+        if since is not None:
+            stmt = stmt.where(Ticket.created_at >= since)
+        return stmt
+
+    def _notices(self, text: str, since: Optional[datetime]):
+        query = prefix_tsquery("english", text)
+        if query is None:
+            return None
+        stmt = select(
+            cast(literal(SearchType.NOTICES.value), String).label("type"),
+            Notice.id.label("id"),
+            Notice.title.label("title"),
+            Notice.category.label("detail"),
+            _best(_rank(Notice.search_vector, query)),
+            Notice.created_at.label("created_at"),
+        ).where(Notice.search_vector.op("@@")(query))
+        if since is not None:
+            stmt = stmt.where(Notice.created_at >= since)
+        return stmt
+
+    def _visitors(self, text: str, since: Optional[datetime]):
+        query = prefix_tsquery("simple", text)
+        if query is None:
+            return None
+        digits = re.sub(r"\D", "", text)
+        plate = re.sub(r"[^A-Za-z0-9]", "", text).upper()
+        matches = [VisitorLog.search_vector.op("@@")(query)]
+        ranks = [_rank(VisitorLog.search_vector, query)]
+        if len(digits) >= MIN_TRIGRAM_LENGTH:
+            matches.append(VisitorLog.visitor_phone.contains(digits, autoescape=True))
+            ranks.append(func.similarity(VisitorLog.visitor_phone, digits))
+        if len(plate) >= MIN_TRIGRAM_LENGTH:
+            # Fuzzy: plates are typed with and without spaces or dashes
+            matches.append(VisitorLog.vehicle_number.op("%")(plate))
+            matches.append(VisitorLog.vehicle_number.icontains(plate, autoescape=True))
+            ranks.append(func.similarity(VisitorLog.vehicle_number, plate))
+        stmt = select(
+            cast(literal(SearchType.VISITORS.value), String).label("type"),
+            VisitorLog.id.label("id"),
+            VisitorLog.visitor_name.label("title"),
+            VisitorLog.visitor_phone.label("detail"),
+            _best(*ranks),
+            VisitorLog.created_at.label("created_at"),
+        ).where(or_(*matches))
+        if since is not None:
+            # Bounding entry_time prunes old partitions
+            stmt = stmt.where(VisitorLog.entry_time >= since)
+        return stmt
+
+    async def search(
+        self,
+        text: str,
+        types: Collection[SearchType],
+        since: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> PageResult:
+        """Hits of the requested types, best match first.
+
+        Keyset over (rank, id) descending; ranks are recomputed the same
+        way on every page, so the cursor stays exact.
+        """
+        builders = {
+            SearchType.TICKETS: self._tickets,
+            SearchType.NOTICES: self._notices,
+            SearchType.VISITORS: self._visitors,
+        }
+        selects = [
+            stmt for stmt in (builders[t](text, since) for t in types)
+            if stmt is not None
+        ]
+        if not selects:
+            return PageResult()
+
+        hits = union_all(*selects).subquery("hits")
+        stmt = select(hits)
+        if cursor:
+            rank, id = decode_rank_cursor(cursor)
+            stmt = stmt.where(tuple_(hits.c.rank, hits.c.id) < tuple_(rank, id))
+        stmt = stmt.order_by(hits.c.rank.desc(), hits.c.id.desc()).limit(limit + 1)
+
+        result = await self.db.execute(stmt)
+        items = list(result.mappings().all())
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_rank_cursor(items[-1]["rank"], items[-1]["id"])
+        return PageResult(items=items, next_cursor=next_cursor)
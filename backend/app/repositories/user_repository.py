@@ -1,33 +1,36 @@
 # backend/app/repositories/user_repository.py
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import AsyncBaseRepository
 from app.models.user import User
-from sqlalchemy.orm import Session
+from app.core.pagination import PageResult
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-class UserRepository(BaseRepository[User]):
+class UserRepository(AsyncBaseRepository[User]):
     """User-specific repository"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         super().__init__(User, db)
 
-    def get_by_email(self, email: str) -> Optional[User]:
+    async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        return self.filter_one(email=email)
+        return await self.filter_one(email=email)
 
-    def get_by_username(self, username: str) -> Optional[User]:
+    async def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username"""
-        return self.filter_one(username=username)
+        return await self.filter_one(username=username)
 
-    def get_active_users(self, skip: int = 0, limit: int = 100):
+    async def get_active_users(
+        self, cursor: Optional[str] = None, limit: int = 100
+    ) -> PageResult[User]:
         """Get active users"""
-        return self.db.query(self.model).filter(
-            self.model.is_active == True
-        ).offset(skip).limit(limit).all()
+        return await self.read_page(
+            self.model.is_active == True, cursor=cursor, limit=limit
+        )
 
-    def deactivate_user(self, user_id) -> Optional[User]:
+    async def deactivate_user(self, user_id) -> Optional[User]:
         """Deactivate user"""
-        return self.update(user_id, {"is_active": False})
+        return await self.update(user_id, {"is_active": False})
 
-    def verify_user(self, user_id) -> Optional[User]:
+    async def verify_user(self, user_id) -> Optional[User]:
         """Mark user as verified"""
-        return self.update(user_id, {"is_verified": True})
+        return await self.update(user_id, {"is_verified": True})
@@ -0,0 +1,129 @@
+# backend/app/repositories/visitor_repository.py
+from app.repositories.base_repository import AsyncBaseRepository
+from app.models.visitor import VisitorLog
+from app.models.resident import Flat
+from sqlalchemy import DateTime, String, and_, bindparam, column, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Sequence, Set
+from datetime import datetime
+
+class VisitorLogRepository(AsyncBaseRepository[VisitorLog]):
+    """Visitor log repository; every statement bounds entry_time for pruning"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(VisitorLog, db)
+
+    async def check_in(self, values: dict) -> VisitorLog:
+        """Single INSERT ... RETURNING of the new visit"""
+        result = await self.db.execute(
+            insert(self.model).values(**values).returning(self.model)
+        )
+        return result.scalar_one()
+
+    async def check_out(
+        self,
+        pass_code: str,
+        entered_since: datetime,
+        exit_time: datetime,
+        notes: Optional[str] = None
+    ) -> Optional[VisitorLog]:
+        """Close the latest open visit with this pass code in one UPDATE.
+
+        The lookup is served by the partial idx_visitor_open_pass index and
+        only touches partitions from entered_since on.
+        """
+        open_visit = (
+            select(self.model.id, self.model.entry_time)
+            .where(
+                self.model.pass_code == pass_code,
+                self.model.exit_time.is_(None),
+                self.model.entry_time >= entered_since
+            )
+            .order_by(self.model.entry_time.desc())
+            .limit(1)
+        )
+        values = {"exit_time": exit_time, "updated_at": func.now()}
+        if notes is not None:
+            values["notes"] = notes
+        result = await self.db.execute(
+            update(self.model)
+            .where(
+                self.model.entry_time >= entered_since,
+                self.model.exit_time.is_(None),
+                tuple_(self.model.id, self.model.entry_time).in_(open_visit)
+            )
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalars().first()
+
+    async def existing_flat_ids(self, flat_ids: Set) -> Set:
+        result = await self.db.execute(select(Flat.id).where(Flat.id.in_(flat_ids)))
+        return set(result.scalars().all())
+
+    async def upsert_synced(self, rows: Sequence[dict]) -> List:
+        """Insert offline entries in one statement; returns the rows written.
+
+        Re-uploads hit the (id, entry_time) key and are skipped, except
+        that an exit recorded since the last upload is filled in.
+        """
+        stmt = pg_insert(self.model).values(list(rows))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["id", "entry_time"],
+            set_={"exit_time": stmt.excluded.exit_time, "updated_at": func.now()},
+            where=and_(
+                self.model.exit_time.is_(None),
+                stmt.excluded.exit_time.isnot(None)
+            )
+        ).returning(
+            self.model.id,
+            self.model.flat_id,
+            self.model.visitor_name,
+            self.model.purpose,
+            self.model.vehicle_number,
+            self.model.pass_code,
+            self.model.entry_time,
+            self.model.exit_time,
+        )
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
+    async def apply_synced_exits(self, exits: Sequence[dict], entered_since: datetime) -> List:
+        """Close open visits by pass code for a batch of offline exits.
+
+        Like check_out, each exit closes only the latest open visit with
+        its pass code that entered before it; pass codes must be unique
+        within the batch. Returns (id, flat_id) of the visits closed.
+        """
+        incoming = (
+            func.jsonb_to_recordset(bindparam("exits", list(exits), type_=JSONB))
+            .table_valued(column("pass_code", String), column("exit_time", DateTime))
+            .render_derived(name="incoming", with_types=True)
+        )
+        latest_open = (
+            select(self.model.id, self.model.entry_time, incoming.c.exit_time)
+            .distinct(incoming.c.pass_code)
+            .where(
+                self.model.pass_code == incoming.c.pass_code,
+                self.model.exit_time.is_(None),
+                self.model.entry_time >= entered_since,
+                self.model.entry_time <= incoming.c.exit_time
+            )
+            .order_by(incoming.c.pass_code, self.model.entry_time.desc())
+            .subquery("latest_open")
+        )
+        result = await self.db.execute(
+            update(self.model)
+            .where(
+                self.model.id == latest_open.c.id,
+                self.model.entry_time == latest_open.c.entry_time,
+                self.model.entry_time >= entered_since,
+                self.model.exit_time.is_(None)
+            )
+            .values(exit_time=latest_open.c.exit_time, updated_at=func.now())
+            .returning(self.model.id, self.model.flat_id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.all())
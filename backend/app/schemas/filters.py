@@ -0,0 +1,15 @@
+# backend/app/schemas/filters.py
+from pydantic import BaseModel, model_validator
+from typing import Optional
+from datetime import date
+
+class DateRange(BaseModel):
+    """Half-open date range filter: start <= value < end"""
+    start: Optional[date] = None
+    end: Optional[date] = None
+
+    @model_validator(mode="after")
+    def check_order(self) -> "DateRange":
+        if self.start and self.end and self.end <= self.start:
+            raise ValueError("end must be after start")
+        return self
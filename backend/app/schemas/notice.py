@@ -0,0 +1,54 @@
+# backend/app/schemas/notice.py
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from uuid import UUID
+from app.core.constants import NoticeStatus
+from datetime import datetime
+
+class NoticeCreate(BaseModel):
+    title: str = Field(..., min_length=3, max_length=255)
+    content: str
+    category: str
+    expiry_date: Optional[datetime] = None
+    attachment_url: Optional[str] = None
+    building_section: Optional[str] = Field(None, max_length=50)  # None: every section
+
+class NoticeResponse(NoticeCreate):
+    id: UUID
+    published_by_id: UUID
+    status: NoticeStatus
+    published_date: Optional[datetime]
+    feed_version: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class NoticeFeedItem(BaseModel):
+    """Notice as shown on the board"""
+    id: UUID
+    title: str
+    content: str
+    category: str
+    building_section: Optional[str] = None
+    attachment_url: Optional[str] = None
+    published_date: datetime
+    expiry_date: Optional[datetime] = None
+    feed_version: int
+
+    class Config:
+        from_attributes = True
+
+class NoticeFeed(BaseModel):
+    """Notice board for a section.
+
+    With full=False, notices only holds what changed since the requested
+    version and removed the ids to drop. Expired notices are archived
+    shortly after their expiry_date and then appear in removed.
+    """
+    version: int
+    section: Optional[str] = None
+    full: bool
+    notices: List[NoticeFeedItem]
+    removed: List[UUID] = Field(default_factory=list)
@@ -0,0 +1,12 @@
+# backend/app/schemas/pagination.py
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,82 @@
+# backend/app/schemas/payment.py
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional
+from uuid import UUID
+from app.core.constants import PaymentStatus, LedgerEntryType, LedgerAccount
+from datetime import date, datetime
+
+class MonthlyFeeResponse(BaseModel):
+    id: UUID
+    flat_id: UUID
+    month_year: date
+    base_amount: int
+    maintenance_charge: Optional[int]
+    water_charge: Optional[int]
+    other_charges: Optional[int]
+    penalty_amount: Optional[int]
+    due_date: date
+    status: PaymentStatus
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class PaymentResponse(BaseModel):
+    id: UUID
+    resident_id: UUID
+    fee_id: UUID
+    amount: int
+    payment_method: str
+    transaction_id: str
+    status: PaymentStatus
+    payment_date: datetime
+    receipt_url: Optional[str]
+    notes: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class FlatBalanceResponse(BaseModel):
+    flat_id: UUID
+    balance: int
+    total_billed: int
+    total_paid: int
+    last_posted_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class LedgerEntryResponse(BaseModel):
+    id: UUID
+    flat_id: UUID
+    entry_type: LedgerEntryType
+    debit_account: LedgerAccount
+    credit_account: LedgerAccount
+    amount: int
+    fee_id: Optional[UUID]
+    payment_id: Optional[UUID]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class PaymentCallback(BaseModel):
+    """Payment gateway webhook body"""
+    transaction_id: str = Field(..., min_length=1, max_length=255)
+    status: PaymentStatus
+    fee_id: UUID
+    resident_id: UUID
+    amount: int = Field(..., gt=0)
+    payment_method: str = Field(..., max_length=50)
+    paid_at: datetime
+    receipt_url: Optional[str] = Field(None, max_length=255)
+
+    @field_validator("status")
+    @classmethod
+    def check_status(cls, v: PaymentStatus) -> PaymentStatus:
+        if v not in (PaymentStatus.COMPLETED, PaymentStatus.FAILED):
+            raise ValueError("status must be completed or failed")
+        return v
@@ -3,7 +3,7 @@ from pydantic import BaseModel, Field
 from typing import Optional
 from uuid import UUID
 from app.core.constants import ResidentStatus
-from datetime import datetime
+from datetime import date, datetime
 
 class FlatBase(BaseModel):
     flat_number: str
@@ -22,7 +22,7 @@ class FlatResponse(FlatBase):
 
 class ResidentBase(BaseModel):
     flat_id: UUID
-    move_in_date: Optional[str] = None
+    move_in_date: Optional[date] = None
     family_members: int = 1
     vehicle_details: Optional[str] = None
     emergency_contact: Optional[str] = None
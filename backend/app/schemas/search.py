@@ -0,0 +1,16 @@
+# backend/app/schemas/search.py
+from pydantic import BaseModel
+from typing import Optional
+from uuid import UUID
+from datetime import datetime
+from app.core.constants import SearchType
+
+class SearchHit(BaseModel):
+    """One search result; detail is the ticket number, notice category
+    or visitor phone"""
+    type: SearchType
+    id: UUID
+    title: str
+    detail: Optional[str] = None
+    rank: float
+    created_at: datetime
@@ -1,6 +1,6 @@
 # backend/app/schemas/visitor.py
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -17,13 +17,57 @@ class VisitorLogExit(BaseModel):
     exit_time: datetime
     notes: Optional[str] = None
 
+class VisitorCheckOut(BaseModel):
+    pass_code: str = Field(..., min_length=4, max_length=8)
+    notes: Optional[str] = None
+
 class VisitorLogResponse(VisitorLogCreate):
     id: UUID
     security_id: UUID
     entry_time: datetime
     exit_time: Optional[datetime]
+    pass_code: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
+
+class VisitorSyncEntry(VisitorLogCreate):
+    """Entry recorded offline; id is generated on the device (idempotency)"""
+    id: UUID
+    entry_time: datetime
+    exit_time: Optional[datetime] = None
+    pass_code: Optional[str] = Field(None, min_length=4, max_length=8)
+
+class VisitorSyncExit(BaseModel):
+    """Offline exit of a visit checked in online"""
+    pass_code: str = Field(..., min_length=4, max_length=8)
+    exit_time: datetime
+
+class VisitorSyncRequest(BaseModel):
+    entries: List[VisitorSyncEntry] = Field(default_factory=list)
+    exits: List[VisitorSyncExit] = Field(default_factory=list)
+
+class VisitorSyncResponse(BaseModel):
+    accepted: int
+    duplicates: int
+    rejected: List[UUID]
+    exits_applied: int
+
+class VisitorInside(BaseModel):
+    """Entry in the visitors-inside index"""
+    id: UUID
+    flat_id: UUID
+    visitor_name: str
+    purpose: str
+    vehicle_number: Optional[str] = None
+    pass_code: Optional[str] = None
+    entry_time: datetime
+
+class VisitorCount(BaseModel):
+    inside: int
+    flat_id: Optional[UUID] = None
+
+class VisitorsInsideResponse(VisitorCount):
+    visitors: List[VisitorInside]
@@ -1,45 +1,53 @@
 # backend/app/services/base_service.py
 from abc import ABC, abstractmethod
 from typing import Optional, List, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.unit_of_work import UnitOfWork
 
 class IService(ABC):
     """Interface defining service contract (Interface Segregation)"""
     
     @abstractmethod
-    def create(self, data: dict) -> Any:
+    async def create(self, data: dict) -> Any:
         pass
     
     @abstractmethod
-    def read(self, id: Any) -> Optional[Any]:
+    async def read(self, id: Any) -> Optional[Any]:
         pass
     
     @abstractmethod
-    def update(self, id: Any, data: dict) -> Optional[Any]:
+    async def update(self, id: Any, data: dict) -> Optional[Any]:
         pass
     
     @abstractmethod
-    def delete(self, id: Any) -> bool:
+    async def delete(self, id: Any) -> bool:
         pass
 
 class BaseService(IService):
     """Base service class (Single Responsibility)"""
     
-    def __init__(self, repository, db: Session):
+    def __init__(self, repository, db: AsyncSession):
         self.repository = repository
         self.db = db
 
-    def create(self, data: dict) -> Any:
-        return self.repository.create(data)
+    def transaction(self) -> UnitOfWork:
+        """Unit of work for this request's session (commits once, outermost)"""
+        return UnitOfWork.for_session(self.db)
 
-    def read(self, id: Any) -> Optional[Any]:
-        return self.repository.read(id)
+    async def create(self, data: dict) -> Any:
+        async with self.transaction():
+            return await self.repository.create(data)
 
-    def update(self, id: Any, data: dict) -> Optional[Any]:
-        return self.repository.update(id, data)
+    async def read(self, id: Any) -> Optional[Any]:
+        return await self.repository.read(id)
 
-    def delete(self, id: Any) -> bool:
-        return self.repository.delete(id)
+    async def update(self, id: Any, data: dict) -> Optional[Any]:
+        async with self.transaction():
+            return await self.repository.update(id, data)
 
-    def get_all(self, skip: int = 0, limit: int = 100):
-        return self.repository.read_all(skip, limit)
+    async def delete(self, id: Any) -> bool:
+        async with self.transaction():
+            return await self.repository.delete(id)
+
+    async def get_all(self, cursor: Optional[str] = None, limit: int = 100):
+        return await self.repository.read_all(cursor, limit)
@@ -0,0 +1,135 @@
+# backend/app/services/billing_service.py
+from dataclasses import dataclass
+from datetime import date
+from sqlalchemy import BigInteger, Date, Text, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.models.payment import MonthlyFee
+from app.models.resident import Flat
+from app.models.outbox import OutboxEvent
+from app.events.events import FeeGeneratedEvent
+from app.services.ledger_service import LedgerService
+from app.core.constants import PaymentStatus
+from app.core.exceptions import InvalidData
+from app.config import settings
+import calendar
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+MONTH_YEAR_PATTERN = re.compile(r"^(0[1-9]|1[0-2])-\d{4}$")
+
+@dataclass
+class ChargeRules:
+    """How a flat's monthly fee is computed"""
+    rate_per_sqft: int
+    maintenance_charge: int
+    water_charge: int
+    other_charges: int
+    due_day: int
+
+    @classmethod
+    def from_settings(cls, **overrides) -> "ChargeRules":
+        rules = cls(
+            rate_per_sqft=settings.BILLING_RATE_PER_SQFT,
+            maintenance_charge=settings.BILLING_MAINTENANCE_CHARGE,
+            water_charge=settings.BILLING_WATER_CHARGE,
+            other_charges=settings.BILLING_OTHER_CHARGES,
+            due_day=settings.BILLING_DUE_DAY
+        )
+        for key, value in overrides.items():
+            setattr(rules, key, value)
+        return rules
+
+class BillingService:
+    """Monthly fee generation (sync session; runs in Celery workers)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def generate_monthly_fees(self, month_year: str, rules: ChargeRules) -> int:
+        """Create this month's fee for every flat in one statement.
+
+        A single INSERT ... SELECT over flats computes every charge in SQL.
+        ON CONFLICT (flat_id, month_year) DO NOTHING makes re-runs
+        idempotent, and a FeeGeneratedEvent is written to the outbox for
+        each fee actually inserted, in the same statement and transaction.
+        The new fees are posted to the ledger before the commit.
+        Returns the number of fees created.
+        """
+        if not MONTH_YEAR_PATTERN.match(month_year):
+            raise InvalidData("month_year must be MM-YYYY")
+        month, year = (int(part) for part in month_year.split("-"))
+        billing_month = date(year, month, 1)
+        # A due day past the month's end (31 in April) falls on its last day
+        due_date = date(year, month, min(rules.due_day, calendar.monthrange(year, month)[1]))
+
+        base_amount = Flat.area_sqft * rules.rate_per_sqft
+        new_fees = (
+            pg_insert(MonthlyFee)
+            .from_select(
+                [
+                    "id", "flat_id", "month_year", "base_amount", "maintenance_charge",
+                    "water_charge", "other_charges", "penalty_amount", "due_date", "status",
+                ],
+                select(
+                    func.gen_random_uuid(),
+                    Flat.id,
+                    literal(billing_month, Date),
+                    base_amount,
+                    literal(rules.maintenance_charge),
+                    literal(rules.water_charge),
+                    literal(rules.other_charges),
+                    literal(0),
+                    literal(due_date, Date),
+                    literal(PaymentStatus.PENDING, MonthlyFee.status.type),
+                )
+            )
+            .on_conflict_do_nothing(index_elements=["flat_id", "month_year"])
+            .returning(
+                MonthlyFee.id,
+                MonthlyFee.flat_id,
+                MonthlyFee.month_year,
+                MonthlyFee.due_date,
+                (
+                    MonthlyFee.base_amount + MonthlyFee.maintenance_charge
+                    + MonthlyFee.water_charge + MonthlyFee.other_charges
+                ).label("amount_due"),
+            )
+            .cte("new_fees")
+        )
+
+        # Same envelope as BaseEvent.to_dict(), built in SQL; the event id is
+        # generated once per row so the outbox id matches the payload
+        fees = select(
+            new_fees, func.gen_random_uuid().label("event_id")
+        ).subquery("fees")
+        events = select(
+            fees.c.event_id,
+            literal(FeeGeneratedEvent.event_type.value),
+            literal(0),
+            func.jsonb_build_object(
+                "event_id", cast(fees.c.event_id, Text),
+                "event_type", FeeGeneratedEvent.event_type.value,
+                "schema_version", FeeGeneratedEvent.schema_version,
+                "timestamp", cast(func.extract("epoch", func.clock_timestamp()) * 1e9, BigInteger),
+                "data", func.jsonb_build_object(
+                    "fee_id", fees.c.id,
+                    "flat_id", fees.c.flat_id,
+                    "month_year", fees.c.month_year,
+                    "due_date", fees.c.due_date,
+                    "amount_due", fees.c.amount_due,
+                ),
+            ),
+        )
+
+        result = self.db.execute(
+            pg_insert(OutboxEvent).from_select(
+                ["id", "event_type", "attempts", "payload"], events, include_defaults=False
+            )
+        )
+        LedgerService(self.db).post_fees(MonthlyFee.month_year == billing_month)
+        self.db.commit()
+        logger.info(f"Billing {month_year}: generated {result.rowcount} fees")
+        return result.rowcount
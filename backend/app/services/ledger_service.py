@@ -0,0 +1,313 @@
+# backend/app/services/ledger_service.py
+from sqlalchemy import case, cast, exists, func, null, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.models.ledger import LedgerEntry, FlatBalance
+from app.models.payment import MonthlyFee, Payment
+from app.models.resident import Flat
+from app.core.constants import LedgerAccount, LedgerEntryType, PaymentStatus
+import logging
+
+logger = logging.getLogger(__name__)
+
+POSTING_COLUMNS = [
+    "id", "flat_id", "entry_type", "debit_account", "credit_account", "amount", "fee_id", "payment_id",
+]
+
+# Charges on a fee before penalty
+fee_total = (
+    MonthlyFee.base_amount
+    + func.coalesce(MonthlyFee.maintenance_charge, 0)
+    + func.coalesce(MonthlyFee.water_charge, 0)
+    + func.coalesce(MonthlyFee.other_charges, 0)
+)
+
+# Cast explicitly: inside CASE an untyped parameter would resolve to text
+def _account(account: LedgerAccount):
+    return cast(account, LedgerEntry.debit_account.type)
+
+def _entry_type(entry_type: LedgerEntryType):
+    return cast(entry_type, LedgerEntry.entry_type.type)
+
+def _receivable_side(delta, debit: LedgerAccount):
+    """Debit/credit accounts for a signed receivable change (+ raises it)"""
+    return (
+        case((delta > 0, _account(LedgerAccount.RECEIVABLE)), else_=_account(debit)),
+        case((delta > 0, _account(debit)), else_=_account(LedgerAccount.RECEIVABLE)),
+    )
+
+def _balance_effects(entry):
+    """Effect of a posting on a flat's balance, total billed and total paid"""
+    delta = case(
+        (entry.debit_account == LedgerAccount.RECEIVABLE, entry.amount),
+        (entry.credit_account == LedgerAccount.RECEIVABLE, -entry.amount),
+        else_=0
+    )
+    billed = case(
+        (entry.entry_type.in_([LedgerEntryType.FEE, LedgerEntryType.PENALTY]), delta),
+        else_=0
+    )
+    paid = case((entry.entry_type == LedgerEntryType.PAYMENT, -delta), else_=0)
+    return delta, billed, paid
+
+class LedgerService:
+    """Double-entry ledger with a materialized per-flat balance (sync session).
+
+    Every posting moves ``amount`` from the credit account to the debit
+    account and, in the same statement, adds its effect on RECEIVABLE to
+    the flat's row in flat_balances. Balances are therefore updated
+    incrementally and always agree with the ledger; ``reconcile`` checks
+    them against the raw fee/payment rows.
+
+    Postings are set-based (INSERT ... SELECT) and don't commit: they join
+    the caller's transaction, next to the change they record.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def post_fees(self, *criteria) -> int:
+        """Post RECEIVABLE/FEE_INCOME for matching fees not yet posted"""
+        postings = select(
+            func.gen_random_uuid(),
+            MonthlyFee.flat_id,
+            _entry_type(LedgerEntryType.FEE),
+            _account(LedgerAccount.RECEIVABLE),
+            _account(LedgerAccount.FEE_INCOME),
+            fee_total,
+            MonthlyFee.id,
+            null(),
+        ).where(
+            *criteria,
+            fee_total > 0,
+            ~exists().where(
+                LedgerEntry.fee_id == MonthlyFee.id,
+                LedgerEntry.entry_type == LedgerEntryType.FEE
+            )
+        )
+        return self._post(postings)
+
+    def post_penalties(self, *criteria) -> int:
+        """Post the difference between each fee's penalty and what's posted.
+
+        Penalties are recomputed rather than accrued, so the posting is the
+        delta (negative deltas reverse). Matching fee rows are locked first,
+        in a statement of their own: under READ COMMITTED the delta query
+        then takes a fresh snapshot that includes whatever a concurrent run
+        posted before releasing the lock, so the same delta isn't posted
+        twice.
+        """
+        locked = select(MonthlyFee.id).where(*criteria).with_for_update().subquery()
+        self.db.execute(select(func.count()).select_from(locked))
+
+        signed = case(
+            (LedgerEntry.debit_account == LedgerAccount.RECEIVABLE, LedgerEntry.amount),
+            else_=-LedgerEntry.amount
+        )
+        posted = (
+            select(func.coalesce(func.sum(signed), 0))
+            .where(
+                LedgerEntry.fee_id == MonthlyFee.id,
+                LedgerEntry.entry_type == LedgerEntryType.PENALTY
+            )
+            .scalar_subquery()
+        )
+        deltas = (
+            select(
+                MonthlyFee.id,
+                MonthlyFee.flat_id,
+                (func.coalesce(MonthlyFee.penalty_amount, 0) - posted).label("delta")
+            )
+            .where(*criteria)
+            .subquery("deltas")
+        )
+        postings = select(
+            func.gen_random_uuid(),
+            deltas.c.flat_id,
+            _entry_type(LedgerEntryType.PENALTY),
+            *_receivable_side(deltas.c.delta, LedgerAccount.PENALTY_INCOME),
+            func.abs(deltas.c.delta),
+            deltas.c.id,
+            null(),
+        ).where(deltas.c.delta != 0)
+        return self._post(postings)
+
+    def post_payments(self, *criteria) -> int:
+        """Post CASH/RECEIVABLE for matching completed payments not yet posted"""
+        postings = (
+            select(
+                func.gen_random_uuid(),
+                MonthlyFee.flat_id,
+                _entry_type(LedgerEntryType.PAYMENT),
+                _account(LedgerAccount.CASH),
+                _account(LedgerAccount.RECEIVABLE),
+                Payment.amount,
+                Payment.fee_id,
+                Payment.id,
+            )
+            .join(MonthlyFee, MonthlyFee.id == Payment.fee_id)
+            .where(
+                *criteria,
+                Payment.status == PaymentStatus.COMPLETED,
+                Payment.amount > 0,
+                ~exists().where(
+                    LedgerEntry.payment_id == Payment.id,
+                    LedgerEntry.entry_type == LedgerEntryType.PAYMENT
+                )
+            )
+        )
+        return self._post(postings)
+
+    def reconcile(self) -> dict:
+        """Check the ledger against the raw rows and balances against the ledger.
+
+        Unposted fees, penalties and payments are posted first, so only
+        genuine drift is left. A flat whose ledger disagrees with its fee
+        and payment rows gets one ADJUSTMENT posting for the difference;
+        a balance row that disagrees with its ledger is rebuilt from it.
+        """
+        self.post_fees()
+        self.post_penalties()
+        self.post_payments()
+
+        expected = self._expected_balances()
+        ledger = self._ledger_totals()
+        drift = (
+            select(
+                expected.c.flat_id,
+                (
+                    expected.c.billed - expected.c.paid
+                    - func.coalesce(ledger.c.balance, 0)
+                ).label("drift")
+            )
+            .outerjoin(ledger, ledger.c.flat_id == expected.c.flat_id)
+            .subquery("drift")
+        )
+        adjusted = self._post(
+            select(
+                func.gen_random_uuid(),
+                drift.c.flat_id,
+                _entry_type(LedgerEntryType.ADJUSTMENT),
+                *_receivable_side(drift.c.drift, LedgerAccount.ADJUSTMENTS),
+                func.abs(drift.c.drift),
+                null(),
+                null(),
+            ).where(drift.c.drift != 0)
+        )
+
+        ledger = self._ledger_totals()
+        stmt = pg_insert(FlatBalance).from_select(
+            ["flat_id", "balance", "total_billed", "total_paid"],
+            select(ledger.c.flat_id, ledger.c.balance, ledger.c.billed, ledger.c.paid),
+            include_defaults=False
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["flat_id"],
+            set_={
+                "balance": stmt.excluded.balance,
+                "total_billed": stmt.excluded.total_billed,
+                "total_paid": stmt.excluded.total_paid,
+                "updated_at": func.now(),
+            },
+            where=or_(
+                FlatBalance.balance != stmt.excluded.balance,
+                FlatBalance.total_billed != stmt.excluded.total_billed,
+                FlatBalance.total_paid != stmt.excluded.total_paid
+            )
+        )
+        repaired = self.db.execute(stmt).rowcount
+
+        if adjusted or repaired:
+            logger.warning(
+                f"Ledger reconciliation: {adjusted} flats adjusted, {repaired} balances rebuilt"
+            )
+        return {"adjusted": adjusted, "repaired": repaired}
+
+    @staticmethod
+    def _expected_balances():
+        """Per-flat billed/paid totals computed from the raw rows"""
+        billed = (
+            select(
+                MonthlyFee.flat_id,
+                func.sum(fee_total + func.coalesce(MonthlyFee.penalty_amount, 0)).label("billed")
+            )
+            .group_by(MonthlyFee.flat_id)
+            .subquery("billed")
+        )
+        paid = (
+            select(MonthlyFee.flat_id, func.sum(Payment.amount).label("paid"))
+            .join(MonthlyFee, MonthlyFee.id == Payment.fee_id)
+            .where(Payment.status == PaymentStatus.COMPLETED)
+            .group_by(MonthlyFee.flat_id)
+            .subquery("paid")
+        )
+        return (
+            select(
+                Flat.id.label("flat_id"),
+                func.coalesce(billed.c.billed, 0).label("billed"),
+                func.coalesce(paid.c.paid, 0).label("paid")
+            )
+            .outerjoin(billed, billed.c.flat_id == Flat.id)
+            .outerjoin(paid, paid.c.flat_id == Flat.id)
+            .subquery("expected")
+        )
+
+    @staticmethod
+    def _ledger_totals():
+        """Per-flat balance/billed/paid summed over every posting"""
+        delta, billed, paid = _balance_effects(LedgerEntry.__table__.c)
+        return (
+            select(
+                LedgerEntry.flat_id,
+                func.sum(delta).label("balance"),
+                func.sum(billed).label("billed"),
+                func.sum(paid).label("paid")
+            )
+            .group_by(LedgerEntry.flat_id)
+            .subquery("ledger")
+        )
+
+    def _post(self, postings) -> int:
+        """Insert postings and apply them to flat_balances in one statement.
+
+        ``postings`` selects POSTING_COLUMNS. Conflicting rows (already
+        posted) are skipped and don't touch the balance. Returns the number
+        of flats whose balance row changed.
+        """
+        posted = (
+            pg_insert(LedgerEntry)
+            .from_select(POSTING_COLUMNS, postings, include_defaults=False)
+            .on_conflict_do_nothing()
+            .returning(
+                LedgerEntry.flat_id,
+                LedgerEntry.entry_type,
+                LedgerEntry.debit_account,
+                LedgerEntry.credit_account,
+                LedgerEntry.amount
+            )
+            .cte("posted")
+        )
+        delta, billed, paid = _balance_effects(posted.c)
+
+        stmt = pg_insert(FlatBalance).from_select(
+            ["flat_id", "balance", "total_billed", "total_paid", "last_posted_at"],
+            select(
+                posted.c.flat_id,
+                func.sum(delta),
+                func.sum(billed),
+                func.sum(paid),
+                func.now()
+            ).group_by(posted.c.flat_id),
+            include_defaults=False
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["flat_id"],
+            set_={
+                "balance": FlatBalance.balance + stmt.excluded.balance,
+                "total_billed": FlatBalance.total_billed + stmt.excluded.total_billed,
+                "total_paid": FlatBalance.total_paid + stmt.excluded.total_paid,
+                "last_posted_at": stmt.excluded.last_posted_at,
+                "updated_at": func.now(),
+            }
+        )
+        return self.db.execute(stmt).rowcount
@@ -0,0 +1,128 @@
+# backend/app/services/notice_feed_service.py
+from app.repositories.notice_repository import NoticeRepository
+from app.cache.notice_feed import get_notice_feed_store
+from app.cache.stampede import single_flight
+from app.schemas.notice import NoticeFeedItem
+from app.config import settings
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timezone
+from typing import Optional
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+def strong_etag(body: str) -> str:
+    return '"' + hashlib.sha256(body.encode()).hexdigest()[:32] + '"'
+
+class NoticeFeedService:
+    """Precomputed notice board per building section.
+
+    A section's feed (general notices plus its own) is built once and
+    kept in Redis with its serialized body and ETag; reads never touch
+    the database unless the feed is missing. Publishing or archiving a
+    notice rebuilds only the feeds it appears in (see the event handlers).
+    Every such change takes the next feed version, in commit order, so
+    clients can ask for what changed since the version they hold.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.repository = NoticeRepository(db)
+        self.store = get_notice_feed_store()
+
+    async def build(self, section: Optional[str]) -> dict:
+        """Build a section's feed from the database (not stored)"""
+        now = datetime.now(timezone.utc)
+        # Version first: a notice published in between is resent, not lost
+        version = await self.repository.get_feed_version()
+        notices = await self.repository.get_feed(section, now)
+        removed = await self.repository.get_removed(
+            section, now, settings.NOTICE_FEED_REMOVED_HORIZON
+        )
+        body = json.dumps({
+            "version": version,
+            "section": section,
+            "full": True,
+            "notices": [
+                NoticeFeedItem.model_validate(n).model_dump(mode="json") for n in notices
+            ],
+            "removed": [],
+        }, separators=(",", ":"))
+
+        # Past the horizon, removals older than the oldest one kept are gone
+        complete_since = (
+            removed[-1].feed_version
+            if len(removed) >= settings.NOTICE_FEED_REMOVED_HORIZON else 0
+        )
+        # Keep it no longer than until the first notice on it expires
+        ttl = settings.NOTICE_FEED_TTL
+        expiries = [n.expiry_date for n in notices if n.expiry_date is not None]
+        if expiries:
+            ttl = max(1, min(ttl, int((min(expiries) - now).total_seconds()) + 1))
+        return {
+            "version": version,
+            "etag": strong_etag(body),
+            "body": body,
+            "removed": json.dumps([[str(r.id), r.feed_version] for r in removed]),
+            "complete_since": complete_since,
+            "ttl": ttl,
+        }
+
+    async def refresh(self, section: Optional[str]) -> dict:
+        """Rebuild and store a section's feed"""
+        feed = await self.build(section)
+        try:
+            await self.store.put(section, feed, feed["ttl"])
+        except Exception as e:
+            logger.error(f"Notice feed store failed for section {section!r}: {e}")
+        return feed
+
+    async def refresh_affected(self, section: Optional[str]) -> int:
+        """Rebuild the feeds a notice for `section` appears in.
+
+        A general notice (section None) is on every section's board.
+        """
+        sections = {section}
+        if section is None:
+            sections.update(await self.store.sections())
+        for name in sections:
+            await self.refresh(name)
+        logger.info(f"Refreshed {len(sections)} notice feed(s) for section {section!r}")
+        return len(sections)
+
+    async def get(self, section: Optional[str], *fields: str) -> dict:
+        """A section's stored feed, built on a miss (once per process)"""
+        try:
+            feed = await self.store.get(section, *fields)
+        except Exception as e:
+            logger.error(f"Notice feed read failed for section {section!r}: {e}")
+            return await self.build(section)
+        if feed is not None:
+            return feed
+
+        key = f"notice_feed:{section}"
+        if single_flight.in_flight(key):
+            return await single_flight.wait(key)
+        return await single_flight.run(key, lambda: self.refresh(section))
+
+    async def delta(self, section: Optional[str], since: int) -> str:
+        """Feed body with only what changed after version `since`.
+
+        Falls back to the full feed when removals that old are no longer
+        kept, or `since` isn't a version this feed has reached.
+        """
+        feed = await self.get(section, "version", "body", "removed", "complete_since")
+        version = int(feed["version"])
+        if not int(feed["complete_since"]) <= since <= version:
+            return feed["body"]
+
+        full = json.loads(feed["body"])
+        removed = json.loads(feed["removed"])
+        return json.dumps({
+            "version": version,
+            "section": section,
+            "full": False,
+            "notices": [n for n in full["notices"] if n["feed_version"] > since],
+            "removed": [id for id, feed_version in removed if feed_version > since],
+        }, separators=(",", ":"))
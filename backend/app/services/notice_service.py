@@ -0,0 +1,73 @@
+# backend/app/services/notice_service.py
+from app.services.base_service import BaseService
+from app.repositories.notice_repository import NoticeRepository
+from app.models.notice import notice_feed_version_seq
+from app.core.constants import NoticeStatus
+from app.events.events import NoticePublishedEvent, NoticeArchivedEvent
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+import logging
+
+logger = logging.getLogger(__name__)
+
+class NoticeService(BaseService):
+    """Notice service"""
+
+    def __init__(self, repository: NoticeRepository, db: AsyncSession):
+        super().__init__(repository, db)
+        self.repository = repository
+
+    async def create_notice(self, published_by_id: UUID, data: dict):
+        """Create a draft notice"""
+        return await self.create({
+            **data,
+            "published_by_id": published_by_id,
+            "status": NoticeStatus.DRAFT,
+        })
+
+    async def publish(self, notice_id: UUID):
+        """Put a draft on the board; None if there is no such draft"""
+        async with self.transaction() as uow:
+            await self.repository.lock_feed_versions()
+            notice = await self.repository.update_where(
+                self.repository.model.id == notice_id,
+                self.repository.model.status == NoticeStatus.DRAFT,
+                values={
+                    "status": NoticeStatus.PUBLISHED,
+                    "published_date": func.now(),
+                    "feed_version": notice_feed_version_seq.next_value(),
+                }
+            )
+            if notice:
+                # Feeds are rebuilt from this event (via the outbox)
+                uow.add_event(NoticePublishedEvent(self._event_data(notice)))
+        if notice:
+            logger.info(f"Notice published: {notice.id} (feed version {notice.feed_version})")
+        return notice
+
+    async def archive(self, notice_id: UUID):
+        """Take a notice off the board; None if it is already archived"""
+        async with self.transaction() as uow:
+            await self.repository.lock_feed_versions()
+            notice = await self.repository.update_where(
+                self.repository.model.id == notice_id,
+                self.repository.model.status != NoticeStatus.ARCHIVED,
+                values={
+                    "status": NoticeStatus.ARCHIVED,
+                    "feed_version": notice_feed_version_seq.next_value(),
+                }
+            )
+            if notice:
+                uow.add_event(NoticeArchivedEvent(self._event_data(notice)))
+        return notice
+
+    @staticmethod
+    def _event_data(notice) -> dict:
+        return {
+            "notice_id": notice.id,
+            "title": notice.title,
+            "category": notice.category,
+            "building_section": notice.building_section,
+            "feed_version": notice.feed_version,
+        }
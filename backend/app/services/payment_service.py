@@ -0,0 +1,179 @@
+# backend/app/services/payment_service.py
+from typing import List
+from sqlalchemy import DateTime, Integer, String, and_, bindparam, cast, column, func, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB, UUID, insert as pg_insert
+from sqlalchemy.orm import Session
+from pydantic_core import to_jsonable_python
+from app.models.payment import MonthlyFee, Payment
+from app.models.resident import Resident
+from app.models.outbox import OutboxEvent
+from app.events.events import PaymentCompletedEvent, PaymentFailedEvent
+from app.services.ledger_service import LedgerService, fee_total
+from app.core.constants import PaymentStatus
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Which callback status wins, in a batch and against the stored row: a
+# payment can move PENDING -> FAILED -> COMPLETED (a retried charge that
+# succeeded) but never back, so a late FAILED can't undo a real payment
+STATUS_PRECEDENCE = {
+    PaymentStatus.PENDING: 0,
+    PaymentStatus.FAILED: 1,
+    PaymentStatus.COMPLETED: 2,
+}
+
+class PaymentService:
+    """Applies gateway callbacks to payments and fees (sync session; Celery)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply_callbacks(self, callbacks: List[dict]) -> dict:
+        """Apply a batch of callbacks in one transaction.
+
+        All callbacks go through a single INSERT ... ON CONFLICT
+        (transaction_id) DO UPDATE, which only moves a payment forward in
+        STATUS_PRECEDENCE (PENDING -> FAILED -> COMPLETED), so replays and
+        out-of-order retries change nothing.
+        Callbacks for an unknown fee or a resident of another flat are
+        dropped. For every transition actually applied, the ledger is
+        posted, fully paid fees are closed and a PaymentCompleted/Failed
+        event is written to the outbox, all before the single commit.
+        """
+        # One row per transaction: the highest-precedence status wins, and
+        # the newest callback among equals
+        latest = {}
+        for cb in callbacks:
+            current = latest.get(cb["transaction_id"])
+            if current is None or (
+                STATUS_PRECEDENCE[PaymentStatus(cb["status"])]
+                >= STATUS_PRECEDENCE[PaymentStatus(current["status"])]
+            ):
+                latest[cb["transaction_id"]] = cb
+        rows = [
+            {**cb, "status": PaymentStatus(cb["status"]).name}
+            for cb in latest.values()
+        ]
+        incoming = (
+            func.jsonb_to_recordset(bindparam("callbacks", rows, type_=JSONB))
+            .table_valued(
+                column("transaction_id", String),
+                column("status", String),
+                column("fee_id", UUID(as_uuid=True)),
+                column("resident_id", UUID(as_uuid=True)),
+                column("amount", Integer),
+                column("payment_method", String),
+                column("paid_at", DateTime(timezone=True)),
+                column("receipt_url", String),
+            )
+            .render_derived(name="incoming", with_types=True)
+        )
+        stmt = pg_insert(Payment).from_select(
+            [
+                "id", "resident_id", "fee_id", "amount", "payment_method",
+                "transaction_id", "status", "payment_date", "receipt_url",
+            ],
+            select(
+                func.gen_random_uuid(),
+                incoming.c.resident_id,
+                incoming.c.fee_id,
+                incoming.c.amount,
+                incoming.c.payment_method,
+                incoming.c.transaction_id,
+                cast(incoming.c.status, Payment.status.type),
+                incoming.c.paid_at,
+                incoming.c.receipt_url,
+            )
+            .select_from(incoming)
+            .join(MonthlyFee, MonthlyFee.id == incoming.c.fee_id)
+            .join(
+                Resident,
+                and_(
+                    Resident.id == incoming.c.resident_id,
+                    Resident.flat_id == MonthlyFee.flat_id
+                )
+            ),
+            include_defaults=False
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["transaction_id"],
+            set_={
+                "status": stmt.excluded.status,
+                "payment_date": stmt.excluded.payment_date,
+                "receipt_url": func.coalesce(stmt.excluded.receipt_url, Payment.receipt_url),
+                "updated_at": func.now(),
+            },
+            where=or_(
+                Payment.status == PaymentStatus.PENDING,
+                and_(
+                    Payment.status == PaymentStatus.FAILED,
+                    stmt.excluded.status == PaymentStatus.COMPLETED
+                )
+            )
+        ).returning(
+            Payment.id,
+            Payment.transaction_id,
+            Payment.fee_id,
+            Payment.resident_id,
+            Payment.amount,
+            Payment.status,
+            Payment.payment_date,
+        )
+        applied = self.db.execute(stmt).all()
+        completed = [r for r in applied if r.status == PaymentStatus.COMPLETED]
+        failed = [r for r in applied if r.status == PaymentStatus.FAILED]
+
+        if completed:
+            LedgerService(self.db).post_payments(Payment.id.in_([r.id for r in completed]))
+            self._close_paid_fees({r.fee_id for r in completed})
+
+        events = [
+            (PaymentCompletedEvent if r.status == PaymentStatus.COMPLETED else PaymentFailedEvent)({
+                "payment_id": r.id,
+                "transaction_id": r.transaction_id,
+                "fee_id": r.fee_id,
+                "resident_id": r.resident_id,
+                "amount": r.amount,
+                "payment_date": r.payment_date,
+            })
+            for r in completed + failed
+        ]
+        if events:
+            self.db.execute(insert(OutboxEvent), [
+                {
+                    "id": event.event_id,
+                    "event_type": event.event_type.value,
+                    "payload": to_jsonable_python(event.to_dict()),
+                }
+                for event in events
+            ])
+        self.db.commit()
+
+        summary = {
+            "received": len(callbacks),
+            "completed": len(completed),
+            "failed": len(failed),
+            "ignored": len(callbacks) - len(completed) - len(failed),
+        }
+        logger.info(f"Applied payment callbacks: {summary}")
+        return summary
+
+    def _close_paid_fees(self, fee_ids: set) -> int:
+        """Mark fees COMPLETED once completed payments cover charges + penalty"""
+        paid = (
+            select(func.coalesce(func.sum(Payment.amount), 0))
+            .where(Payment.fee_id == MonthlyFee.id, Payment.status == PaymentStatus.COMPLETED)
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            update(MonthlyFee)
+            .where(
+                MonthlyFee.id.in_(fee_ids),
+                MonthlyFee.status == PaymentStatus.PENDING,
+                paid >= fee_total + func.coalesce(MonthlyFee.penalty_amount, 0)
+            )
+            .values(status=PaymentStatus.COMPLETED, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -3,8 +3,11 @@ from app.services.base_service import BaseService
 from app.repositories.ticket_repository import TicketRepository
 from app.core.constants import TicketStatus, TicketPriority
 from app.core.exceptions import AppException
-from sqlalchemy.orm import Session
-from typing import Optional
+from app.events.events import TicketCreatedEvent, TicketAssignedEvent, TicketResolvedEvent
+from app.cache.redis_cache import get_cache
+from app.cache.cache_keys import CacheKeys
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Optional
 from uuid import UUID
 import logging
 import uuid
@@ -14,11 +17,11 @@ logger = logging.getLogger(__name__)
 class TicketService(BaseService):
     """Ticket service"""
     
-    def __init__(self, repository: TicketRepository, db: Session):
+    def __init__(self, repository: TicketRepository, db: AsyncSession):
         super().__init__(repository, db)
         self.repository = repository
 
-    def create_ticket(
+    async def create_ticket(
         self,
         resident_id: UUID,
         flat_id: UUID,
@@ -41,43 +44,92 @@ class TicketService(BaseService):
             "status": TicketStatus.OPEN
         }
 
-        ticket = self.repository.create(ticket_data)
-        
-        # Emit event for ticket creation notification
+        async with self.transaction() as uow:
+            ticket = await self.repository.create(ticket_data)
+            # Emit event for ticket creation notification (via the outbox)
+            uow.add_event(TicketCreatedEvent({
+                "ticket_id": ticket.id,
+                "ticket_number": ticket.ticket_number,
+                "resident_id": ticket.resident_id,
+                "flat_id": ticket.flat_id,
+                "title": ticket.title,
+                "category": ticket.category,
+                "priority": ticket.priority,
+            }))
+
+        await self._invalidate_lists(ticket.resident_id)
         logger.info(f"Ticket created: {ticket.ticket_number}")
         
         return ticket
 
-    def get_resident_tickets(self, resident_id: UUID, skip: int = 0, limit: int = 50):
+    async def get_resident_tickets(self, resident_id: UUID, cursor: Optional[str] = None, limit: int = 50):
         """Get tickets for resident"""
-        return self.repository.get_by_resident(resident_id, skip, limit)
+        return await self.repository.get_by_resident(resident_id, cursor, limit)
 
-    def assign_ticket(self, ticket_id: UUID, assigned_to_id: UUID, estimated_cost: int = None):
+    async def assign_ticket(self, ticket_id: UUID, assigned_to_id: UUID, estimated_cost: int = None):
         """Assign ticket to staff member"""
-        ticket = self.repository.read(ticket_id)
-        if not ticket:
-            raise AppException("Ticket not found")
+        async with self.transaction() as uow:
+            updated = await self.repository.assign_ticket(ticket_id, assigned_to_id, estimated_cost)
+            if not updated:
+                raise AppException("Ticket not found")
+            # Emit event for assignment notification (via the outbox)
+            uow.add_event(TicketAssignedEvent({
+                "ticket_id": updated.id,
+                "ticket_number": updated.ticket_number,
+                "resident_id": updated.resident_id,
+                "assigned_to_id": assigned_to_id,
+                "estimated_cost": estimated_cost,
+            }))
 
-        updated = self.repository.assign_ticket(ticket_id, assigned_to_id, estimated_cost)
-        
-        # Emit event for assignment notification
+        await self._invalidate_lists(updated.resident_id)
         logger.info(f"Ticket assigned: {ticket_id} to {assigned_to_id}")
         
         return updated
 
-    def resolve_ticket(self, ticket_id: UUID, resolution_notes: str, actual_cost: int = None):
+    async def resolve_ticket(self, ticket_id: UUID, resolution_notes: str, actual_cost: int = None):
         """Mark ticket as resolved"""
-        ticket = self.repository.read(ticket_id)
-        if not ticket:
-            raise AppException("Ticket not found")
+        async with self.transaction() as uow:
+            updated = await self.repository.resolve_ticket(ticket_id, resolution_notes, actual_cost)
+            if not updated:
+                raise AppException("Ticket not found")
+            # Emit event for resolution notification (via the outbox)
+            uow.add_event(TicketResolvedEvent({
+                "ticket_id": updated.id,
+                "ticket_number": updated.ticket_number,
+                "resident_id": updated.resident_id,
+                "resolution_notes": resolution_notes,
+                "actual_cost": actual_cost,
+            }))
 
-        updated = self.repository.resolve_ticket(ticket_id, resolution_notes, actual_cost)
-        
-        # Emit event for resolution notification
+        await self._invalidate_lists(updated.resident_id)
         logger.info(f"Ticket resolved: {ticket_id}")
         
         return updated
 
-    def get_open_tickets(self, skip: int = 0, limit: int = 50):
+    async def update(self, id: Any, data: dict):
+        """Update ticket and drop the cached lists it appears in"""
+        updated = await super().update(id, data)
+        if updated:
+            await self._invalidate_lists(updated.resident_id)
+        return updated
+
+    @staticmethod
+    async def _invalidate_lists(resident_id: UUID) -> None:
+        """Bump the resident's list family and every status list family.
+
+        After commit, so a concurrent read can't re-cache the old lists.
+        One INCR per family; the status of the ticket before the change
+        isn't known here, so all (few) status families are bumped.
+        """
+        cache = get_cache()
+        await cache.ainvalidate_tag(CacheKeys.tickets_by_resident(resident_id))
+        for ticket_status in TicketStatus:
+            await cache.ainvalidate_tag(CacheKeys.tickets_by_status(ticket_status))
+
+    async def get_tickets_by_status(self, status: TicketStatus, cursor: Optional[str] = None, limit: int = 50):
+        """Get tickets in a given status"""
+        return await self.repository.get_by_status(status, cursor, limit)
+
+    async def get_open_tickets(self, cursor: Optional[str] = None, limit: int = 50):
         """Get all open tickets"""
-        return self.repository.get_open_tickets(skip, limit)
+        return await self.repository.get_open_tickets(cursor, limit)
@@ -3,19 +3,21 @@ from app.services.base_service import BaseService
 from app.repositories.user_repository import UserRepository
 from app.models.user import User
 from app.core.security import SecurityUtils
+from app.cache.principal_cache import get_principal_cache
 from app.core.exceptions import UserAlreadyExists, InvalidCredentials, UserNotFound
 from app.core.constants import UserRole
-from sqlalchemy.orm import Session
-from typing import Optional
+from app.events.events import UserRegisteredEvent
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Optional
 
 class UserService(BaseService):
     """User service (Single Responsibility, Dependency Injection)"""
     
-    def __init__(self, repository: UserRepository, db: Session):
+    def __init__(self, repository: UserRepository, db: AsyncSession):
         super().__init__(repository, db)
         self.repository = repository
 
-    def register_user(
+    async def register_user(
         self,
         email: str,
         username: str,
@@ -25,15 +27,8 @@ class UserService(BaseService):
         role: UserRole = UserRole.RESIDENT
     ) -> User:
         """Register new user"""
-        # Check if user exists (DRY principle)
-        if self.repository.get_by_email(email):
-            raise UserAlreadyExists()
-
-        if self.repository.get_by_username(username):
-            raise UserAlreadyExists()
-
-        # Hash password securely
-        hashed_password = SecurityUtils.hash_password(password)
+        # Hash password securely (off the event loop)
+        hashed_password = await SecurityUtils.hash_password_async(password)
 
         user_data = {
             "email": email,
@@ -44,33 +39,86 @@ class UserService(BaseService):
             "role": role
         }
 
-        return self.repository.create(user_data)
+        async with self.transaction() as uow:
+            # Check if user exists (DRY principle)
+            if await self.repository.get_by_email(email):
+                raise UserAlreadyExists()
+
+            if await self.repository.get_by_username(username):
+                raise UserAlreadyExists()
 
-    def authenticate_user(self, email: str, password: str) -> User:
+            user = await self.repository.create(user_data)
+            uow.add_event(UserRegisteredEvent({
+                "user_id": user.id,
+                "email": user.email,
+                "full_name": user.full_name,
+                "role": user.role,
+            }))
+            return user
+
+    async def authenticate_user(self, email: str, password: str) -> User:
         """Authenticate user and return user object"""
-        user = self.repository.get_by_email(email)
+        user = await self.repository.get_by_email(email)
+        if not user:
+            raise InvalidCredentials()
 
-        if not user or not SecurityUtils.verify_password(password, user.hashed_password):
+        valid, new_hash = await SecurityUtils.verify_and_update_password(
+            password, user.hashed_password
+        )
+        if not valid:
             raise InvalidCredentials()
 
         if not user.is_active:
             raise InvalidCredentials()
 
+        # Transparently upgrade hashes made with an old cost factor
+        if new_hash:
+            async with self.transaction():
+                user = await self.repository.update(user.id, {"hashed_password": new_hash})
+
         return user
 
-    def get_user_by_email(self, email: str) -> Optional[User]:
+    async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        return self.repository.get_by_email(email)
+        return await self.repository.get_by_email(email)
 
-    def update_user_password(self, user_id, new_password: str) -> User:
+    async def update_user_password(self, user_id, new_password: str) -> User:
         """Update user password"""
-        user = self.read(user_id)
-        if not user:
-            raise UserNotFound()
+        hashed_password = await SecurityUtils.hash_password_async(new_password)
+        async with self.transaction():
+            updated = await self.repository.update(user_id, {"hashed_password": hashed_password})
+            if not updated:
+                raise UserNotFound()
+        # Invalidate after commit so a concurrent load can't re-cache the old row
+        await get_principal_cache().invalidate(updated.email)
+        return updated
+
+    async def update(self, id: Any, data: dict) -> Optional[User]:
+        """Update user and drop the cached principal (old and new email)"""
+        data = dict(data)
+        password = data.pop("password", None)
+        if password:
+            data["hashed_password"] = await SecurityUtils.hash_password_async(password)
+        async with self.transaction():
+            current = await self.repository.read(id)
+            if current is None:
+                return None
+            # Plain str: the UPDATE below refreshes the identity-mapped row
+            previous_email = current.email
+            updated = await self.repository.update(id, data)
+        for email in {previous_email, updated.email}:
+            await get_principal_cache().invalidate(email)
+        return updated
 
-        hashed_password = SecurityUtils.hash_password(new_password)
-        return self.repository.update(user_id, {"hashed_password": hashed_password})
+    async def deactivate_user(self, user_id) -> User:
+        """Deactivate user; takes effect on the next authenticated request"""
+        async with self.transaction():
+            updated = await self.repository.deactivate_user(user_id)
+            if not updated:
+                raise UserNotFound()
+        await get_principal_cache().invalidate(updated.email)
+        return updated
 
-    def get_active_users(self, skip: int = 0, limit: int = 100):
+    async def get_active_users(self, cursor: Optional[str] = None, limit: int = 100):
         """Get active users"""
-        return self.repository.get_active_users(skip, limit)
+        return await self.repository.get_active_users(cursor, limit)
@@ -0,0 +1,146 @@
+# backend/app/services/visitor_service.py
+from app.services.base_service import BaseService
+from app.repositories.visitor_repository import VisitorLogRepository
+from app.cache.visitor_presence import get_visitor_presence
+from app.core.exceptions import InvalidData
+from app.config import settings
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+import logging
+import secrets
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# No 0/O or 1/I, so codes survive being read out at the gate
+PASS_CODE_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+PASS_CODE_LENGTH = 6
+
+# Allowed clock skew for device-supplied times
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+
+def _utc(dt: datetime) -> datetime:
+    """Naive UTC, as stored in visitor_logs"""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+class VisitorService(BaseService):
+    """Gate check-in/check-out for security staff.
+
+    The presence index is updated after each commit, never inside the
+    transaction, so it can't show a visit that was rolled back.
+    """
+
+    def __init__(self, repository: VisitorLogRepository, db: AsyncSession):
+        super().__init__(repository, db)
+        self.repository = repository
+
+    @staticmethod
+    def generate_pass_code() -> str:
+        return "".join(secrets.choice(PASS_CODE_ALPHABET) for _ in range(PASS_CODE_LENGTH))
+
+    @staticmethod
+    def pass_window_start(now: datetime) -> datetime:
+        return now - timedelta(hours=settings.VISITOR_PASS_VALID_HOURS)
+
+    async def check_in(self, security_id: UUID, data: dict):
+        """Log an entry and issue its pass code (one INSERT ... RETURNING)"""
+        values = {
+            **data,
+            "id": uuid.uuid4(),
+            "security_id": security_id,
+            "entry_time": datetime.utcnow(),
+            "pass_code": self.generate_pass_code(),
+        }
+        try:
+            async with self.transaction():
+                visit = await self.repository.check_in(values)
+        except IntegrityError:
+            raise InvalidData("Unknown flat")
+        await get_visitor_presence().checked_in([visit])
+        return visit
+
+    async def check_out(self, pass_code: str, notes: Optional[str] = None):
+        """Close the open visit for a pass code; None if there is none"""
+        now = datetime.utcnow()
+        async with self.transaction():
+            visit = await self.repository.check_out(
+                pass_code.upper(), self.pass_window_start(now), now, notes
+            )
+        if visit:
+            await get_visitor_presence().checked_out([visit])
+        return visit
+
+    async def sync(self, security_id: UUID, entries: List[dict], exits: List[dict]) -> dict:
+        """Apply a device's offline queue in one transaction.
+
+        Entries are keyed by their device-generated id, so re-uploading a
+        batch is harmless. Entries for unknown flats are rejected, not
+        failed: the rest of the batch still goes through.
+        """
+        if len(entries) + len(exits) > settings.VISITOR_SYNC_MAX_BATCH:
+            raise InvalidData(f"At most {settings.VISITOR_SYNC_MAX_BATCH} items per sync")
+        now = datetime.utcnow()
+        oldest = now - timedelta(days=settings.VISITOR_SYNC_MAX_AGE_DAYS)
+
+        # Devices re-queue entries: one row per (id, entry_time), since an
+        # upsert can't touch the same row twice; a copy with an exit wins
+        rows = {}
+        for entry in entries:
+            entry_time = _utc(entry["entry_time"])
+            exit_time = _utc(entry["exit_time"]) if entry.get("exit_time") else None
+            if not oldest <= entry_time <= now + MAX_CLOCK_SKEW:
+                raise InvalidData(f"Entry {entry['id']} is outside the sync window")
+            if exit_time is not None and exit_time < entry_time:
+                raise InvalidData(f"Entry {entry['id']} exits before it enters")
+            key = (entry["id"], entry_time)
+            if key in rows and rows[key]["exit_time"] is not None:
+                continue
+            rows[key] = {
+                **entry,
+                "security_id": security_id,
+                "entry_time": entry_time,
+                "exit_time": exit_time,
+                "pass_code": entry["pass_code"].upper() if entry.get("pass_code") else None,
+            }
+        rows = list(rows.values())
+        # One exit per pass code: a repeated exit is the same one re-queued
+        first_exits = {}
+        for e in exits:
+            code, exit_time = e["pass_code"].upper(), _utc(e["exit_time"])
+            if code not in first_exits or exit_time < first_exits[code]:
+                first_exits[code] = exit_time
+        exit_rows = [
+            {"pass_code": code, "exit_time": exit_time.isoformat()}
+            for code, exit_time in first_exits.items()
+        ]
+
+        async with self.transaction():
+            known = await self.repository.existing_flat_ids({r["flat_id"] for r in rows}) if rows else set()
+            accepted_rows = [r for r in rows if r["flat_id"] in known]
+            written = await self.repository.upsert_synced(accepted_rows) if accepted_rows else []
+            closed = (
+                await self.repository.apply_synced_exits(exit_rows, oldest) if exit_rows else []
+            )
+
+        # Entries older than a pass aren't counted as inside (see rebuild)
+        window_start = self.pass_window_start(now)
+        presence = get_visitor_presence()
+        await presence.checked_in(
+            v for v in written if v.exit_time is None and v.entry_time >= window_start
+        )
+        await presence.checked_out([v for v in written if v.exit_time is not None] + closed)
+
+        rejected = [r["id"] for r in rows if r["flat_id"] not in known]
+        summary = {
+            "accepted": len(written),
+            "duplicates": len(entries) - len(rejected) - len(written),
+            "rejected": rejected,
+            "exits_applied": len(closed),
+        }
+        logger.info(f"Visitor sync by {security_id}: {summary | {'rejected': len(rejected)}}")
+        return summary
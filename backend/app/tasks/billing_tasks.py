@@ -0,0 +1,30 @@
+# backend/app/tasks/billing_tasks.py
+from typing import Optional
+from datetime import date
+from app.tasks.celery_app import celery_app
+from app.database.session import get_db_context
+# Load base first so every mapper is registered before the model imports
+from app.database.base import BaseModel  # noqa
+from app.services.billing_service import BillingService, ChargeRules
+from app.services.ledger_service import LedgerService
+import logging
+
+logger = logging.getLogger(__name__)
+
+@celery_app.task(bind=True, acks_late=True)
+def generate_monthly_fees_task(self, month_year: Optional[str] = None, rules: Optional[dict] = None):
+    """Generate fees for every flat for month_year (MM-YYYY, default: current)"""
+    month_year = month_year or date.today().strftime("%m-%Y")
+    with get_db_context() as db:
+        created = BillingService(db).generate_monthly_fees(
+            month_year, ChargeRules.from_settings(**(rules or {}))
+        )
+    return {"month_year": month_year, "created": created}
+
+@celery_app.task(acks_late=True)
+def reconcile_ledger_task():
+    """Check flat balances against the raw fee/payment rows and fix drift"""
+    with get_db_context() as db:
+        summary = LedgerService(db).reconcile()
+        db.commit()
+    return summary
@@ -13,7 +13,10 @@ celery_app = Celery(
     backend=settings.REDIS_URL,
     include=[
         "app.tasks.email_tasks",
-        "app.tasks.notification_tasks"
+        "app.tasks.notification_tasks",
+        "app.tasks.billing_tasks",
+        "app.tasks.payment_tasks",
+        "app.tasks.maintenance_tasks"
     ]
 )
 
@@ -43,6 +46,30 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.notification_tasks.check_overdue_fees",
         "schedule": crontab(hour=0, minute=0),  # Daily at midnight
     },
+    "generate-monthly-fees": {
+        "task": "app.tasks.billing_tasks.generate_monthly_fees_task",
+        "schedule": crontab(day_of_month=1, hour=1, minute=0),  # 1st of the month
+    },
+    "apply-payment-callbacks": {
+        "task": "app.tasks.payment_tasks.apply_payment_callbacks",
+        "schedule": 30.0,  # Safety net; webhooks schedule their own drains
+    },
+    "maintain-visitor-log-partitions": {
+        "task": "app.tasks.maintenance_tasks.maintain_visitor_log_partitions",
+        "schedule": crontab(hour=3, minute=0),  # Daily
+    },
+    "rebuild-visitor-presence": {
+        "task": "app.tasks.maintenance_tasks.rebuild_visitor_presence",
+        "schedule": float(settings.VISITOR_PRESENCE_REBUILD_SECONDS),
+    },
+    "archive-expired-notices": {
+        "task": "app.tasks.maintenance_tasks.archive_expired_notices",
+        "schedule": float(settings.NOTICE_EXPIRY_CHECK_SECONDS),
+    },
+    "reconcile-ledger": {
+        "task": "app.tasks.billing_tasks.reconcile_ledger_task",
+        "schedule": crontab(hour=2, minute=30),  # Daily, after penalties
+    },
 }
 
 @celery_app.task(bind=True)
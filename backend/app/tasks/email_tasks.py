@@ -1,7 +1,9 @@
 # backend/app/tasks/email_tasks.py
 from celery import shared_task
 from app.tasks.celery_app import celery_app
+from app.tasks.smtp_pool import get_smtp_pool
 from app.config import settings
+from typing import List
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -9,33 +11,106 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-@celery_app.task(bind=True, max_retries=3)
-def send_email_task(self, to_email: str, subject: str, body: str, html_body: str = None):
-    """Send email using SMTP"""
-    try:
-        server = smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT)
-        server.starttls()
-        server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+def _build_message(to_email: str, subject: str, body: str, html_body: str = None) -> MIMEMultipart:
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject
+    msg["From"] = settings.SMTP_FROM
+    msg["To"] = to_email
+
+    msg.attach(MIMEText(body, "plain"))
+    if html_body:
+        msg.attach(MIMEText(html_body, "html"))
+    return msg
 
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = settings.SMTP_USER
-        msg["To"] = to_email
+def _is_permanent(exc: Exception) -> bool:
+    """5xx replies mean retrying this recipient will not help"""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in exc.recipients.values())
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return exc.smtp_code >= 500
+    return False
 
-        msg.attach(MIMEText(body, "plain"))
-        if html_body:
-            msg.attach(MIMEText(html_body, "html"))
+def _breaks_session(exc: Exception) -> bool:
+    """Errors after which the SMTP session can't be reused"""
+    if isinstance(exc, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return exc.smtp_code == 421
+    # SMTPException subclasses OSError; only bare socket errors are fatal
+    return isinstance(exc, OSError) and not isinstance(exc, smtplib.SMTPException)
 
-        server.sendmail(settings.SMTP_USER, [to_email], msg.as_string())
-        server.quit()
+@celery_app.task(bind=True, max_retries=3)
+def send_email_task(self, to_email: str, subject: str, body: str, html_body: str = None):
+    """Send email over a pooled SMTP session"""
+    try:
+        with get_smtp_pool().connection() as conn:
+            conn.send_message(_build_message(to_email, subject, body, html_body))
 
         logger.info(f"Email sent to {to_email}")
         return {"status": "success"}
 
     except Exception as exc:
+        if _is_permanent(exc):
+            logger.error(f"Email to {to_email} rejected: {exc}")
+            return {"status": "rejected"}
         logger.error(f"Email send failed: {exc}")
         raise self.retry(exc=exc, countdown=60)
 
+@celery_app.task(bind=True, max_retries=3)
+def send_email_batch_task(self, messages: List[dict]):
+    """Send many emails over one pooled SMTP session.
+
+    Each message is a dict of send_email_task's arguments. Permanent
+    rejections are dropped; only transiently failed messages are retried.
+    """
+    pool = get_smtp_pool()
+    sent, rejected, failed = 0, [], []
+    conn = None
+    try:
+        for i, message in enumerate(messages):
+            if conn is None:
+                try:
+                    conn = pool.acquire()
+                except (smtplib.SMTPException, OSError) as exc:
+                    logger.error(f"SMTP connect failed: {exc}")
+                    failed.extend(messages[i:])
+                    break
+            try:
+                conn.send_message(_build_message(**message))
+                sent += 1
+            except Exception as exc:
+                if _is_permanent(exc):
+                    logger.error(f"Email to {message['to_email']} rejected: {exc}")
+                    rejected.append(message["to_email"])
+                else:
+                    failed.append(message)
+                if _breaks_session(exc):
+                    pool.release(conn, broken=True)
+                    conn = None
+    finally:
+        if conn is not None:
+            pool.release(conn)
+
+    logger.info(f"Email batch: {sent} sent, {len(rejected)} rejected, {len(failed)} to retry")
+    if failed:
+        if self.request.retries < self.max_retries:
+            raise self.retry(args=(failed,), countdown=60 * 2 ** self.request.retries)
+        logger.error(f"Email batch: giving up on {len(failed)} messages")
+    return {
+        "status": "success",
+        "sent": sent,
+        "rejected": rejected,
+        "failed": [m["to_email"] for m in failed]
+    }
+
+def enqueue_email_batches(messages: List[dict], batch_size: int = settings.EMAIL_BATCH_SIZE) -> int:
+    """Split messages into send_email_batch_task calls; returns batch count"""
+    batches = 0
+    for start in range(0, len(messages), batch_size):
+        send_email_batch_task.delay(messages[start:start + batch_size])
+        batches += 1
+    return batches
+
 @celery_app.task
 def send_user_registration_email(user_email: str, user_name: str):
     """Send registration confirmation email"""
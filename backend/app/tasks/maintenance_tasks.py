@@ -0,0 +1,125 @@
+# backend/app/tasks/maintenance_tasks.py
+from datetime import date, datetime, timedelta
+from typing import Optional
+from sqlalchemy import func, insert, select, update
+from pydantic_core import to_jsonable_python
+from celery.signals import worker_ready
+from app.tasks.celery_app import celery_app
+from app.database.session import engine, get_db_context
+# Load base first so every mapper is registered before the model imports
+from app.database.base import BaseModel  # noqa
+from app.database.partitions import MonthlyPartitions, PartitionArchiver, add_months
+from app.models.visitor import VisitorLog
+from app.models.notice import Notice, NOTICE_FEED_LOCK_KEY, notice_feed_version_seq
+from app.models.outbox import OutboxEvent
+from app.events.events import NoticeArchivedEvent
+from app.core.constants import NoticeStatus
+from app.cache.visitor_presence import get_visitor_presence
+from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+@celery_app.task(acks_late=True)
+def maintain_visitor_log_partitions(today: Optional[str] = None):
+    """Create upcoming visitor_logs partitions; archive and drop expired ones"""
+    today = date.fromisoformat(today) if today else date.today()
+    partitions = MonthlyPartitions(engine, "visitor_logs")
+    created = partitions.ensure(today, settings.VISITOR_LOG_PREMAKE_MONTHS)
+    archived = partitions.expire(
+        add_months(today.replace(day=1), -settings.VISITOR_LOG_RETENTION_MONTHS),
+        PartitionArchiver(
+            settings.ARCHIVE_DIR,
+            bucket=settings.AWS_S3_BUCKET_NAME,
+            prefix=settings.ARCHIVE_S3_PREFIX
+        )
+    )
+    return {"created": created, "archived": archived}
+
+@celery_app.task
+def rebuild_visitor_presence():
+    """Repair the visitors-inside index from open visits in the database.
+
+    Open visits older than a pass are left out: they can no longer be
+    checked out by code and are most likely exits that were never logged.
+    """
+    presence = get_visitor_presence()
+    # Taken before the read: changes stamped after it are newer than the snapshot
+    snapshot_ms = presence.snapshot_time()
+    since = datetime.utcnow() - timedelta(hours=settings.VISITOR_PASS_VALID_HOURS)
+    with get_db_context() as db:
+        visits = db.execute(
+            select(
+                VisitorLog.id,
+                VisitorLog.flat_id,
+                VisitorLog.visitor_name,
+                VisitorLog.purpose,
+                VisitorLog.vehicle_number,
+                VisitorLog.pass_code,
+                VisitorLog.entry_time,
+            ).where(
+                VisitorLog.exit_time.is_(None),
+                VisitorLog.entry_time >= since
+            )
+        ).all()
+    inside, added, removed = presence.rebuild(visits, snapshot_ms)
+    logger.info(
+        f"Rebuilt visitor presence index: {inside} inside "
+        f"({added} added, {removed} removed)"
+    )
+    return {"inside": inside, "added": added, "removed": removed}
+
+@worker_ready.connect
+def queue_visitor_presence_rebuild(sender, **kwargs):
+    """The presence index may have missed updates while we were down"""
+    rebuild_visitor_presence.delay()
+
+@celery_app.task
+def archive_expired_notices():
+    """Archive published notices past their expiry date.
+
+    Expiry then takes a feed version like any other removal, so a client
+    asking for changes since an older version is told to drop the notice.
+    The NoticeArchivedEvents rebuild the affected feeds.
+    """
+    with get_db_context() as db:
+        # Same lock as publish/archive: versions commit in order
+        db.execute(select(func.pg_advisory_xact_lock(NOTICE_FEED_LOCK_KEY)))
+        expired = db.execute(
+            update(Notice)
+            .where(
+                Notice.status == NoticeStatus.PUBLISHED,
+                Notice.expiry_date <= func.now()
+            )
+            .values(
+                status=NoticeStatus.ARCHIVED,
+                feed_version=notice_feed_version_seq.next_value()
+            )
+            .returning(
+                Notice.id, Notice.title, Notice.category,
+                Notice.building_section, Notice.feed_version
+            )
+        ).all()
+        if expired:
+            events = [
+                NoticeArchivedEvent({
+                    "notice_id": n.id,
+                    "title": n.title,
+                    "category": n.category,
+                    "building_section": n.building_section,
+                    "feed_version": n.feed_version,
+                })
+                for n in expired
+            ]
+            db.execute(insert(OutboxEvent), [
+                {
+                    "id": event.event_id,
+                    "event_type": event.event_type.value,
+                    "payload": to_jsonable_python(event.to_dict()),
+                }
+                for event in events
+            ])
+        db.commit()
+    if expired:
+        logger.info(f"Archived {len(expired)} expired notice(s)")
+    return {"archived": len(expired)}
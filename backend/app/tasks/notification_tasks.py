@@ -0,0 +1,225 @@
+# backend/app/tasks/notification_tasks.py
+from typing import List, Optional, Tuple
+from datetime import date, timedelta
+from celery import chord
+from sqlalchemy import Date, and_, cast, exists, func, select, update
+from sqlalchemy.orm import Session
+from app.tasks.celery_app import celery_app
+from app.tasks.email_tasks import enqueue_email_batches
+from app.database.session import get_db_context
+# Load base first so every mapper is registered before the model imports
+from app.database.base import BaseModel  # noqa
+from app.models.payment import MonthlyFee, Payment
+from app.models.resident import Resident
+from app.models.user import User
+from app.services.ledger_service import LedgerService
+from app.core.constants import PaymentStatus, ResidentStatus
+from app.cache.redis_cache import get_cache
+from app.cache.cache_keys import CacheKeys
+from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Keyset chunk: fee ids in (after, upto]; after is None for the first chunk
+Bounds = Tuple[Optional[str], str]
+
+PROGRESS_TTL = 24 * 3600
+
+_fee_total = (
+    MonthlyFee.base_amount
+    + func.coalesce(MonthlyFee.maintenance_charge, 0)
+    + func.coalesce(MonthlyFee.water_charge, 0)
+    + func.coalesce(MonthlyFee.other_charges, 0)
+)
+
+def _unpaid():
+    return and_(
+        MonthlyFee.status == PaymentStatus.PENDING,
+        ~exists().where(
+            Payment.fee_id == MonthlyFee.id,
+            Payment.status == PaymentStatus.COMPLETED
+        )
+    )
+
+def _in_chunk(bounds: Bounds):
+    after, upto = bounds
+    criteria = [MonthlyFee.id <= upto]
+    if after is not None:
+        criteria.append(MonthlyFee.id > after)
+    return and_(*criteria)
+
+def _chunk_bounds(db: Session, *criteria, chunk_size: int) -> List[Bounds]:
+    """Stream matching fee ids through a server-side cursor into keyset chunks.
+
+    Only ids are read here; each chunk task re-selects its own rows, so the
+    coordinator's memory stays flat however many fees there are.
+    """
+    result = db.execute(
+        select(MonthlyFee.id)
+        .where(*criteria)
+        .order_by(MonthlyFee.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    bounds, after = [], None
+    for partition in result.partitions():
+        upto = str(partition[-1][0])
+        bounds.append((after, upto))
+        after = upto
+    return bounds
+
+def _start_progress(run_id: str, job: str, chunks: int) -> None:
+    key = CacheKeys.task_progress(run_id)
+    client = get_cache().redis_client
+    client.hset(key, mapping={"job": job, "status": "running", "chunks": chunks, "done": 0, "processed": 0})
+    client.expire(key, PROGRESS_TTL)
+
+def _chunk_done(run_id: str, processed: int) -> None:
+    key = CacheKeys.task_progress(run_id)
+    pipe = get_cache().redis_client.pipeline()
+    pipe.hincrby(key, "done", 1)
+    pipe.hincrby(key, "processed", processed)
+    pipe.execute()
+
+def _fail_progress(run_id: str, error: str) -> None:
+    get_cache().redis_client.hset(CacheKeys.task_progress(run_id), mapping={"status": "failed", "error": error})
+
+def _finish_progress(run_id: str, results: List[int]) -> dict:
+    summary = {"status": "finished", "chunks": len(results), "processed": sum(results)}
+    get_cache().redis_client.hset(CacheKeys.task_progress(run_id), mapping=summary)
+    return summary
+
+def get_run_progress(run_id: str) -> dict:
+    """Progress of a fan-out run (chunks done / total, rows processed)"""
+    return get_cache().redis_client.hgetall(CacheKeys.task_progress(run_id))
+
+def _fan_out(task, run_id: str, job: str, bounds: List[Bounds], as_of: str) -> dict:
+    _start_progress(run_id, job, len(bounds))
+    task.update_state(state="PROGRESS", meta={"chunks": len(bounds)})
+    if not bounds:
+        return _finish_progress(run_id, [])
+    chord(
+        (job_chunk_tasks[job].s(b, as_of, run_id) for b in bounds),
+        finish_run.s(run_id).on_error(fail_run.s(run_id))
+    ).apply_async()
+    logger.info(f"{job}: fanned out {len(bounds)} chunks (run {run_id})")
+    return {"run_id": run_id, "chunks": len(bounds)}
+
+@celery_app.task(bind=True)
+def send_payment_reminder(self, as_of: Optional[str] = None):
+    """Remind residents of unpaid fees falling due within the reminder window.
+
+    Fees already past due are left to check_overdue_fees.
+    """
+    as_of = as_of or date.today().isoformat()
+    today = date.fromisoformat(as_of)
+    due_by = today + timedelta(days=settings.PAYMENT_REMINDER_DAYS_AHEAD)
+    with get_db_context() as db:
+        bounds = _chunk_bounds(
+            db, _unpaid(), MonthlyFee.due_date.between(today, due_by),
+            chunk_size=settings.NOTIFICATION_CHUNK_SIZE
+        )
+    return _fan_out(self, self.request.id, "payment_reminder", bounds, as_of)
+
+@celery_app.task(acks_late=True)
+def send_payment_reminder_chunk(bounds: Bounds, as_of: str, run_id: str) -> int:
+    """Email reminders for one keyset chunk of fees"""
+    today = date.fromisoformat(as_of)
+    due_by = today + timedelta(days=settings.PAYMENT_REMINDER_DAYS_AHEAD)
+    with get_db_context() as db:
+        rows = db.execute(
+            select(
+                MonthlyFee.month_year,
+                MonthlyFee.due_date,
+                (_fee_total + func.coalesce(MonthlyFee.penalty_amount, 0)).label("amount_due"),
+                User.email,
+                User.full_name
+            )
+            .join(Resident, Resident.flat_id == MonthlyFee.flat_id)
+            .join(User, User.id == Resident.user_id)
+            .where(
+                _in_chunk(bounds),
+                _unpaid(),
+                MonthlyFee.due_date.between(today, due_by),
+                Resident.status == ResidentStatus.APPROVED,
+                User.is_active.is_(True)
+            )
+        ).all()
+
+    messages = [
+        {
+            "to_email": row.email,
+            "subject": f"Maintenance fee for {row.month_year:%B %Y} is due",
+            "body": (
+                f"Hi {row.full_name},\n\n"
+                f"Your maintenance fee of Rs. {row.amount_due} for {row.month_year:%B %Y} "
+                f"is due on {row.due_date:%d %b %Y}. Please ignore this if already paid."
+            )
+        }
+        for row in rows
+    ]
+    enqueue_email_batches(messages)
+    _chunk_done(run_id, len(messages))
+    return len(messages)
+
+@celery_app.task(bind=True)
+def check_overdue_fees(self, as_of: Optional[str] = None):
+    """Apply late penalties to unpaid fees past their due date"""
+    as_of = as_of or date.today().isoformat()
+    overdue_before = date.fromisoformat(as_of) - timedelta(days=settings.OVERDUE_GRACE_DAYS)
+    with get_db_context() as db:
+        bounds = _chunk_bounds(
+            db, _unpaid(), MonthlyFee.due_date < overdue_before,
+            chunk_size=settings.NOTIFICATION_CHUNK_SIZE
+        )
+    return _fan_out(self, self.request.id, "overdue_fees", bounds, as_of)
+
+@celery_app.task(acks_late=True)
+def apply_overdue_penalties_chunk(bounds: Bounds, as_of: str, run_id: str) -> int:
+    """Recompute penalties for one keyset chunk in a single UPDATE.
+
+    The penalty is derived from days overdue (not incremented), so re-running
+    a chunk or the whole job on the same day changes nothing. Penalty
+    changes are posted to the ledger in the same transaction.
+    """
+    today = date.fromisoformat(as_of)
+    overdue_before = today - timedelta(days=settings.OVERDUE_GRACE_DAYS)
+    days_overdue = cast(today, Date) - MonthlyFee.due_date
+    penalty = func.least(
+        _fee_total * settings.OVERDUE_PENALTY_BPS_PER_DAY * days_overdue // 10000,
+        _fee_total * settings.OVERDUE_PENALTY_MAX_BPS // 10000
+    )
+    with get_db_context() as db:
+        result = db.execute(
+            update(MonthlyFee)
+            .where(
+                _in_chunk(bounds),
+                _unpaid(),
+                MonthlyFee.due_date < overdue_before,
+                MonthlyFee.penalty_amount.is_distinct_from(penalty)
+            )
+            .values(penalty_amount=penalty, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        LedgerService(db).post_penalties(_in_chunk(bounds))
+        db.commit()
+    _chunk_done(run_id, result.rowcount)
+    return result.rowcount
+
+@celery_app.task
+def finish_run(results: List[int], run_id: str) -> dict:
+    """Chord callback: record the run summary"""
+    summary = _finish_progress(run_id, results)
+    logger.info(f"Run {run_id} finished: {summary}")
+    return summary
+
+@celery_app.task
+def fail_run(request, exc, traceback, run_id: str) -> None:
+    """Chord errback: mark the run failed so it doesn't read as running forever"""
+    _fail_progress(run_id, repr(exc))
+    logger.error(f"Run {run_id} failed: chunk {request.id} raised {exc!r}")
+
+job_chunk_tasks = {
+    "payment_reminder": send_payment_reminder_chunk,
+    "overdue_fees": apply_overdue_penalties_chunk,
+}
@@ -0,0 +1,77 @@
+# backend/app/tasks/payment_tasks.py
+from app.tasks.celery_app import celery_app
+from app.database.session import get_db_context
+# Load base first so every mapper is registered before the model imports
+from app.database.base import BaseModel  # noqa
+from app.services.payment_service import PaymentService
+from app.cache.callback_queue import get_callback_queue
+from app.cache.redis_cache import get_cache
+from app.cache.cache_keys import CacheKeys
+from app.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+DRAIN_LOCK_MS = 5 * 60 * 1000
+
+@celery_app.task(bind=True, max_retries=3)
+def apply_payment_callbacks(self):
+    """Drain the callback queue in batches (one drainer at a time).
+
+    Each batch is trimmed from the queue only after it committed. If
+    another drainer holds the lock, retry shortly so callbacks queued
+    after its last read aren't left waiting for the periodic run.
+
+    A batch that fails is retried (the error may be transient); after
+    PAYMENT_WEBHOOK_MAX_FAILURES failures it is applied one callback at a
+    time and the callbacks that still fail are dead-lettered, so one bad
+    callback can't block the queue.
+    """
+    cache = get_cache()
+    token = cache.acquire_lock(CacheKeys.payment_callback_queue(), DRAIN_LOCK_MS)
+    if token is None:
+        raise self.retry(countdown=settings.PAYMENT_WEBHOOK_LINGER)
+
+    queue = get_callback_queue()
+    totals = {"received": 0, "completed": 0, "failed": 0, "ignored": 0}
+    try:
+        queue.drain_started()
+        while True:
+            callbacks, count = queue.peek(settings.PAYMENT_WEBHOOK_BATCH_SIZE)
+            if not count:
+                break
+            if callbacks:
+                try:
+                    with get_db_context() as db:
+                        summary = PaymentService(db).apply_callbacks(callbacks)
+                except Exception as e:
+                    failures = queue.record_failure()
+                    if failures < settings.PAYMENT_WEBHOOK_MAX_FAILURES:
+                        logger.warning(f"Payment callback batch failed ({failures}), retrying: {e}")
+                        raise self.retry(exc=e, countdown=settings.PAYMENT_WEBHOOK_LINGER * 2 ** failures)
+                    logger.error(f"Payment callback batch failed {failures} times, applying one by one: {e}")
+                    summary = _apply_one_by_one(queue, callbacks)
+                for key in totals:
+                    totals[key] += summary[key]
+            queue.ack(count)
+            queue.clear_failures()
+    finally:
+        cache.release_lock(CacheKeys.payment_callback_queue(), token)
+    return totals
+
+def _apply_one_by_one(queue, callbacks: list) -> dict:
+    """Apply each callback in its own transaction; dead-letter the failures"""
+    totals = {"received": 0, "completed": 0, "failed": 0, "ignored": 0}
+    dead = []
+    for callback in callbacks:
+        try:
+            with get_db_context() as db:
+                summary = PaymentService(db).apply_callbacks([callback])
+        except Exception as e:
+            logger.error(f"Dead-lettering payment callback {callback.get('transaction_id')}: {e}")
+            dead.append(callback)
+            continue
+        for key in totals:
+            totals[key] += summary[key]
+    queue.dead_letter(dead)
+    return totals
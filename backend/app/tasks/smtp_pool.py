@@ -0,0 +1,147 @@
+# backend/app/tasks/smtp_pool.py
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterator, Optional, Tuple
+from celery.signals import worker_process_init, worker_process_shutdown
+from app.config import settings
+import smtplib
+import ssl
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class SMTPConnectionPool:
+    """Per-process pool of logged-in SMTP sessions.
+
+    Connecting, STARTTLS and AUTH happen once per session instead of once
+    per email. Sessions idle for longer than ``max_idle`` are health-checked
+    with NOOP before reuse; a session that errors is discarded rather than
+    returned. Set SMTP_STARTTLS=False and leave SMTP_USER unset to run
+    against a plain local stand-in server.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = True,
+        timeout: float = 30,
+        max_size: int = 2,
+        max_idle: float = 60
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self._idle: Deque[Tuple[smtplib.SMTP, float]] = deque()
+        self._lock = threading.Lock()
+        self._metrics = {"opened": 0, "reused": 0, "discarded": 0}
+
+    def acquire(self) -> smtplib.SMTP:
+        """Take a healthy session from the pool, or open a new one"""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, last_used = self._idle.pop()
+            if time.monotonic() - last_used < self.max_idle or self._is_alive(conn):
+                self._metrics["reused"] += 1
+                return conn
+            self._close(conn)
+        return self._connect()
+
+    def release(self, conn: smtplib.SMTP, broken: bool = False) -> None:
+        """Return a session; broken sessions and overflow are closed"""
+        if not broken:
+            with self._lock:
+                if len(self._idle) < self.max_size:
+                    self._idle.append((conn, time.monotonic()))
+                    return
+        self._close(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        conn = self.acquire()
+        try:
+            yield conn
+        except Exception:
+            self.release(conn, broken=True)
+            raise
+        else:
+            self.release(conn)
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for conn, _ in idle:
+            self._close(conn)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._metrics, "idle": len(self._idle), "max_size": self.max_size}
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            conn.ehlo()
+            if self.starttls:
+                conn.starttls(context=ssl.create_default_context())
+                conn.ehlo()
+            if self.user:
+                conn.login(self.user, self.password or "")
+        except Exception:
+            self._close(conn)
+            raise
+        self._metrics["opened"] += 1
+        return conn
+
+    @staticmethod
+    def _is_alive(conn: smtplib.SMTP) -> bool:
+        try:
+            return conn.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _close(self, conn: smtplib.SMTP) -> None:
+        self._metrics["discarded"] += 1
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            conn.close()
+
+# Per-process pool; SMTP sockets must never be shared across a fork
+smtp_pool: Optional[SMTPConnectionPool] = None
+
+def get_smtp_pool() -> SMTPConnectionPool:
+    """Get this worker process's SMTP pool"""
+    global smtp_pool
+    if smtp_pool is None:
+        smtp_pool = SMTPConnectionPool(
+            host=settings.SMTP_SERVER,
+            port=settings.SMTP_PORT,
+            user=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            starttls=settings.SMTP_STARTTLS,
+            timeout=settings.SMTP_TIMEOUT,
+            max_size=settings.SMTP_POOL_SIZE,
+            max_idle=settings.SMTP_POOL_MAX_IDLE
+        )
+    return smtp_pool
+
+@worker_process_init.connect
+def _reset_pool_after_fork(**kwargs) -> None:
+    global smtp_pool
+    smtp_pool = None
+
+@worker_process_shutdown.connect
+def _close_pool(**kwargs) -> None:
+    if smtp_pool is not None:
+        smtp_pool.close_all()
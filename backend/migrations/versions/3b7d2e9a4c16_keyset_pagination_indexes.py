@@ -0,0 +1,34 @@
+"""keyset pagination indexes
+
+Revision ID: 3b7d2e9a4c16
+Revises: 5f05c451e48b
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d2e9a4c16'
+down_revision: Union[str, None] = '5f05c451e48b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_ticket_resident_created', 'tickets', ['resident_id', 'created_at', 'id'], unique=False)
+    op.create_index('idx_ticket_status_created', 'tickets', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('idx_resident_status_created', 'residents', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('idx_user_active_created', 'users', ['is_active', 'created_at', 'id'], unique=False)
+    op.create_index('idx_visitor_flat_created', 'visitor_logs', ['flat_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_visitor_flat_created', table_name='visitor_logs')
+    op.drop_index('idx_user_active_created', table_name='users')
+    op.drop_index('idx_resident_status_created', table_name='residents')
+    op.drop_index('idx_ticket_status_created', table_name='tickets')
+    op.drop_index('idx_ticket_resident_created', table_name='tickets')
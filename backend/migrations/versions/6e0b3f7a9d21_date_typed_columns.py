@@ -0,0 +1,115 @@
+"""date typed columns
+
+Revision ID: 6e0b3f7a9d21
+Revises: d2a9c6e41f83
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e0b3f7a9d21'
+down_revision: Union[str, None] = 'd2a9c6e41f83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Backfill expressions: parse what the old string columns held (ISO dates,
+# or MM-YYYY for month_year) and fall back for anything unparseable. The
+# regexes only pick the format; the casts go through pg_temp.safe_* so an
+# out-of-range value ("2024-02-30", "13-2024") becomes NULL instead of
+# aborting the migration.
+SAFE_CASTS = """
+CREATE FUNCTION pg_temp.safe_date(value text) RETURNS date LANGUAGE plpgsql AS $$
+BEGIN
+    RETURN value::date;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END $$;
+CREATE FUNCTION pg_temp.safe_timestamptz(value text) RETURNS timestamptz LANGUAGE plpgsql AS $$
+BEGIN
+    RETURN value::timestamptz;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END $$;
+"""
+ISO_DATE = "CASE WHEN {col} ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}' THEN pg_temp.safe_date(substr({col}, 1, 10)) END"
+ISO_TIMESTAMP = "CASE WHEN {col} ~ '^\\d{{4}}-\\d{{2}}-\\d{{2}}' THEN pg_temp.safe_timestamptz({col}) END"
+MONTH_YEAR = (
+    "COALESCE("
+    "CASE WHEN month_year ~ '^\\d{2}-\\d{4}$' "
+    "THEN pg_temp.safe_date(right(month_year, 4) || '-' || left(month_year, 2) || '-01') "
+    "WHEN month_year ~ '^\\d{4}-\\d{2}' THEN pg_temp.safe_date(substr(month_year, 1, 7) || '-01') END, "
+    "date_trunc('month', created_at)::date)"
+)
+
+
+def _check_month_conflicts() -> None:
+    """Fail with the offending fees if two rows map to one flat and month.
+
+    "03-2024" and "2024-03" (or an unparseable value falling back to the
+    creation month) normalize to the same date, which uq_fee_flat_month
+    would reject half-way through the ALTER. Which duplicate to keep is a
+    billing decision, so they are reported rather than deleted.
+    """
+    conflicts = op.get_bind().execute(sa.text(
+        "SELECT flat_id, month, array_agg(id::text || '=' || month_year ORDER BY created_at) "
+        f"FROM (SELECT id, flat_id, month_year, created_at, {MONTH_YEAR} AS month "
+        "FROM monthly_fees) fees GROUP BY flat_id, month HAVING count(*) > 1 LIMIT 50"
+    )).all()
+    if conflicts:
+        details = "\n".join(
+            f"  flat {flat_id} {month:%Y-%m}: {', '.join(fees)}" for flat_id, month, fees in conflicts
+        )
+        raise RuntimeError(
+            "monthly_fees has several fees per flat and month once month_year is "
+            f"normalized; merge or delete them and re-run:\n{details}"
+        )
+
+
+def upgrade() -> None:
+    op.execute(SAFE_CASTS)
+    _check_month_conflicts()
+    op.alter_column('monthly_fees', 'month_year', type_=sa.Date(), existing_nullable=False,
+                    postgresql_using=MONTH_YEAR)
+    op.alter_column('monthly_fees', 'due_date', type_=sa.Date(), existing_nullable=False,
+                    postgresql_using=f"COALESCE({ISO_DATE.format(col='due_date')}, created_at::date)")
+    op.alter_column('payments', 'payment_date', type_=sa.DateTime(timezone=True), existing_nullable=False,
+                    postgresql_using=f"COALESCE({ISO_TIMESTAMP.format(col='payment_date')}, created_at)")
+    op.alter_column('notices', 'published_date', type_=sa.DateTime(timezone=True), existing_nullable=True,
+                    postgresql_using=ISO_TIMESTAMP.format(col='published_date'))
+    op.alter_column('notices', 'expiry_date', type_=sa.DateTime(timezone=True), existing_nullable=True,
+                    postgresql_using=ISO_TIMESTAMP.format(col='expiry_date'))
+    op.alter_column('residents', 'move_in_date', type_=sa.Date(), existing_nullable=True,
+                    postgresql_using=ISO_DATE.format(col='move_in_date'))
+
+    op.create_index('idx_fee_status_due', 'monthly_fees', ['status', 'due_date'], unique=False)
+    op.create_index('idx_payment_resident_date', 'payments', ['resident_id', 'payment_date'], unique=False)
+    op.create_index('idx_payment_status_date', 'payments', ['status', 'payment_date'], unique=False)
+    op.create_index('idx_notice_status_published', 'notices', ['status', 'published_date'], unique=False)
+    op.create_index('idx_notice_status_expiry', 'notices', ['status', 'expiry_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notice_status_expiry', table_name='notices')
+    op.drop_index('idx_notice_status_published', table_name='notices')
+    op.drop_index('idx_payment_status_date', table_name='payments')
+    op.drop_index('idx_payment_resident_date', table_name='payments')
+    op.drop_index('idx_fee_status_due', table_name='monthly_fees')
+
+    op.alter_column('residents', 'move_in_date', type_=sa.String(length=50), existing_nullable=True,
+                    postgresql_using="move_in_date::text")
+    op.alter_column('notices', 'expiry_date', type_=sa.String(length=50), existing_nullable=True,
+                    postgresql_using="expiry_date::text")
+    op.alter_column('notices', 'published_date', type_=sa.String(length=50), existing_nullable=True,
+                    postgresql_using="published_date::text")
+    op.alter_column('payments', 'payment_date', type_=sa.String(length=50), existing_nullable=False,
+                    postgresql_using="payment_date::text")
+    op.alter_column('monthly_fees', 'due_date', type_=sa.String(length=50), existing_nullable=False,
+                    postgresql_using="due_date::text")
+    op.alter_column('monthly_fees', 'month_year', type_=sa.String(length=10), existing_nullable=False,
+                    postgresql_using="to_char(month_year, 'MM-YYYY')")
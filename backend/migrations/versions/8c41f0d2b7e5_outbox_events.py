@@ -0,0 +1,41 @@
+"""outbox events
+
+Revision ID: 8c41f0d2b7e5
+Revises: 3b7d2e9a4c16
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41f0d2b7e5'
+down_revision: Union[str, None] = '3b7d2e9a4c16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox_events',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('event_type', sa.String(length=100), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_outbox_pending', 'outbox_events', ['created_at', 'id'], unique=False, postgresql_where=sa.text('published_at IS NULL'))
+    op.create_index('idx_outbox_published_at', 'outbox_events', ['published_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_outbox_published_at', table_name='outbox_events')
+    op.drop_index('idx_outbox_pending', table_name='outbox_events', postgresql_where=sa.text('published_at IS NULL'))
+    op.drop_table('outbox_events')
@@ -0,0 +1,79 @@
+"""ledger and flat balances
+
+Revision ID: a7c3e5f19b42
+Revises: 6e0b3f7a9d21
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5f19b42'
+down_revision: Union[str, None] = '6e0b3f7a9d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+entry_type = postgresql.ENUM('FEE', 'PENALTY', 'PAYMENT', 'ADJUSTMENT', name='ledgerentrytype', create_type=False)
+account = postgresql.ENUM(
+    'RECEIVABLE', 'FEE_INCOME', 'PENALTY_INCOME', 'CASH', 'ADJUSTMENTS', name='ledgeraccount', create_type=False
+)
+
+
+def upgrade() -> None:
+    # Both account columns share one type, so create it up front
+    entry_type.create(op.get_bind(), checkfirst=True)
+    account.create(op.get_bind(), checkfirst=True)
+
+    op.create_table('ledger_entries',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('flat_id', sa.UUID(), nullable=False),
+    sa.Column('entry_type', entry_type, nullable=False),
+    sa.Column('debit_account', account, nullable=False),
+    sa.Column('credit_account', account, nullable=False),
+    sa.Column('amount', sa.Integer(), nullable=False),
+    sa.Column('fee_id', sa.UUID(), nullable=True),
+    sa.Column('payment_id', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.CheckConstraint('amount > 0', name='ck_ledger_amount_positive'),
+    sa.CheckConstraint('debit_account <> credit_account', name='ck_ledger_distinct_accounts'),
+    sa.ForeignKeyConstraint(['fee_id'], ['monthly_fees.id'], ),
+    sa.ForeignKeyConstraint(['flat_id'], ['flats.id'], ),
+    sa.ForeignKeyConstraint(['payment_id'], ['payments.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_ledger_flat_created', 'ledger_entries', ['flat_id', 'created_at'], unique=False)
+    op.create_index('idx_ledger_fee', 'ledger_entries', ['fee_id'], unique=False)
+    op.create_index('uq_ledger_fee_posting', 'ledger_entries', ['fee_id'], unique=True, postgresql_where=sa.text("entry_type = 'FEE'"))
+    op.create_index('uq_ledger_payment_posting', 'ledger_entries', ['payment_id'], unique=True, postgresql_where=sa.text("entry_type = 'PAYMENT'"))
+
+    op.create_table('flat_balances',
+    sa.Column('flat_id', sa.UUID(), nullable=False),
+    sa.Column('balance', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('total_billed', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('total_paid', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_posted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['flat_id'], ['flats.id'], ),
+    sa.PrimaryKeyConstraint('flat_id')
+    )
+    op.create_index('idx_flat_balance_outstanding', 'flat_balances', ['balance', 'flat_id'], unique=False, postgresql_where=sa.text('balance > 0'))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_flat_balance_outstanding', table_name='flat_balances', postgresql_where=sa.text('balance > 0'))
+    op.drop_table('flat_balances')
+    op.drop_index('uq_ledger_payment_posting', table_name='ledger_entries', postgresql_where=sa.text("entry_type = 'PAYMENT'"))
+    op.drop_index('uq_ledger_fee_posting', table_name='ledger_entries', postgresql_where=sa.text("entry_type = 'FEE'"))
+    op.drop_index('idx_ledger_fee', table_name='ledger_entries')
+    op.drop_index('idx_ledger_flat_created', table_name='ledger_entries')
+    op.drop_table('ledger_entries')
+    account.drop(op.get_bind(), checkfirst=True)
+    entry_type.drop(op.get_bind(), checkfirst=True)
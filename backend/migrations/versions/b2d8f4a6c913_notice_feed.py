@@ -0,0 +1,37 @@
+"""notice feed: building section and feed versions
+
+Revision ID: b2d8f4a6c913
+Revises: f3a9c6e2b817
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d8f4a6c913'
+down_revision: Union[str, None] = 'f3a9c6e2b817'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence('notice_feed_version_seq')))
+    op.add_column('notices', sa.Column('building_section', sa.String(length=50), nullable=True))
+    op.add_column('notices', sa.Column('feed_version', sa.BigInteger(), nullable=True))
+    # Notices already on the board get a version so deltas can refer to them
+    op.execute(
+        "UPDATE notices SET feed_version = nextval('notice_feed_version_seq') "
+        "WHERE status <> 'DRAFT'"
+    )
+    op.create_index('idx_notice_feed_version', 'notices', ['feed_version'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notice_feed_version', table_name='notices')
+    op.drop_column('notices', 'feed_version')
+    op.drop_column('notices', 'building_section')
+    op.execute(sa.schema.DropSequence(sa.Sequence('notice_feed_version_seq')))
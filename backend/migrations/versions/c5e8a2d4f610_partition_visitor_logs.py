@@ -0,0 +1,110 @@
+"""partition visitor_logs by month
+
+Revision ID: c5e8a2d4f610
+Revises: a7c3e5f19b42
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8a2d4f610'
+down_revision: Union[str, None] = 'a7c3e5f19b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = [
+    ('id', sa.UUID(), False),
+    ('flat_id', sa.UUID(), False),
+    ('security_id', sa.UUID(), False),
+    ('visitor_name', sa.String(length=255), False),
+    ('visitor_phone', sa.String(length=20), False),
+    ('visitor_id_proof', sa.String(length=50), True),
+    ('purpose', sa.String(length=255), False),
+    ('entry_time', sa.DateTime(), False),
+    ('exit_time', sa.DateTime(), True),
+    ('vehicle_number', sa.String(length=20), True),
+    ('notes', sa.Text(), True),
+]
+
+OLD_INDEXES = [
+    'idx_visitor_entry_exit', 'idx_visitor_flat', 'idx_visitor_flat_created',
+    'ix_visitor_logs_entry_time', 'ix_visitor_logs_flat_id',
+]
+
+# One partition per month from the oldest row through three months ahead;
+# the partition maintenance task keeps creating them from then on
+CREATE_PARTITIONS = """
+DO $$
+DECLARE m date;
+BEGIN
+    FOR m IN
+        SELECT generate_series(
+            date_trunc('month', LEAST(COALESCE((SELECT min(entry_time) FROM visitor_logs_unpartitioned), now()), now())),
+            date_trunc('month', GREATEST(COALESCE((SELECT max(entry_time) FROM visitor_logs_unpartitioned), now()), now()))
+                + interval '3 months',
+            interval '1 month'
+        )::date
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF visitor_logs FOR VALUES FROM (%L) TO (%L)',
+            'visitor_logs_y' || to_char(m, 'YYYY') || 'm' || to_char(m, 'MM'),
+            m, (m + interval '1 month')::date
+        );
+    END LOOP;
+END $$;
+"""
+
+
+def _columns():
+    return [sa.Column(name, type_, nullable=nullable) for name, type_, nullable in COLUMNS] + [
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['flat_id'], ['flats.id'], ),
+        sa.ForeignKeyConstraint(['security_id'], ['users.id'], ),
+    ]
+
+
+def upgrade() -> None:
+    op.rename_table('visitor_logs', 'visitor_logs_unpartitioned')
+    op.execute('ALTER TABLE visitor_logs_unpartitioned RENAME CONSTRAINT visitor_logs_pkey TO visitor_logs_unpartitioned_pkey')
+    for name in OLD_INDEXES:
+        op.drop_index(name, table_name='visitor_logs_unpartitioned')
+
+    op.create_table('visitor_logs',
+    *_columns(),
+    sa.PrimaryKeyConstraint('id', 'entry_time'),
+    postgresql_partition_by='RANGE (entry_time)'
+    )
+    op.create_index('idx_visitor_entry_exit', 'visitor_logs', ['entry_time', 'exit_time'], unique=False)
+    op.create_index('idx_visitor_flat_created', 'visitor_logs', ['flat_id', 'created_at', 'id'], unique=False)
+    op.execute(CREATE_PARTITIONS)
+
+    op.execute('INSERT INTO visitor_logs SELECT * FROM visitor_logs_unpartitioned')
+    op.drop_table('visitor_logs_unpartitioned')
+
+
+def downgrade() -> None:
+    # Archived (dropped) partitions are not restored
+    op.rename_table('visitor_logs', 'visitor_logs_partitioned')
+    op.drop_index('idx_visitor_flat_created', table_name='visitor_logs_partitioned')
+    op.drop_index('idx_visitor_entry_exit', table_name='visitor_logs_partitioned')
+    op.execute('ALTER TABLE visitor_logs_partitioned RENAME CONSTRAINT visitor_logs_pkey TO visitor_logs_partitioned_pkey')
+
+    op.create_table('visitor_logs',
+    *_columns(),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_visitor_entry_exit', 'visitor_logs', ['entry_time', 'exit_time'], unique=False)
+    op.create_index('idx_visitor_flat', 'visitor_logs', ['flat_id'], unique=False)
+    op.create_index('idx_visitor_flat_created', 'visitor_logs', ['flat_id', 'created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_visitor_logs_entry_time'), 'visitor_logs', ['entry_time'], unique=False)
+    op.create_index(op.f('ix_visitor_logs_flat_id'), 'visitor_logs', ['flat_id'], unique=False)
+
+    op.execute('INSERT INTO visitor_logs SELECT * FROM visitor_logs_partitioned')
+    op.drop_table('visitor_logs_partitioned')
@@ -0,0 +1,32 @@
+"""outbox: park events that keep failing
+
+Revision ID: c7e1f5a3b924
+Revises: b2d8f4a6c913
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e1f5a3b924'
+down_revision: Union[str, None] = 'b2d8f4a6c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('outbox_events', sa.Column('failed_at', sa.DateTime(timezone=True), nullable=True))
+    op.drop_index('idx_outbox_pending', table_name='outbox_events', postgresql_where=sa.text('published_at IS NULL'))
+    op.create_index('idx_outbox_pending', 'outbox_events', ['created_at', 'id'], unique=False, postgresql_where=sa.text('published_at IS NULL AND failed_at IS NULL'))
+    op.create_index('idx_outbox_failed_at', 'outbox_events', ['failed_at'], unique=False, postgresql_where=sa.text('failed_at IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_outbox_failed_at', table_name='outbox_events', postgresql_where=sa.text('failed_at IS NOT NULL'))
+    op.drop_index('idx_outbox_pending', table_name='outbox_events', postgresql_where=sa.text('published_at IS NULL AND failed_at IS NULL'))
+    op.create_index('idx_outbox_pending', 'outbox_events', ['created_at', 'id'], unique=False, postgresql_where=sa.text('published_at IS NULL'))
+    op.drop_column('outbox_events', 'failed_at')
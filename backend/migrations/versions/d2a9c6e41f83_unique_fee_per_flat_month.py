@@ -0,0 +1,26 @@
+"""unique fee per flat and month
+
+Revision ID: d2a9c6e41f83
+Revises: 8c41f0d2b7e5
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a9c6e41f83'
+down_revision: Union[str, None] = '8c41f0d2b7e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint('uq_fee_flat_month', 'monthly_fees', ['flat_id', 'month_year'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_fee_flat_month', 'monthly_fees', type_='unique')
@@ -0,0 +1,28 @@
+"""visitor pass code
+
+Revision ID: e1b4d7c9a352
+Revises: c5e8a2d4f610
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b4d7c9a352'
+down_revision: Union[str, None] = 'c5e8a2d4f610'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('visitor_logs', sa.Column('pass_code', sa.String(length=8), nullable=True))
+    op.create_index('idx_visitor_open_pass', 'visitor_logs', ['pass_code'], unique=False, postgresql_where=sa.text('exit_time IS NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_visitor_open_pass', table_name='visitor_logs', postgresql_where=sa.text('exit_time IS NULL'))
+    op.drop_column('visitor_logs', 'pass_code')
@@ -0,0 +1,68 @@
+"""full-text and trigram search
+
+Revision ID: f3a9c6e2b817
+Revises: e1b4d7c9a352
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c6e2b817'
+down_revision: Union[str, None] = 'e1b4d7c9a352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTORS = {
+    'tickets': (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+    ),
+    'notices': (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+    ),
+    'visitor_logs': (
+        "setweight(to_tsvector('simple', coalesce(visitor_name, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(purpose, '')), 'B')"
+    ),
+}
+
+SEARCH_INDEXES = {
+    'tickets': 'idx_ticket_search',
+    'notices': 'idx_notice_search',
+    'visitor_logs': 'idx_visitor_search',
+}
+
+TRIGRAM_INDEXES = {
+    'idx_visitor_phone_trgm': 'visitor_phone',
+    'idx_visitor_vehicle_trgm': 'vehicle_number',
+}
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # Adding a stored generated column rewrites each table once
+    for table, expression in SEARCH_VECTORS.items():
+        op.add_column(table, sa.Column(
+            'search_vector', postgresql.TSVECTOR(),
+            sa.Computed(expression, persisted=True), nullable=True
+        ))
+        op.create_index(SEARCH_INDEXES[table], table, ['search_vector'], unique=False, postgresql_using='gin')
+    for name, column in TRIGRAM_INDEXES.items():
+        op.create_index(name, 'visitor_logs', [column], unique=False, postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    for name in TRIGRAM_INDEXES:
+        op.drop_index(name, table_name='visitor_logs')
+    for table in SEARCH_VECTORS:
+        op.drop_index(SEARCH_INDEXES[table], table_name=table)
+        op.drop_column(table, 'search_vector')
+    # pg_trgm is left installed; other objects may depend on it